@@ -4,7 +4,7 @@ import numpy as np
 from dotenv import load_dotenv
 from fastapi import FastAPI, Header, HTTPException
 from pydantic import BaseModel
-from API.predict import predict_delay
+from API.predict import list_available_models, predict_delay
 
 # Nome do modelo treinado a ser utilizado (sem extensão)
 model_name = "flight_delay_LGBMClassifier_20260113_194452"
@@ -49,16 +49,51 @@ def predict(data: PredictRequest, authorization: str = Header(None)):
     --------
     HTTPException
         - Retornada com status 401 quando o token de autenticação é inexistente ou inválido.
+        - Retornada com status 422 quando a entrada não pode ser transformada
+        nas features do modelo (ver `API.predict.transform_input`).
     """
     if authorization != API_TOKEN:
         raise HTTPException(status_code=401, detail="Unauthorized")
 
     # Load your trained model and run inference
-    result = predict_delay(model_name, dict(data))
+    try:
+        result = predict_delay(model_name, dict(data))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
     previsao = result["previsao"]
     probabilidade = round(np.float64(result["probabilidade"]), 2)
 
     return PredictResponse(
         previsao=previsao,
         probabilidade=probabilidade # type: ignore
-    )
\ No newline at end of file
+    )
+
+@app.get("/models")
+def models(authorization: str = Header(None)):
+    """
+    Endpoint da API que lista os modelos disponíveis a partir dos seus
+    metadados, sem carregá-los.
+
+    Parâmetros
+    ----------
+    authorization : str, com valor padrão None
+        - Token de autenticação enviado no header da requisição.
+
+    Retorna
+    -------
+    dict
+        - Nome do modelo em uso ("modelo_ativo") e o resumo dos metadados de
+        cada modelo exportado ("modelos").
+
+    Exceções
+    --------
+    HTTPException
+        - Retornada com status 401 quando o token de autenticação é inexistente ou inválido.
+    """
+    if authorization != API_TOKEN:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    return {
+        "modelo_ativo": model_name,
+        "modelos": list_available_models()
+    }
\ No newline at end of file
@@ -1,12 +1,37 @@
 import os
-import pickle
 import automlx
 import pandas as pd
 from helpers.parsers import parse_categoricals, parse_datetime, parse_int
+from helpers.categories import categories_path, load_categories
+from helpers.calendar_features import CALENDAR_COLUMNS, add_calendar_features
+from helpers.model_artifacts import load_model, model_artifact_path
+from helpers.model_metadata import artifact_matches_metadata, list_models, load_model_metadata, model_metadata_path
+from helpers.delay_rates import DelayRateTables, add_delay_rate_features, delay_rates_path, load_delay_rates
+
+def models_path() -> str:
+    """
+    Caminho absoluto do diretório ./models.
+    """
+    models_dir = os.path.join(os.path.dirname(__file__), "..", "models")
+    return os.path.abspath(models_dir)
+
+def expected_features(
+    estimator: automlx._interface.classifier.AutoClassifier | None,  # type: ignore
+    metadata: dict | None = None
+) -> list:
+    """
+    Features esperadas pelo modelo, lidas dos metadados (ver
+    `helpers.model_metadata`) quando disponíveis, sem acessar o modelo.
+    """
+    if metadata is not None:
+        return metadata["features_raw"]
+    return list(estimator.selected_features_names_raw_)
 
 def validate_features(
     feature_mapping: dict,
-    estimator: automlx._interface.classifier.AutoClassifier  # type: ignore
+    estimator: automlx._interface.classifier.AutoClassifier | None,  # type: ignore
+    derived_features: list | None = None,
+    metadata: dict | None = None
 ) -> None:
     """
     Valida a compatibilidade das features usadas na inferência com as
@@ -16,8 +41,16 @@ def validate_features(
     ----------
     feature_mapping : dict
         - Mapeamento entre nomes de entrada e nomes de features do modelo.
-    estimator : automlx._interface.classifier.AutoClassifier
-        - Modelo treinado contendo a lista de features esperadas.
+    estimator : automlx._interface.classifier.AutoClassifier | None
+        - Modelo treinado contendo a lista de features esperadas. Pode ser
+        None quando `metadata` é informado.
+    derived_features : list, opcional
+        - Features calculadas a partir da entrada (ex.: calendário e taxas de
+        atraso, ver `helpers.calendar_features` e `helpers.delay_rates`),
+        somadas às do mapeamento.
+    metadata : dict, opcional
+        - Metadados do modelo. Se informados, as features esperadas são lidas
+        deles, sem acessar o modelo.
 
     Retorna
     -------
@@ -29,8 +62,8 @@ def validate_features(
         - Lançada quando as features do mapeamento não coincidem com as
         features esperadas pelo modelo.
     """
-    expected = set(estimator.selected_features_names_raw_)
-    provided = set(feature_mapping.values())
+    expected = set(expected_features(estimator, metadata))
+    provided = set(feature_mapping.values()) | set(derived_features or [])
 
     if expected != provided:
         raise ValueError(
@@ -41,18 +74,38 @@ def validate_features(
 
 def transform_input(
     input_data: dict,
-    estimator: automlx._interface.classifier.AutoClassifier  # type: ignore
+    estimator: automlx._interface.classifier.AutoClassifier | None,  # type: ignore
+    categories: dict | None = None,
+    delay_rates: DelayRateTables | None = None,
+    metadata: dict | None = None
 ) -> pd.DataFrame:
     """
     Transforma os dados de entrada em um DataFrame compatível com o modelo
     treinado para inferência.
 
+    As features de calendário esperadas pelo modelo (ver
+    `helpers.calendar_features`) são calculadas a partir de "data_partida"
+    pela mesma função usada no ETL.
+
     Parâmetros
     ----------
     input_data : dict
         - Dados brutos de entrada para predição.
-    estimator : automlx._interface.classifier.AutoClassifier
-        - Modelo treinado usado para validar as features esperadas.
+    estimator : automlx._interface.classifier.AutoClassifier | None
+        - Modelo treinado usado para validar as features esperadas. Pode ser
+        None quando `metadata` é informado.
+    categories : dict, opcional
+        - Dicionários categóricos salvos junto ao modelo (ver
+        `helpers.categories`). Se informados, as colunas categóricas recebem
+        os mesmos tipos usados no treino, e uma companhia ou aeródromo fora
+        dos dicionários (ex.: uma rota nova) vira nulo, como no treino; caso
+        contrário, as categorias são inferidas da própria entrada.
+    delay_rates : DelayRateTables, opcional
+        - Tabelas de taxa de atraso salvas junto ao modelo. Se informadas, as
+        features de taxa de atraso são consultadas para o voo, como no treino.
+    metadata : dict, opcional
+        - Metadados do modelo (ver `helpers.model_metadata`), usados no lugar
+        do modelo para obter as features esperadas.
 
     Retorna
     -------
@@ -73,7 +126,11 @@ def transform_input(
         "data_partida": "Data Hora Voo",
     }
 
-    validate_features(feature_mapping=FEATURE_MAPPING, estimator=estimator)
+    # Features de calendário com as quais o modelo foi treinado
+    model_features = expected_features(estimator, metadata)
+    calendar_columns = [col for col in CALENDAR_COLUMNS if col in model_features]
+    derived_features = calendar_columns + (delay_rates.feature_names if delay_rates is not None else [])
+    validate_features(feature_mapping=FEATURE_MAPPING, estimator=estimator, derived_features=derived_features, metadata=metadata)
 
     df = pd.DataFrame()
     idx = 0
@@ -85,10 +142,15 @@ def transform_input(
         value = input_data[input_key]
         df.loc[idx, model_feature] = value
 
-    df = parse_categoricals(df)
+    df = parse_categoricals(df, categories)
     df = parse_datetime(df)
     df = parse_int(df, col="Distância (m)", int_type="int32")
 
+    if calendar_columns:
+        df = add_calendar_features(df, columns=calendar_columns)
+    if delay_rates is not None:
+        df = add_delay_rate_features(df, delay_rates)
+
     return df
 
 def predict_delay(model_filename: str, input_data: dict) -> dict:
@@ -96,10 +158,16 @@ def predict_delay(model_filename: str, input_data: dict) -> dict:
     Realiza a predição de atraso de voo a partir de um modelo treinado e
     dados de entrada fornecidos.
 
+    Quando o modelo tem sidecar de metadados (ver `helpers.model_metadata`)
+    que descreve o artefato em disco, a entrada é validada e transformada
+    antes de o modelo ser carregado. Caso contrário, as features esperadas
+    são lidas do próprio modelo.
+
     Parâmetros
     ----------
     model_filename : str
-        - Nome do arquivo do modelo (sem extensão .pkl).
+        - Nome do arquivo do modelo (sem extensão), salvo em .pkl ou .joblib
+        (ver `helpers.model_artifacts.model_artifact_path`).
     input_data : dict
         - Dados de entrada utilizados na inferência.
 
@@ -109,12 +177,21 @@ def predict_delay(model_filename: str, input_data: dict) -> dict:
         - Dicionário contendo a previsão do modelo e a probabilidade
         associada ao atraso.
     """
-    models_dir = os.path.join(os.path.dirname(__file__), "..", "models")
-    models_dir = os.path.abspath(models_dir)
-    model_path = f'{models_dir}/{model_filename}.pkl'
-
-    model = pickle.load(open(model_path, 'rb'))
-    x = transform_input(input_data, model)
+    model_path = model_artifact_path(f'{models_path()}/{model_filename}')
+
+    # Metadados só são usados se descreverem o artefato que será carregado
+    metadata = load_model_metadata(model_metadata_path(model_path))
+    if metadata is not None and not artifact_matches_metadata(metadata, model_path):
+        metadata = None
+    categories = load_categories(categories_path(model_path))
+    if categories is None and metadata is not None:
+        categories = metadata.get("categories")
+    delay_rates = load_delay_rates(delay_rates_path(model_path))
+
+    model = load_model(model_path) if metadata is None else None
+    x = transform_input(input_data, model, categories, delay_rates, metadata)
+    if model is None:
+        model = load_model(model_path)
 
     pred = model.predict(x)
     proba = model.predict_proba(x)
@@ -124,4 +201,17 @@ def predict_delay(model_filename: str, input_data: dict) -> dict:
         "probabilidade": proba[0][1]
     }
 
-    return predictions
\ No newline at end of file
+    return predictions
+
+def list_available_models() -> list[dict]:
+    """
+    Lista os modelos de ./models a partir dos sidecars de metadados, sem
+    carregá-los (ver `helpers.model_metadata.list_models`).
+
+    Retorna
+    -------
+    list[dict]
+        - Resumo de cada modelo: nome, tipo, features esperadas, tempo de
+        treinamento, métrica, hash e tamanho do artefato.
+    """
+    return list_models(models_path())
\ No newline at end of file
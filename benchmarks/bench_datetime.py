@@ -0,0 +1,70 @@
+"""
+Benchmark da conversão de datas do VRA: interpretação genérica
+(`pd.to_datetime(format="mixed", dayfirst=True)`) versus `to_datetime_fast`
+(formato detectado por amostra + cache de valores distintos).
+
+Gera a coluna "Partida Prevista" de um mês sintético completo em cada um dos
+layouts encontrados nos arquivos do VRA e confere que os dois resultados são
+idênticos.
+
+Uso:
+    python -m benchmarks.bench_datetime --linhas 90000 --repeticoes 5
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from helpers.parsers import to_datetime_fast
+
+def synthetic_month(n_rows: int, fmt: str, seed: int = 0) -> pd.Series:
+    """
+    Horários previstos de um mês, em múltiplos de 5 minutos (como nos voos
+    regulares), formatados como texto.
+    """
+    rng = np.random.default_rng(seed)
+    prevista = pd.Timestamp(2024, 3, 1) + pd.to_timedelta(rng.integers(0, 31 * 24 * 12, n_rows) * 5, unit="m")
+    values = pd.Series(prevista.strftime(fmt))
+    values[rng.random(n_rows) < 0.01] = None
+    return values
+
+def best_time(func, values: pd.Series, repeats: int) -> tuple[float, pd.Series]:
+    """
+    Menor tempo, em segundos, entre `repeats` execuções.
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func(values)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--linhas", type=int, default=90_000, help="linhas do mês sintético")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    def mixed(values: pd.Series) -> pd.Series:
+        return pd.to_datetime(values, format="mixed", dayfirst=True, errors="coerce")
+
+    print(f"{args.linhas} linhas, melhor de {args.repeticoes} execuções\n")
+    for fmt in ["%Y-%m-%d %H:%M:%S", "%d/%m/%Y %H:%M"]:
+        values = synthetic_month(args.linhas, fmt)
+        t_mixed, expected = best_time(mixed, values, args.repeticoes)
+        t_fast, result = best_time(to_datetime_fast, values, args.repeticoes)
+        pd.testing.assert_series_equal(result, expected)
+
+        print(
+            f"{fmt:<20} mixed: {t_mixed * 1000:8.1f} ms   "
+            f"fast: {t_fast * 1000:8.1f} ms   "
+            f"({t_mixed / t_fast:.1f}x)"
+        )
+
+if __name__ == "__main__":
+    main()
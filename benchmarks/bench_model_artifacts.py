@@ -0,0 +1,119 @@
+"""
+Benchmark de carga dos modelos de ./models/experimental_models nos formatos
+de artefato de `helpers.model_artifacts`: pickle (.pkl), joblib sem
+compressão aberto como memory map, joblib sem compressão lido inteiro e
+joblib comprimido (zlib, nível 3).
+
+Cada modelo é convertido para os formatos joblib em um diretório temporário,
+e cada carga roda em um processo separado, medindo o tempo de carga, o
+aumento da memória residente (RSS) causado pela carga e o tamanho do
+artefato. Requer o AutoMLx instalado (os modelos são objetos do AutoMLx).
+
+Uso:
+    python -m benchmarks.bench_model_artifacts
+    python -m benchmarks.bench_model_artifacts --dir models --repeticoes 5
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from helpers.memory import peak_rss_mb, rss_mb
+from helpers.model_artifacts import import_model_dependencies, load_model, save_model
+
+# (nome, formato do artefato, compressão, carga com memory map)
+FORMATS = [
+    ("pickle", "pickle", 0, False),
+    ("joblib mmap", "joblib", 0, True),
+    ("joblib", "joblib", 0, False),
+    ("joblib zlib-3", "joblib", 3, False),
+]
+
+def is_lfs_pointer(path: str) -> bool:
+    """
+    Indica se o arquivo é um ponteiro do Git LFS (conteúdo não baixado).
+    """
+    with open(path, "rb") as f:
+        return f.read(64).startswith(b"version https://git-lfs")
+
+def measure_load(path: str, mmap: bool) -> dict:
+    """
+    Carrega um artefato no processo atual e retorna tempo e memória.
+    """
+    # Importa as dependências do modelo antes da medição
+    import_model_dependencies()
+
+    before = rss_mb()
+    start = time.perf_counter()
+    model = load_model(path, mmap=mmap)
+    seconds = time.perf_counter() - start
+    after = rss_mb()
+
+    return {
+        "segundos": seconds,
+        "rss_carga_mb": None if before is None else after - before,
+        "pico_rss_mb": peak_rss_mb(),
+        "tipo": type(model).__name__,
+    }
+
+def run_load(path: str, mmap: bool, repeats: int) -> dict:
+    """
+    Mede a carga em processos novos (sem cache do interpretador) e retorna a
+    mediana do tempo e a memória da última execução.
+    """
+    results = []
+    for _ in range(repeats):
+        command = [sys.executable, "-m", "benchmarks.bench_model_artifacts", "--carregar", path]
+        if mmap:
+            command.append("--mmap")
+        output = subprocess.run(command, cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+        results.append(json.loads(output.stdout.strip().splitlines()[-1]))
+
+    seconds = sorted(result["segundos"] for result in results)
+    return {**results[-1], "segundos": seconds[len(seconds) // 2]}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", default=os.path.join(PROJECT_ROOT, "models", "experimental_models"))
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--carregar", help=argparse.SUPPRESS)
+    parser.add_argument("--mmap", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.carregar:
+        print(json.dumps(measure_load(args.carregar, args.mmap)))
+        return
+
+    artifacts = sorted(f for f in os.listdir(args.dir) if f.endswith(".pkl"))
+    print(f"{len(artifacts)} modelos em {args.dir} (mediana de {args.repeticoes} cargas)\n")
+    print(f"{'modelo':<42}{'formato':<16}{'tamanho (MB)':>13}{'carga (s)':>11}{'RSS carga (MB)':>16}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for artifact in artifacts:
+            path = os.path.join(args.dir, artifact)
+            name = os.path.splitext(artifact)[0]
+            if is_lfs_pointer(path):
+                print(f"⚠️  {artifact}: ponteiro do Git LFS, ignorando (execute `git lfs pull`).")
+                continue
+
+            model = load_model(path, mmap=False)
+            for label, artifact_format, compress, mmap in FORMATS:
+                if artifact_format == "pickle":
+                    target = path
+                else:
+                    target = save_model(model, os.path.join(tmp_dir, f"{name}_{compress}"), artifact_format=artifact_format, compress=compress)
+
+                result = run_load(target, mmap, args.repeticoes)
+                size = os.path.getsize(target) / (1024 ** 2)
+                rss = "-" if result["rss_carga_mb"] is None else f"{result['rss_carga_mb']:.1f}"
+                print(f"{name:<42}{label:<16}{size:>13.2f}{result['segundos']:>11.3f}{rss:>16}")
+            del model
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark de escrita e leitura do Parquet gerado por `save_df`, com
+diferentes codecs, níveis de compressão, tamanhos de row group e ordenação
+por "Data Hora Voo".
+
+Para cada configuração, mede o tempo de escrita, o tamanho do arquivo, o
+tempo de leitura completa e o tempo de leitura de um único mês (filtro
+aplicado pelo leitor, com descarte de row groups pelas estatísticas).
+
+Uso:
+    python -m benchmarks.bench_parquet --linhas 5000000
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+import pyarrow.compute as pc
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from etl.save_df import write_parquet
+
+# (nome, argumentos de `write_parquet`)
+CONFIGS = [
+    ("fastparquet (anterior)", None),
+    ("snappy", {}),
+    ("snappy, ordenado", {"sort_by": "Data Hora Voo"}),
+    ("snappy, ordenado, rg=100k", {"sort_by": "Data Hora Voo", "row_group_size": 100_000}),
+    ("zstd-1, ordenado, rg=100k", {"sort_by": "Data Hora Voo", "row_group_size": 100_000, "compression": "zstd", "compression_level": 1}),
+    ("zstd-9, ordenado, rg=100k", {"sort_by": "Data Hora Voo", "row_group_size": 100_000, "compression": "zstd", "compression_level": 9}),
+    ("gzip, ordenado, rg=100k", {"sort_by": "Data Hora Voo", "row_group_size": 100_000, "compression": "gzip"}),
+    ("sem compressão/dicionário", {"compression": "none", "use_dictionary": False}),
+]
+
+def synthetic_dataset(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Dataset no formato de saída de `preprocess_csvs`, em ordem de chegada
+    (meses em sequência, horários embaralhados dentro de cada mês).
+    """
+    rng = np.random.default_rng(seed)
+    codes = [f"SB{a}{b}" for a in "ABCDEFGHIJKLMNOPQRST" for b in "ABCDEFGHIJ"]
+    meses = np.sort(rng.integers(0, 84, n_rows))
+    data_hora = (
+        pd.Timestamp(2018, 1, 1)
+        + pd.to_timedelta(meses * 30 * 24 * 60 + rng.integers(0, 30 * 24 * 60, n_rows), unit="m")
+    )
+
+    return pd.DataFrame({
+        "Empresa Aérea": pd.Categorical(rng.choice(["AZU", "GLO", "TAM", "PTB", "ONE"], n_rows)),
+        "Aeródromo Origem": pd.Categorical(rng.choice(codes, n_rows)),
+        "Aeródromo Destino": pd.Categorical(rng.choice(codes, n_rows)),
+        "Distância (m)": (rng.integers(100, 4000, n_rows) * 1000).astype("int32"),
+        "Data Hora Voo": data_hora,
+        "Atrasado": rng.integers(0, 2, n_rows).astype("int8"),
+    })
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--linhas", type=int, default=5_000_000)
+    args = parser.parse_args()
+
+    df = synthetic_dataset(args.linhas)
+    month = (pc.field("Data Hora Voo") >= pd.Timestamp(2021, 6, 1)) & (pc.field("Data Hora Voo") < pd.Timestamp(2021, 7, 1))
+
+    print(f"{args.linhas} linhas\n")
+    print(f"{'configuração':<28}{'escrita (s)':>12}{'tamanho (MB)':>14}{'leitura (s)':>13}{'1 mês (s)':>11}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for i, (name, kwargs) in enumerate(CONFIGS):
+            path = os.path.join(tmp_dir, f"{i}.parquet")
+
+            start = time.perf_counter()
+            if kwargs is None:
+                df.to_parquet(path, engine="fastparquet", index=False)
+            else:
+                write_parquet(df, path, **kwargs)
+            t_write = time.perf_counter() - start
+
+            start = time.perf_counter()
+            pd.read_parquet(path, engine="pyarrow")
+            t_read = time.perf_counter() - start
+
+            start = time.perf_counter()
+            pd.read_parquet(path, engine="pyarrow", filters=month)
+            t_month = time.perf_counter() - start
+
+            size = os.path.getsize(path) / (1024 ** 2)
+            print(f"{name:<28}{t_write:>12.2f}{size:>14.1f}{t_read:>13.2f}{t_month:>11.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark do preprocessamento dos CSVs do VRA: modo em memória
+(`preprocess_csvs`, com os engines "pandas" e "pyarrow") versus modo
+streaming (`stream_csvs_to_parquet`).
+
+Gera arquivos mensais sintéticos no layout do VRA (ver `etl.synthetic`) em
+um diretório temporário e executa cada modo em um processo separado, medindo
+linhas por segundo e o pico de memória residente (RSS).
+
+Uso:
+    python -m benchmarks.bench_preprocess --meses 6 --linhas 500000
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from helpers.memory import peak_rss_mb
+from etl.synthetic import generate_synthetic_vra
+
+def run_mode(mode: str, paths: list, aerodromos_path: str, chunksize: int, output_dir: str) -> dict:
+    """
+    Executa um modo de preprocessamento e retorna linhas, tempo e pico de RSS.
+    """
+    import io
+    import contextlib
+    from etl.preprocess_csvs import preprocess_csvs
+    from etl.stream_csvs import stream_csvs_to_parquet
+
+    aerodromos = pd.read_csv(aerodromos_path)
+    start = time.perf_counter()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        if mode in ("memoria", "arrow"):
+            df = preprocess_csvs(paths, aerodromos, engine="pyarrow" if mode == "arrow" else "pandas")
+            df.to_parquet(os.path.join(output_dir, f"{mode}.parquet"), engine="fastparquet", index=False)
+            rows = df.shape[0]
+        else:
+            rows = stream_csvs_to_parquet(paths, aerodromos, os.path.join(output_dir, "streaming.parquet"), chunksize=chunksize)
+
+    seconds = time.perf_counter() - start
+    return {
+        "modo": mode,
+        "linhas": rows,
+        "segundos": round(seconds, 2),
+        "linhas_por_segundo": int(rows / seconds),
+        "pico_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--meses", type=int, default=6)
+    parser.add_argument("--linhas", type=int, default=500_000, help="linhas por arquivo mensal")
+    parser.add_argument("--chunksize", type=int, default=250_000)
+    parser.add_argument("--run", help=argparse.SUPPRESS)
+    parser.add_argument("--dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        paths = sorted(os.path.join(args.dir, f) for f in os.listdir(args.dir) if f.startswith("VRA_"))
+        result = run_mode(args.run, paths, os.path.join(args.dir, "aerodromos.csv"), args.chunksize, args.dir)
+        print(json.dumps(result))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        generate_synthetic_vra(tmp_dir, n_rows=args.meses * args.linhas, n_months=args.meses, ano_inicio=2024)
+
+        print(f"{args.meses} arquivos x {args.linhas} linhas (chunksize={args.chunksize})\n")
+        for mode in ["memoria", "arrow", "streaming"]:
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_preprocess", "--run", mode, "--dir", tmp_dir, "--chunksize", str(args.chunksize)],
+                cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+            )
+            print(output.stdout.strip().splitlines()[-1])
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,10 @@
 from etl.get_urls import get_urls
 from etl.preprocess_csvs import preprocess_csvs
+from etl.download_csvs import download_csv, iter_downloads
+from etl.raw_cache import fetch_cached, load_manifest
 from etl.save_df import save_df
-from etl.etl import processar_dados, carregar_dados
-from etl.feature_engeneering import clean_df, create_distance_col, create_y_col
\ No newline at end of file
+from etl.etl import processar_dados, carregar_dados, carregar_features, carregar_taxas_atraso
+from etl.stream_csvs import stream_csvs_to_parquet
+from etl.partitioned_dataset import update_partitioned_dataset, read_partitioned_dataset
+from etl.feature_engeneering import clean_df, create_distance_col, create_y_col, AirportRegistry, build_airport_registry
+from etl.feature_store import FeatureStore, write_feature_store, load_feature_store
\ No newline at end of file
@@ -0,0 +1,328 @@
+import urllib.request
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.compute as pc
+from contextlib import ExitStack, contextmanager
+from typing import Iterator
+
+from etl.preprocess_csvs import NUMERIC_INFERRED_COLUMNS, RAW_COLUMNS, iter_sources
+from etl.stream_csvs import STREAM_COLUMNS
+from etl.feature_engeneering import AirportRegistry, get_airport_registry
+from etl.profiler import EtlProfiler, iter_profiled, profile_stage
+from helpers.categories import CATEGORICAL_COLUMNS, append_categories, build_categories
+from helpers.parsers import to_datetime_fast
+
+# Valores interpretados como nulos pelo `pandas.read_csv` (padrão do pandas)
+PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+]
+
+# Schema do resultado de cada arquivo, antes da codificação categórica
+MONTH_SCHEMA = pa.schema([
+    ("Empresa Aérea", pa.string()),
+    ("Aeródromo Origem", pa.string()),
+    ("Aeródromo Destino", pa.string()),
+    ("Distância (m)", pa.int32()),
+    ("Data Hora Voo", pa.timestamp("ns")),
+    ("Atrasado", pa.int8()),
+])
+
+@contextmanager
+def open_csv_arrow(source: str, block_size: int = 16 * 1024 * 1024) -> Iterator[pv.CSVStreamingReader]:
+    """
+    Abre um arquivo CSV bruto do VRA para leitura em lotes com o leitor
+    streaming do `pyarrow.csv`, apenas com as colunas de `STREAM_COLUMNS`
+    (todas como texto).
+
+    Usado como gerenciador de contexto: ao sair do bloco `with`, o leitor e,
+    para URLs, a conexão HTTP são fechados.
+
+    Parâmetros
+    ----------
+    source : str
+        - URL ou caminho local do arquivo CSV.
+    block_size : int, opcional
+        - Tamanho, em bytes, de cada bloco lido.
+
+    Retorna
+    -------
+    Iterator[pyarrow.csv.CSVStreamingReader]
+        - Leitor que entrega um `pyarrow.RecordBatch` por bloco.
+    """
+    with ExitStack() as stack:
+        if source.startswith(("http://", "https://")):
+            source = stack.enter_context(urllib.request.urlopen(source))
+
+        reader = pv.open_csv(
+            source,
+            read_options=pv.ReadOptions(
+                skip_rows=2,         # pula "Atualizado em" + header
+                column_names=RAW_COLUMNS,
+                block_size=block_size
+            ),
+            parse_options=pv.ParseOptions(delimiter=";", quote_char='"'),
+            convert_options=pv.ConvertOptions(
+                include_columns=STREAM_COLUMNS,
+                column_types={col: pa.string() for col in STREAM_COLUMNS},
+                null_values=PANDAS_NA_VALUES,
+                strings_can_be_null=True
+            )
+        )
+        stack.callback(reader.close)
+        yield reader
+
+def is_numeric(values: pa.Array) -> bool:
+    """
+    Verifica se todos os valores não nulos de uma coluna de texto podem ser
+    convertidos para número (como na inferência de tipos do pandas).
+    """
+    try:
+        pc.cast(pc.drop_null(values), pa.float64())
+        return True
+    except pa.ArrowInvalid:
+        return False
+
+def transform_batch(batch: pa.RecordBatch, registry: AirportRegistry, codes: pa.Array) -> pa.Table:
+    """
+    Aplica a um lote do CSV bruto as mesmas etapas de `clean_df`,
+    `create_distance_col` e `create_y_col`, com `pyarrow.compute`.
+
+    Todos os filtros são combinados em uma única máscara, e as colunas de
+    data são mantidas como texto (ver `transform_arrow_month`).
+
+    Parâmetros
+    ----------
+    batch : pyarrow.RecordBatch
+        - Lote lido por `open_csv_arrow`.
+    registry : AirportRegistry
+        - Registro de aeródromos.
+    codes : pyarrow.Array
+        - Códigos OACI do registro, na ordem dos ids.
+
+    Retorna
+    -------
+    pyarrow.Table
+        - Voos válidos, com "Distância (m)", "Partida Prevista" (texto) e
+        "Atrasado".
+    """
+    origem_ids = pc.index_in(batch["Aeródromo Origem"], value_set=codes)
+    destino_ids = pc.index_in(batch["Aeródromo Destino"], value_set=codes)
+
+    mask = pc.and_kleene(
+        pc.equal(batch["Situação Voo"], "REALIZADO"),
+        pc.and_kleene(
+            pc.and_(pc.is_valid(origem_ids), pc.is_valid(destino_ids)),
+            pc.and_kleene(
+                pc.equal(batch["Código Autorização (DI)"], "0"),
+                pc.and_kleene(
+                    pc.is_in(batch["Código Tipo Linha"], value_set=pa.array(["N", "R", "H"])),
+                    pc.and_(pc.is_valid(batch["Partida Prevista"]), pc.is_valid(batch["Partida Real"]))
+                )
+            )
+        )
+    )
+    mask = pc.fill_null(mask, False)
+
+    origem_ids = pc.filter(origem_ids, mask).to_numpy()
+    destino_ids = pc.filter(destino_ids, mask).to_numpy()
+    prevista = pc.filter(batch["Partida Prevista"], mask)
+    real = pc.filter(batch["Partida Real"], mask)
+
+    return pa.table({
+        "Empresa Aérea": pc.filter(batch["Empresa Aérea"], mask),
+        "Aeródromo Origem": pc.filter(batch["Aeródromo Origem"], mask),
+        "Aeródromo Destino": pc.filter(batch["Aeródromo Destino"], mask),
+        "Distância (m)": pa.array(registry.distances[origem_ids, destino_ids].astype("int32")),
+        "Partida Prevista": prevista,
+        # Comparação de texto, como no pandas (a ordem dos bytes UTF-8 é a
+        # mesma dos code points)
+        "Atrasado": pc.cast(pc.greater(real, prevista), pa.int8()),
+    })
+
+def transform_arrow_month(source: str, registry: AirportRegistry, block_size: int = 16 * 1024 * 1024) -> pa.Table:
+    """
+    Lê e transforma um arquivo mensal do VRA inteiramente em Arrow, com o
+    mesmo resultado de `transform_df`.
+
+    Parâmetros
+    ----------
+    source : str
+        - URL ou caminho local do arquivo CSV.
+    registry : AirportRegistry
+        - Registro de aeródromos.
+    block_size : int, opcional
+        - Tamanho, em bytes, de cada bloco lido.
+
+    Retorna
+    -------
+    pyarrow.Table
+        - Tabela com o schema de `MONTH_SCHEMA` (categóricas como texto).
+    """
+    codes = pa.array(registry.codes.to_numpy(dtype=object), type=pa.string())
+    numeric = dict.fromkeys(NUMERIC_INFERRED_COLUMNS, True)
+    tables = []
+
+    with open_csv_arrow(source, block_size=block_size) as reader:
+        for batch in reader:
+            for col in NUMERIC_INFERRED_COLUMNS:
+                numeric[col] = numeric[col] and is_numeric(batch[col])
+            tables.append(transform_batch(batch, registry, codes))
+
+    # No pandas, uma coluna de filtro inteiramente numérica não é igual a
+    # nenhum texto, e todos os voos do arquivo são descartados
+    if not tables or any(numeric.values()):
+        return MONTH_SCHEMA.empty_table()
+
+    table = pa.concat_tables(tables)
+
+    # Conversão das datas apenas sobre os valores distintos do mês
+    prevista = table["Partida Prevista"].combine_chunks()
+    uniques = pc.unique(prevista)
+    parsed = to_datetime_fast(pd.Series(uniques.to_pandas(), dtype=object))
+    data_hora = pc.take(pa.array(parsed.to_numpy(), type=pa.timestamp("ns")), pc.index_in(prevista, value_set=uniques))
+
+    return pa.table({
+        "Empresa Aérea": table["Empresa Aérea"],
+        "Aeródromo Origem": table["Aeródromo Origem"],
+        "Aeródromo Destino": table["Aeródromo Destino"],
+        "Distância (m)": table["Distância (m)"],
+        "Data Hora Voo": data_hora,
+        "Atrasado": table["Atrasado"],
+    }, schema=MONTH_SCHEMA)
+
+def encode_categoricals(table: pa.Table, categories: dict) -> pa.Table:
+    """
+    Codifica as colunas categóricas como dicionários Arrow com as categorias
+    globais (ver `helpers.categories`), convertidos pelo pandas diretamente
+    em `CategoricalDtype` com as mesmas categorias.
+
+    Parâmetros
+    ----------
+    table : pyarrow.Table
+        - Tabela com as colunas categóricas como texto.
+    categories : dict
+        - Dicionários categóricos globais.
+
+    Retorna
+    -------
+    pyarrow.Table
+        - Tabela com as colunas categóricas codificadas.
+    """
+    for col, name in CATEGORICAL_COLUMNS.items():
+        dictionary = pa.array(categories[name], type=pa.string())
+        indices = pc.index_in(table[col].combine_chunks(), value_set=dictionary)
+        encoded = pa.DictionaryArray.from_arrays(indices, dictionary)
+        table = table.set_column(table.schema.get_field_index(col), col, encoded)
+    return table
+
+def preprocess_csvs_arrow(
+    urls: list,
+    aerodromos: pd.DataFrame | AirportRegistry,
+    download_dir: str | None = None,
+    max_workers: int = 4,
+    revalidate: bool = True,
+    categories: dict | None = None,
+    block_size: int = 16 * 1024 * 1024,
+    profiler: EtlProfiler | None = None
+) -> pd.DataFrame:
+    """
+    Versão de `preprocess_csvs` baseada em Arrow (`preprocess_csvs(...,
+    engine="pyarrow")`).
+
+    Cada CSV é lido em lotes pelo leitor streaming multithread do
+    `pyarrow.csv`, somente com as colunas necessárias. Filtros, distância,
+    variável alvo e datas são calculados com `pyarrow.compute` (ver
+    `transform_batch`), e o DataFrame do pandas é gerado apenas ao final, a
+    partir das colunas Arrow, sem cópia intermediária de texto para objetos
+    Python. O resultado é idêntico ao do engine do pandas.
+
+    Parâmetros
+    ----------
+    urls : list
+        - Lista contendo as URLs dos arquivos CSV a serem processados.
+    aerodromos : pandas.DataFrame | AirportRegistry
+        - DataFrame contendo informações sobre aeródromos da ANAC ou registro
+        já construído.
+    download_dir : str, opcional
+        - Diretório do cache local de CSVs brutos (ver `preprocess_csvs`).
+    max_workers : int, opcional
+        - Limite de downloads simultâneos quando `download_dir` é informado.
+    revalidate : bool, opcional
+        - Se True, revalida no servidor os arquivos já presentes no cache.
+    categories : dict, opcional
+        - Dicionários categóricos globais, completados no próprio objeto (ver
+        `preprocess_csvs`).
+    block_size : int, opcional
+        - Tamanho, em bytes, de cada bloco lido dos CSVs.
+    profiler : EtlProfiler, opcional
+        - Se informado, registra o download ("download"), a leitura e
+        transformação de cada arquivo (todas em "parse", pois ocorrem juntas
+        em cada lote) e a concatenação final ("concat").
+
+    Retorna
+    -------
+    pandas.DataFrame
+        - DataFrame consolidado, idêntico ao de `preprocess_csvs`.
+    """
+    print(f"Iniciando o download e preprocessamento de {len(urls)} arquivos CSV...\n")
+
+    registry = get_airport_registry(aerodromos)
+    if isinstance(aerodromos, pd.DataFrame):
+        categories = build_categories(aerodromos, categories)
+    else:
+        categories = append_categories(categories, "aerodromos", registry.codes)
+
+    tables = []
+    lines = 0
+    memory_usage = 0
+
+    sources = iter_sources(urls, download_dir=download_dir, max_workers=max_workers, revalidate=revalidate)
+    sources = iter_profiled(sources, profiler, "download")
+
+    for i, (url, source, error) in enumerate(sources, start=1):
+
+        print(f"[{i}/{len(urls)}] Carregando: {url.replace('https://sistemas.anac.gov.br/dadosabertos/Voos%20e%20opera%C3%A7%C3%B5es%20a%C3%A9reas/Voo%20Regular%20Ativo%20%28VRA%29', 'http://...')}")
+
+        if error is not None:
+            print(f"❌ Falha ao baixar {url}\nErro: {error}")
+            continue
+
+        try:
+            with profile_stage(profiler, "parse", url) as record:
+                table = transform_arrow_month(source, registry, block_size=block_size)
+                record.rows_out = table.num_rows
+        except Exception as e:
+            print(f"❌ Falha ao ler {url}\nErro: {e}")
+            continue
+
+        tables.append(table)
+
+        lines += table.num_rows
+        memory_usage += table.nbytes / (1024 ** 2)
+        print(f"✔ {table.num_rows} linhas carregadas.")
+        print(f"   Total atual de linhas: {lines}")
+        print(f"   Memória usada: {memory_usage:.2f} MB\n")
+
+        # Acrescenta aos dicionários globais os valores novos do mês
+        for col, name in CATEGORICAL_COLUMNS.items():
+            categories = append_categories(categories, name, pc.unique(table[col]).to_pylist())
+
+    if not tables:
+        raise ValueError("No objects to concatenate")
+
+    with profile_stage(profiler, "concat", rows_in=lines) as record:
+        master_table = encode_categoricals(pa.concat_tables(tables), categories)
+        del tables
+
+        master_df = master_table.to_pandas(split_blocks=True, self_destruct=True)
+        del master_table
+        record.rows_out = master_df.shape[0]
+
+    print(f"\n🏁 Finalizado.\n")
+    print(f"Total de linhas carregadas: {master_df.shape[0]}")
+    print(f"Memória usada no Dataframe Master: {master_df.memory_usage().sum() / (1024 ** 2):.2f} MB\n")
+
+    return master_df
@@ -0,0 +1,200 @@
+import os
+import time
+import hashlib
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import deque
+from typing import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, Future
+
+def url_filename(url: str) -> str:
+    """
+    Obtém o nome do arquivo a partir da URL, decodificando caracteres escapados.
+
+    Parâmetros
+    ----------
+    url : str
+        - URL do arquivo CSV.
+
+    Retorna
+    -------
+    str
+        - Nome do arquivo (ex.: "VRA_20181.csv").
+    """
+    path = urllib.parse.urlparse(url).path
+    return os.path.basename(urllib.parse.unquote(path))
+
+def fetch_url(
+    url: str,
+    path: str,
+    headers: dict | None = None,
+    retries: int = 3,
+    backoff: float = 1.0,
+    timeout: float = 60,
+    chunk_size: int = 1024 * 1024
+) -> dict | None:
+    """
+    Baixa o conteúdo de uma URL para `path` em modo streaming, com novas
+    tentativas e espera exponencial entre elas.
+
+    O conteúdo é gravado em blocos em um arquivo temporário ".part", que só é
+    renomeado para `path` quando o download termina, evitando arquivos
+    truncados. O checksum SHA-256 é calculado durante a escrita.
+
+    Parâmetros
+    ----------
+    url : str
+        - URL do arquivo a ser baixado.
+    path : str
+        - Caminho local de destino.
+    headers : dict, opcional
+        - Cabeçalhos HTTP adicionais (ex.: "If-None-Match" para requisições
+        condicionais).
+    retries : int, opcional
+        - Número máximo de tentativas.
+    backoff : float, opcional
+        - Espera base, em segundos, entre tentativas (dobra a cada falha).
+    timeout : float, opcional
+        - Tempo máximo, em segundos, de espera por resposta do servidor.
+    chunk_size : int, opcional
+        - Tamanho, em bytes, dos blocos gravados em disco.
+
+    Retorna
+    -------
+    dict | None
+        - Dicionário com "size", "sha256", "etag" e "last_modified" do arquivo
+        baixado, ou None quando o servidor responde 304 (não modificado).
+
+    Exceções
+    --------
+    urllib.error.HTTPError
+        - Lançada imediatamente para erros 4xx (exceto 429), que não se
+        resolvem com novas tentativas.
+    OSError
+        - Lançada quando todas as tentativas falham.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.part"
+    request = urllib.request.Request(url, headers=headers or {})
+
+    for attempt in range(1, retries + 1):
+        try:
+            sha256 = hashlib.sha256()
+            size = 0
+            with urllib.request.urlopen(request, timeout=timeout) as response, open(tmp_path, "wb") as file:
+                while chunk := response.read(chunk_size):
+                    sha256.update(chunk)
+                    file.write(chunk)
+                    size += len(chunk)
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+            os.replace(tmp_path, path)
+
+            return {
+                "size": size,
+                "sha256": sha256.hexdigest(),
+                "etag": etag,
+                "last_modified": last_modified,
+            }
+
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None
+            if (400 <= e.code < 500 and e.code != 429) or attempt == retries:
+                raise
+
+        except OSError:
+            if attempt == retries:
+                raise
+
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        time.sleep(backoff * 2 ** (attempt - 1))
+
+    raise OSError(f"Falha ao baixar {url}")
+
+def download_csv(url: str, dest_dir: str, **fetch_kwargs) -> str:
+    """
+    Baixa um arquivo CSV para o diretório informado (ver `fetch_url`).
+
+    Parâmetros
+    ----------
+    url : str
+        - URL do arquivo a ser baixado.
+    dest_dir : str
+        - Diretório onde o arquivo será salvo.
+    **fetch_kwargs
+        - Argumentos adicionais repassados para `fetch_url` (retries,
+        backoff, timeout, chunk_size).
+
+    Retorna
+    -------
+    str
+        - Caminho local do arquivo baixado.
+    """
+    path = os.path.join(dest_dir, url_filename(url))
+    fetch_url(url, path, **fetch_kwargs)
+    return path
+
+def iter_downloads(
+    urls: list,
+    dest_dir: str,
+    max_workers: int = 4,
+    download: Callable[..., str] = download_csv,
+    **download_kwargs
+) -> Iterator[tuple[str, str | None, Exception | None]]:
+    """
+    Baixa múltiplos arquivos de forma concorrente e os entrega na mesma ordem
+    das URLs, assim que cada um estiver disponível.
+
+    No máximo `max_workers` downloads ocorrem ao mesmo tempo e apenas
+    `2 * max_workers` arquivos ficam em andamento ou aguardando consumo,
+    de modo que o processamento de um arquivo (ex.: leitura e limpeza)
+    acontece enquanto os próximos ainda estão sendo baixados.
+
+    Parâmetros
+    ----------
+    urls : list
+        - Lista de URLs a serem baixadas.
+    dest_dir : str
+        - Diretório onde os arquivos serão salvos.
+    max_workers : int, opcional
+        - Limite de downloads simultâneos.
+    download : Callable[..., str], opcional
+        - Função chamada como `download(url, dest_dir, **download_kwargs)`
+        que baixa o arquivo e retorna seu caminho local. Padrão é
+        `download_csv`; `etl.raw_cache.fetch_cached` adiciona o cache local.
+    **download_kwargs
+        - Argumentos adicionais repassados para `download`.
+
+    Retorna
+    -------
+    Iterator[tuple[str, str | None, Exception | None]]
+        - Tuplas (url, caminho local, erro). Em caso de falha, o caminho é
+        None e o erro contém a exceção ocorrida.
+    """
+    max_workers = max(1, max_workers)
+    pending: deque[tuple[str, Future]] = deque()
+    urls_iter = iter(urls)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def submit_next() -> None:
+            url = next(urls_iter, None)
+            if url is not None:
+                pending.append((url, executor.submit(download, url, dest_dir, **download_kwargs)))
+
+        for _ in range(2 * max_workers):
+            submit_next()
+
+        while pending:
+            url, future = pending.popleft()
+            submit_next()
+
+            try:
+                yield url, future.result(), None
+            except Exception as e:
+                yield url, None, e
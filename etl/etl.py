@@ -1,14 +1,37 @@
 import os
 import pandas as pd
+from datetime import datetime
 
 from etl.save_df import save_df
 from etl.get_urls import get_urls
 from etl.preprocess_csvs import preprocess_csvs
+from etl.stream_csvs import stream_csvs_to_parquet
+from etl.partitioned_dataset import build_filters, update_partitioned_dataset, read_partitioned_dataset
+from etl.profiler import EtlProfiler, profile_stage
+from etl.feature_store import FeatureStore, load_feature_store, write_feature_store
 
 from helpers.parsers import parse_categoricals, parse_datetime, parse_int
+from helpers.categories import CATEGORICAL_COLUMNS, CATEGORIES_FILENAME, build_categories, categories_path, load_categories, save_categories, update_categories
+from helpers.calendar_features import add_calendar_features
+from helpers.delay_rates import DELAY_RATE_COLUMNS, DELAY_RATES_FILENAME, DelayRateTables, build_delay_rate_tables, load_delay_rates, save_delay_rates
 
 
-def processar_dados(save: bool = True) -> pd.DataFrame:
+def processar_dados(
+    save: bool = True,
+    download: bool = True,
+    max_workers: int = 4,
+    descobrir: bool = False,
+    incremental: bool = False,
+    dataset_name: str = "dados_voos",
+    chunksize: int | None = None,
+    carregar: bool = False,
+    n_workers: int = 1,
+    engine: str = "pandas",
+    profile: bool = False,
+    feature_store: bool = False,
+    delay_rates: bool = False,
+    calendar_features: bool = False
+) -> pd.DataFrame | str:
     """
     Executa o pipeline completo de ETL dos dados de voos a partir da base de dados de vôos da ANAC (Agência Nacional de Aviação Civil).
 
@@ -22,32 +45,235 @@ def processar_dados(save: bool = True) -> pd.DataFrame:
         Indica se o DataFrame resultante deve ser salvo em disco.
         Padrão é True, o que significa que os arquivos serão salvos
         automaticamente.
+    **download** : bool, opcional
+        Se True (padrão), os CSVs são baixados de forma concorrente para o
+        cache local ./data/raw/ antes da leitura, e reexecuções só baixam
+        novamente os arquivos ausentes ou modificados no servidor. Se False,
+        cada CSV é lido diretamente da URL, de forma sequencial.
+    **max_workers** : int, opcional
+        Limite de downloads simultâneos. Padrão é 4.
+    **descobrir** : bool, opcional
+        Se True, descobre no servidor o último mês publicado em vez de usar
+        o limite fixo de `get_urls`. Padrão é False.
+    **incremental** : bool, opcional
+        Se True, atualiza o dataset particionado por ano/mês em
+        ./data/<dataset_name>/, reprocessando apenas os meses novos ou cujo
+        CSV mudou no servidor, e retorna o dataset completo lido das
+        partições. Implica `download=True` e ignora `save`. Padrão é False.
+    **dataset_name** : str, opcional
+        Nome do diretório do dataset particionado em ./data/, usado quando
+        `incremental=True`. Padrão é "dados_voos".
+    **chunksize** : int, opcional
+        Se informado, executa o ETL em modo streaming (ver
+        `etl.stream_csvs.stream_csvs_to_parquet`): cada CSV é lido em blocos
+        de `chunksize` linhas e gravado diretamente em
+        ./data/<dataset_name>_<timestamp>.parquet, com uso de memória limitado
+        ao tamanho do bloco. Retorna o caminho do arquivo gerado, sem
+        carregá-lo (ver `carregar`); o feature store e as taxas de atraso são
+        calculados a partir do arquivo. Exige `save=True`. Padrão é None (modo
+        em memória).
+    **carregar** : bool, opcional
+        No modo streaming, se True, carrega o dataset gerado (ver
+        `carregar_dados`) e o retorna no lugar do caminho. Padrão é False.
+    **n_workers** : int, opcional
+        Quantidade de processos usados para transformar os arquivos mensais
+        em paralelo no modo em memória (ver `preprocess_csvs`). Padrão é 1.
+    **engine** : str, opcional
+        Engine do modo em memória: "pandas" (padrão) ou "pyarrow" (leitura,
+        filtros e features em Arrow, com resultado idêntico; ver
+        `etl.arrow_engine`).
+    **profile** : bool, opcional
+        Se True, mede o tempo, o tempo de CPU, as linhas de entrada e saída e
+        o pico de memória de cada etapa de cada arquivo (ver
+        `etl.profiler.EtlProfiler`) e grava o relatório em
+        ./data/perfil_etl_<timestamp>.json ao final. No modo em memória, são
+        registradas as etapas "download", "parse", "clean", "distance",
+        "label", "typing", "concat" e "save"; nos modos incremental e
+        streaming, apenas o total da execução. Padrão é False.
+    **feature_store** : bool, opcional
+        Se True, grava também o feature store numérico do dataset (ver
+        `etl.feature_store`) em ./data/<nome do dataset>_features/, com um
+        array .npy por feature, carregado por `carregar_features`. Padrão é
+        False.
+    **delay_rates** : bool, opcional
+        Se True, calcula também as tabelas de taxa de atraso históricas por
+        rota, companhia, aeródromo de origem e hora do dia (ver
+        `helpers.delay_rates`) e as grava em
+        ./data/<nome do dataset>_taxas_atraso.npz, para uso no treino
+        (`add_delay_rate_features`) e na API (via `export_model`). Padrão é
+        False.
+    **calendar_features** : bool, opcional
+        Se True, acrescenta ao dataset as features de calendário de
+        "Data Hora Voo" (hora, dia da semana, mês, dia do ano, feriado
+        nacional e distância em dias até o próximo feriado e desde o
+        anterior; ver `helpers.calendar_features`), em inteiros pequenos,
+        calculadas pela mesma função usada na API. Nos modos em memória e
+        streaming, as colunas são gravadas no arquivo gerado; no modo
+        incremental, são calculadas sobre o dataset lido das partições.
+        Padrão é False.
 
     Retorna
     -------
-    pd.DataFrame
-        Dataset consolidado e pré-processado.
+    pd.DataFrame | str
+        Dataset consolidado e pré-processado, ou, no modo streaming sem
+        `carregar`, o caminho do arquivo Parquet gerado.
+
+    Exceções
+    --------
+    ValueError
+        Lançada quando `chunksize` é informado com `save=False` (o modo
+        streaming grava o dataset diretamente em disco).
+
+    Observações
+    -----------
+    - Os dicionários categóricos globais (empresas e aeródromos, ver
+      `helpers.categories`) ficam em ./metadata/categorias.json. A cada
+      execução, são completados com os aeródromos da ANAC e os valores
+      observados (apenas acréscimos, com nova versão) e salvos também junto
+      ao dataset gerado, para uso em `carregar_dados`.
     """
-    urls = get_urls()
+    if chunksize is not None and not incremental and not save:
+        raise ValueError("O modo streaming grava o dataset em disco; use save=True ou chunksize=None.")
+
+    urls = get_urls(descobrir=descobrir)
     aerodromos = pd.read_csv("metadata/aerodromos.csv")
 
-    dataset = preprocess_csvs(urls, aerodromos)
-    if save:
-      save_df(dataset, timestamp=True)
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    data_dir = os.path.join(os.path.dirname(current_dir), "data")
+
+    # Dicionários categóricos globais, compartilhados entre execuções
+    global_categories_path = os.path.join(os.path.dirname(current_dir), "metadata", CATEGORIES_FILENAME)
+    categories = build_categories(aerodromos, load_categories(global_categories_path))
+
+    download_dir = os.path.join(data_dir, "raw") if download else None
+    profiler = EtlProfiler() if profile else None
+
+    with profile_stage(profiler, "total") as total:
+        if incremental:
+            dataset_dir = os.path.join(data_dir, dataset_name)
+            update_partitioned_dataset(
+                urls,
+                aerodromos,
+                dataset_dir=dataset_dir,
+                cache_dir=os.path.join(data_dir, "raw"),
+                max_workers=max_workers,
+                categories=categories
+            )
+            save_categories(categories, global_categories_path)
+            save_categories(categories, categories_path(dataset_dir))
+            dataset = carregar_dados(dataset_name)
+            if calendar_features:
+                dataset = add_calendar_features(dataset)
+            features_source, features_name = dataset, dataset_name
+            rows = dataset.shape[0]
+
+        elif chunksize is not None:
+            filename = f"{dataset_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            output_path = os.path.join(data_dir, f"{filename}.parquet")
+            rows = stream_csvs_to_parquet(
+                urls,
+                aerodromos,
+                output_path=output_path,
+                chunksize=chunksize,
+                download_dir=download_dir,
+                max_workers=max_workers,
+                categories=categories,
+                calendar_features=calendar_features
+            )
+            save_categories(categories, global_categories_path)
+            save_categories(categories, categories_path(output_path))
+            # O dataset só é carregado inteiro quando pedido
+            dataset = carregar_dados(filename) if carregar else None
+            features_source, features_name = output_path, filename
+
+        else:
+            dataset = preprocess_csvs(
+                urls,
+                aerodromos,
+                download_dir=download_dir,
+                max_workers=max_workers,
+                n_workers=n_workers,
+                categories=categories,
+                engine=engine,
+                profiler=profiler
+            )
+            if calendar_features:
+                with profile_stage(profiler, "calendar", rows_in=dataset.shape[0]) as record:
+                    dataset = add_calendar_features(dataset)
+                    record.rows_out = dataset.shape[0]
+            features_source, features_name = dataset, dataset_name
+            rows = dataset.shape[0]
+            if save:
+                with profile_stage(profiler, "save", rows_in=dataset.shape[0]):
+                    save_categories(categories, global_categories_path)
+                    features_name = save_df(dataset, timestamp=True, categories=categories)
+
+        # Feature store numérico, gravado a partir do Parquet no modo streaming
+        if feature_store:
+            with profile_stage(profiler, "feature_store", rows_in=rows):
+                write_feature_store(features_source, os.path.join(data_dir, f"{features_name}_features"), categories)
+            print(f"   → ./data/{features_name}_features/")
+
+        # Taxas de atraso históricas, consultadas no treino e na API
+        if delay_rates:
+            with profile_stage(profiler, "delay_rates", rows_in=rows):
+                # No modo streaming, lê do arquivo apenas as colunas necessárias
+                source = dataset if dataset is not None else carregar_dados(features_name, columns=DELAY_RATE_COLUMNS)
+                tables = build_delay_rate_tables(source, categories)
+                del source
+                save_delay_rates(tables, os.path.join(data_dir, f"{features_name}_{DELAY_RATES_FILENAME}"))
+            print(f"   → ./data/{features_name}_{DELAY_RATES_FILENAME}")
+
+        total.rows_out = rows
 
-    return dataset   
+    # Relatório de desempenho por etapa e por arquivo
+    if profiler is not None:
+        report_path = os.path.join(data_dir, f"perfil_etl_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        profiler.save(report_path)
+        print(f"📁 Relatório de desempenho salvo em: ./data/{os.path.basename(report_path)}")
 
+    return dataset if dataset is not None else output_path
 
-def carregar_dados(filename: str) -> pd.DataFrame:
+
+def carregar_dados(
+    filename: str,
+    columns: list | None = None,
+    inicio=None,
+    fim=None,
+    empresas: list | None = None,
+    origens: list | None = None,
+    destinos: list | None = None
+) -> pd.DataFrame:
     """
     Carrega um dataset de voos previamente pré-processado a partir de um arquivo Parquet
     e aplica conversões de tipo para colunas categóricas e de data/hora.
 
+    A seleção de colunas e os filtros são aplicados pelo próprio leitor
+    Parquet: apenas as colunas pedidas são lidas, row groups cujas
+    estatísticas não atendem aos filtros são descartados e, no dataset
+    particionado, meses fora do intervalo de datas nem são abertos. Os tipos
+    gravados (category, datetime, int32) são preservados na leitura, e as
+    conversões posteriores só atuam em colunas que ainda não têm o tipo final.
+
     Parâmetros
     ----------
     filename : str
         Nome-base do arquivo Parquet localizado em ./data/.
-        Não inclua a extensão ".parquet".
+        Não inclua a extensão ".parquet". Se ./data/<filename>/ for um
+        diretório, é lido como dataset particionado por ano/mês (ver
+        `processar_dados(incremental=True)`).
+    columns : list, opcional
+        Subconjunto de colunas a serem carregadas.
+    inicio : str | datetime, opcional
+        Menor "Data Hora Voo" carregada (inclusive).
+    fim : str | datetime, opcional
+        Limite superior de "Data Hora Voo" (exclusivo).
+    empresas : list, opcional
+        Empresas aéreas carregadas.
+    origens : list, opcional
+        Aeródromos de origem carregados.
+    destinos : list, opcional
+        Aeródromos de destino carregados.
 
     Retorna
     -------
@@ -55,16 +281,113 @@ def carregar_dados(filename: str) -> pd.DataFrame:
         Dataset carregado com colunas categóricas convertidas para `category`
         e colunas de data/hora convertidas para `datetime`, pronto para análise
         ou modelagem.
+
+    Observações
+    -----------
+    - Se houver dicionários categóricos salvos junto ao dataset
+      (<filename>_categorias.json, ou _categorias.json dentro do diretório),
+      as colunas categóricas recebem os tipos fixos desses dicionários, os
+      mesmos usados no treino e na API. Caso contrário, as categorias são
+      inferidas dos dados.
     """
     current_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(current_dir)
-    filepath = os.path.join(project_root, "data", f"{filename}.parquet")
-    print(f"Carregando dataset local de: ./data/{filename}.parquet")
+    dataset_dir = os.path.join(project_root, "data", filename)
+
+    filters = build_filters(inicio, fim, empresas, origens, destinos)
+
+    if os.path.isdir(dataset_dir):
+        print(f"Carregando dataset particionado de: ./data/{filename}/")
+        dataset = read_partitioned_dataset(dataset_dir, columns=columns, filters=filters, inicio=inicio, fim=fim)
+        categories = load_categories(categories_path(dataset_dir))
+    else:
+        filepath = f"{dataset_dir}.parquet"
+        print(f"Carregando dataset local de: ./data/{filename}.parquet")
+        dataset = pd.read_parquet(
+            filepath,
+            engine="pyarrow",
+            columns=columns,
+            filters=filters,
+            read_dictionary=[col for col in CATEGORICAL_COLUMNS if columns is None or col in columns]
+        )
+        categories = load_categories(categories_path(filepath))
+
+    # Garante que nenhum valor do dataset fique fora dos dicionários salvos
+    if categories is not None:
+        categories = update_categories(categories, dataset)
 
-    dataset = pd.read_parquet(filepath)
-    dataset = parse_categoricals(dataset)
+    dataset = parse_categoricals(dataset, categories)
     dataset = parse_datetime(dataset)
-    dataset = parse_int(dataset, col="Distância (m)", int_type='int32')
+    if "Distância (m)" in dataset:
+        dataset = parse_int(dataset, col="Distância (m)", int_type='int32')
     print("🏁 Dataset carregado com sucesso!")
 
-    return dataset
\ No newline at end of file
+    return dataset
+
+
+def carregar_features(
+    filename: str,
+    columns: list | None = None,
+    mmap: bool = True
+) -> FeatureStore:
+    """
+    Abre o feature store numérico gravado por
+    `processar_dados(feature_store=True)`.
+
+    Parâmetros
+    ----------
+    filename : str
+        Nome-base do dataset em ./data/ (o mesmo usado em `carregar_dados`).
+        O feature store é lido de ./data/<filename>_features/.
+    columns : list, opcional
+        Arrays a serem abertos (ver `etl.feature_store.FEATURE_ARRAYS`).
+    mmap : bool, opcional
+        Se True (padrão), os arrays são abertos como memory map, sem leitura
+        do disco até o primeiro acesso e com páginas compartilhadas entre
+        processos. Se False, são lidos inteiros para a memória.
+
+    Retorna
+    -------
+    FeatureStore
+        Arrays por feature (ex.: `store["origem"]`, `store["atrasado"]`) e os
+        dicionários categóricos. `store.to_frame()` reconstrói o DataFrame no
+        formato de `carregar_dados`.
+    """
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    path = os.path.join(project_root, "data", f"{filename}_features")
+
+    return load_feature_store(path, columns=columns, mmap_mode="r" if mmap else None)
+
+
+def carregar_taxas_atraso(filename: str) -> DelayRateTables:
+    """
+    Carrega as tabelas de taxa de atraso gravadas por
+    `processar_dados(delay_rates=True)`.
+
+    Parâmetros
+    ----------
+    filename : str
+        Nome-base do dataset em ./data/ (o mesmo usado em `carregar_dados`).
+        As tabelas são lidas de ./data/<filename>_taxas_atraso.npz.
+
+    Retorna
+    -------
+    DelayRateTables
+        Tabelas de consulta. `add_delay_rate_features(df, tabelas)` acrescenta
+        as features de taxa de atraso a um DataFrame de voos.
+
+    Exceções
+    --------
+    FileNotFoundError
+        Lançada quando o dataset não tem tabelas de taxa de atraso gravadas.
+    """
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    path = os.path.join(project_root, "data", f"{filename}_{DELAY_RATES_FILENAME}")
+
+    tables = load_delay_rates(path)
+    if tables is None:
+        raise FileNotFoundError(f"Taxas de atraso não encontradas em: ./data/{filename}_{DELAY_RATES_FILENAME}")
+
+    return tables
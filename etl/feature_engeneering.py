@@ -1,31 +1,6 @@
 import pandas as pd
 import numpy as np
-
-def merge_aerodromos(df: pd.DataFrame, aerodromos: pd.DataFrame, tipo: str) -> pd.DataFrame:
-    """
-    Realiza o merge do DataFrame principal com a base de aeródromos,
-    adicionando latitude e longitude conforme o tipo informado.
-
-    Parâmetros
-    ----------
-    df : pandas.DataFrame
-        - DataFrame principal contendo o código do aeródromo.
-    tipo : str
-        - Define se o merge será feito para origem ou destino.
-
-    Retorna
-    -------
-    pandas.DataFrame
-        - DataFrame com as colunas de latitude e longitude incorporadas.
-    """
-    df = df.merge(
-        aerodromos,
-        left_on=f"Aeródromo {tipo.capitalize()}",
-        right_on="Código OACI", 
-        how='left'
-    ).rename(columns={"Latitude": f"lat_{tipo}", "Longitude": f"lon_{tipo}"}).drop(columns="Código OACI")
-
-    return df
+from dataclasses import dataclass
 
 def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -62,44 +37,180 @@ def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     c = 2 * np.arcsin(np.sqrt(a))
 
     # Arrendonda o resultado do cáculo em km e converte para metros
-    distance = (round(R * c, 0) * 1000)
+    distance = (np.round(R * c, 0) * 1000)
 
     return distance
      
-def create_distance_col(df: pd.DataFrame, aerodromos: pd.DataFrame) -> pd.DataFrame:
+@dataclass(frozen=True)
+class AirportRegistry:
     """
-    Insere as colunas de latitude e longitude para os aeróromos de origem e destino no DataFrame 
-    de voos por meio da função merge_aerodromos, calcula a distância entre os aeródromos 
-    de origem e destino utilizando a função haversine e, por fim, remove as colunas auxiliares 
-    de latitude e longitude.
+    Registro compacto dos aeródromos da ANAC, construído uma única vez a
+    partir de metadata/aerodromos.csv.
+
+    Cada código OACI recebe um id inteiro denso (sua posição em `codes`), e
+    as distâncias entre todos os pares de aeródromos são pré-calculadas, de
+    modo que a validação dos aeródromos e a coluna de distância se tornam
+    consultas por índice em arrays, sem merges.
+
+    Atributos
+    ---------
+    codes : pandas.Index
+        - Códigos OACI; o id de cada aeródromo é sua posição no índice.
+    lat, lon : numpy.ndarray
+        - Latitude e longitude (float32, em graus) de cada aeródromo.
+    distances : numpy.ndarray
+        - Matriz (float32) de distâncias em metros entre os pares de
+        aeródromos, indexada por [id_origem, id_destino].
+    """
+    codes: pd.Index
+    lat: np.ndarray
+    lon: np.ndarray
+    distances: np.ndarray
+
+    def ids(self, values: pd.Series) -> np.ndarray:
+        """
+        Converte códigos OACI em ids do registro.
+
+        Para colunas categóricas, apenas as categorias são consultadas e os
+        ids são obtidos indexando o mapeamento pelos códigos da categoria.
+        Para as demais, os valores são fatorizados antes da consulta.
+
+        Parâmetros
+        ----------
+        values : pandas.Series
+            - Códigos OACI.
+
+        Retorna
+        -------
+        numpy.ndarray
+            - Ids (int32); -1 para códigos ausentes do registro ou nulos.
+        """
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            codes, uniques = values.cat.codes.to_numpy(), values.cat.categories
+        else:
+            codes, uniques = pd.factorize(values)
+
+        mapping = np.append(self.codes.get_indexer(uniques), -1).astype("int32")
+        return mapping[codes]  # código -1 (nulo) aponta para o -1 final
+
+    def contains(self, values: pd.Series) -> np.ndarray:
+        """
+        Verifica quais códigos OACI pertencem ao registro.
+
+        Parâmetros
+        ----------
+        values : pandas.Series
+            - Códigos OACI.
+
+        Retorna
+        -------
+        numpy.ndarray
+            - Máscara booleana.
+        """
+        return self.ids(values) >= 0
+
+    def distance(self, origem_ids: np.ndarray, destino_ids: np.ndarray) -> np.ndarray:
+        """
+        Obtém a distância entre pares de aeródromos a partir de seus ids.
+
+        Parâmetros
+        ----------
+        origem_ids, destino_ids : numpy.ndarray
+            - Ids dos aeródromos de origem e destino.
+
+        Retorna
+        -------
+        numpy.ndarray
+            - Distâncias em metros (float64); NaN quando algum id é -1.
+        """
+        distances = self.distances[origem_ids, destino_ids].astype("float64")
+        distances[(origem_ids < 0) | (destino_ids < 0)] = np.nan
+        return distances
+
+def build_airport_registry(aerodromos: pd.DataFrame) -> AirportRegistry:
+    """
+    Constrói o registro de aeródromos a partir do DataFrame de aeródromos
+    da ANAC (colunas "Código OACI", "Latitude" e "Longitude").
+
+    A matriz de distâncias é calculada com a função `haversine` sobre as
+    coordenadas originais, produzindo exatamente os mesmos valores do cálculo
+    por voo.
+
+    Parâmetros
+    ----------
+    aerodromos : pandas.DataFrame
+        - DataFrame com os aeródromos válidos.
+
+    Retorna
+    -------
+    AirportRegistry
+        - Registro de aeródromos.
+    """
+    aerodromos = aerodromos.drop_duplicates(subset="Código OACI")
+    lat = aerodromos["Latitude"].to_numpy(dtype="float64")
+    lon = aerodromos["Longitude"].to_numpy(dtype="float64")
+
+    distances = haversine(lat[:, None], lon[:, None], lat[None, :], lon[None, :])
+
+    return AirportRegistry(
+        codes=pd.Index(aerodromos["Código OACI"].to_numpy()),
+        lat=lat.astype("float32"),
+        lon=lon.astype("float32"),
+        distances=np.asarray(distances, dtype="float32"),
+    )
+
+def get_airport_registry(aerodromos: pd.DataFrame | AirportRegistry) -> AirportRegistry:
+    """
+    Retorna o registro de aeródromos, construindo-o caso seja informado o
+    DataFrame de aeródromos.
+
+    Parâmetros
+    ----------
+    aerodromos : pandas.DataFrame | AirportRegistry
+        - DataFrame de aeródromos ou registro já construído.
+
+    Retorna
+    -------
+    AirportRegistry
+        - Registro de aeródromos.
+    """
+    if isinstance(aerodromos, AirportRegistry):
+        return aerodromos
+    return build_airport_registry(aerodromos)
+
+def create_distance_col(df: pd.DataFrame, aerodromos: pd.DataFrame | AirportRegistry) -> pd.DataFrame:
+    """
+    Insere a coluna "Distância (m)" no DataFrame de voos, consultando a matriz
+    de distâncias pré-calculada do registro de aeródromos pelos ids dos
+    aeródromos de origem e destino, sem merges nem colunas auxiliares de
+    latitude e longitude.
 
     Parâmetros
     ----------
     df : pandas.DataFrame
         - DataFrame contendo os dados de voos.
+    aerodromos : pandas.DataFrame | AirportRegistry
+        - DataFrame de aeródromos ou registro já construído por
+        `build_airport_registry`.
 
     Retorna
     -------
     pandas.DataFrame
-        - DataFrame com a coluna "Distância (m)" inserida e colunas
-        auxiliares removidas.
+        - DataFrame com a coluna "Distância (m)" inserida.
     """
-    df = merge_aerodromos(df, aerodromos, "origem")
-    df = merge_aerodromos(df, aerodromos, "destino")
+    registry = get_airport_registry(aerodromos)
 
-    distances = haversine(
-        df["lat_origem"],
-        df["lon_origem"],
-        df["lat_destino"],
-        df["lon_destino"]
+    distances = registry.distance(
+        registry.ids(df["Aeródromo Origem"]),
+        registry.ids(df["Aeródromo Destino"])
     )
 
+    df = df.reset_index(drop=True)
+
     # Insere a coluna "Distância (km)" logo após a coluna "Aeródromo Destino"
     pos = df.columns.get_loc("Aeródromo Destino") + 1 # type: ignore
     df.insert(pos, "Distância (m)", distances) # type: ignore
 
-    df = df.drop(columns=["lat_origem", "lon_origem", "lat_destino", "lon_destino"])
-
     return df
 
 def create_y_col(df: pd.DataFrame) -> pd.DataFrame:
@@ -129,17 +240,63 @@ def create_y_col(df: pd.DataFrame) -> pd.DataFrame:
 
     return df
 
-def clean_df(df: pd.DataFrame, aerodromos: pd.DataFrame, columns: list) -> pd.DataFrame:
+def flight_mask(df: pd.DataFrame, aerodromos: pd.DataFrame | AirportRegistry) -> np.ndarray:
+    """
+    Calcula, em uma única passada, a máscara dos voos mantidos por `clean_df`.
+
+    Apenas as colunas envolvidas nos filtros são lidas, e nenhuma cópia do
+    DataFrame é feita.
+
+    Parâmetros
+    ----------
+    df : pandas.DataFrame
+        - DataFrame com as colunas "Situação Voo", "Aeródromo Origem",
+        "Aeródromo Destino", "Código Autorização (DI)", "Código Tipo Linha",
+        "Partida Prevista" e "Partida Real".
+    aerodromos : pandas.DataFrame | AirportRegistry
+        - DataFrame com os aeródromos válidos ou registro já construído.
+
+    Retorna
+    -------
+    numpy.ndarray
+        - Máscara booleana das linhas válidas.
+    """
+    registry = get_airport_registry(aerodromos)
+
+    # Voos realizados
+    mask = (df["Situação Voo"] == "REALIZADO").to_numpy()
+
+    # "Aeródromo Origem" e "Aeródromo Destino" presentes na lista de aeródromos da ANAC
+    mask &= registry.contains(df["Aeródromo Origem"])
+    mask &= registry.contains(df["Aeródromo Destino"])
+
+    # Voos regulares
+    mask &= (df["Código Autorização (DI)"] == "0").to_numpy()
+
+    # Tipos de linhas de voo (valores nulos não pertencem à lista)
+    mask &= df["Código Tipo Linha"].isin(["N", "R", "H"]).to_numpy()
+
+    # Sem NaN nas colunas "Partida Prevista" e "Partida Real"
+    mask &= df["Partida Prevista"].notna().to_numpy()
+    mask &= df["Partida Real"].notna().to_numpy()
+
+    return mask
+
+def clean_df(df: pd.DataFrame, aerodromos: pd.DataFrame | AirportRegistry, columns: list) -> pd.DataFrame:
     """
     Realiza a limpeza e filtragem do DataFrame de voos conforme critérios
     específicos, incluindo a remoção de voos cancelados.
 
+    Todos os filtros são combinados em uma única máscara (ver `flight_mask`)
+    e o DataFrame é fatiado uma única vez, já com as colunas desejadas.
+
     Parâmetros
     ----------
     df : pandas.DataFrame
         - DataFrame contendo os dados brutos de voos.
-    aerodromos : pandas.DataFrame
-        - DataFrame com os aeródromos válidos, contendo o código OACI.
+    aerodromos : pandas.DataFrame | AirportRegistry
+        - DataFrame com os aeródromos válidos, contendo o código OACI, ou
+        registro já construído por `build_airport_registry`.
     columns : list
         - Lista de colunas a serem mantidas no DataFrame final.
 
@@ -149,23 +306,4 @@ def clean_df(df: pd.DataFrame, aerodromos: pd.DataFrame, columns: list) -> pd.Da
         - DataFrame de voos filtrado e contendo apenas as colunas
         especificadas.
     """
-    # Remove voos cancelados
-    df = df[df["Situação Voo"] == "REALIZADO"]
-
-    # Remove os voos cujos "Aeródromo Origem" ou "Aeródromo Destino" não estejam na lista de aeródromos da ANAC 
-    df = df[df["Aeródromo Origem"].isin(aerodromos["Código OACI"])]
-    df = df[df["Aeródromo Destino"].isin(aerodromos["Código OACI"])]
-
-    # Mantém apenas os voos regulares
-    df = df[df["Código Autorização (DI)"] == "0"]
-
-    # Filtra os tipos de linhas de voo
-    df = df[df["Código Tipo Linha"].isin(["N", "R", "H"])]
-
-    # Remove NaN das colunas "Partida Prevista" e "Partida Real"
-    df = df.dropna(subset=["Partida Prevista", "Partida Real", "Código Tipo Linha"])
-
-    # Mantém apenas as colunas desejadas
-    df = df[columns]
-
-    return df
\ No newline at end of file
+    return df.loc[flight_mask(df, aerodromos), columns]
@@ -0,0 +1,248 @@
+import os
+import json
+import uuid
+import shutil
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from dataclasses import dataclass
+from typing import Iterator
+
+from helpers.categories import CATEGORICAL_COLUMNS, categories_path, category_codes, load_categories, save_categories
+from helpers.calendar_features import time_parts
+
+# Metadados do feature store (quantidade de linhas e tipo de cada array)
+FEATURE_STORE_META_FILENAME = "_meta.json"
+FEATURE_STORE_VERSION = 1
+
+# Arrays do feature store: coluna de origem no dataset e tipo gravado
+FEATURE_ARRAYS = {
+    "companhia": ("Empresa Aérea", None),       # códigos dos dicionários globais
+    "origem": ("Aeródromo Origem", None),
+    "destino": ("Aeródromo Destino", None),
+    "distancia_m": ("Distância (m)", "int32"),
+    "partida_epoch": ("Data Hora Voo", "int64"),  # segundos desde 1970-01-01
+    "hora": ("Data Hora Voo", "int8"),
+    "dia_semana": ("Data Hora Voo", "int8"),      # 0 = segunda-feira
+    "mes": ("Data Hora Voo", "int8"),
+    "dia_ano": ("Data Hora Voo", "int16"),
+    "atrasado": ("Atrasado", "int8"),
+}
+
+@dataclass(frozen=True)
+class FeatureStore:
+    """
+    Feature store numérico do dataset de voos, com um array `.npy` contíguo
+    por feature, aberto (por padrão) como memory map: abrir o store apenas
+    mapeia os arquivos, e processos paralelos que leem o mesmo store
+    compartilham as páginas em cache do sistema operacional.
+
+    Atributos
+    ---------
+    path : str
+        - Diretório do feature store.
+    arrays : dict[str, numpy.ndarray]
+        - Arrays de `FEATURE_ARRAYS` (`numpy.memmap` quando abertos com
+        `mmap_mode`).
+    categories : dict
+        - Dicionários categóricos globais (ver `helpers.categories`); o código
+        de cada valor é sua posição no dicionário, e -1 indica valor nulo.
+    """
+    path: str
+    arrays: dict
+    categories: dict
+
+    def __len__(self) -> int:
+        return len(next(iter(self.arrays.values())))
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.arrays[name]
+
+    def to_frame(self, columns: list | None = None, include_time_parts: bool = False) -> pd.DataFrame:
+        """
+        Reconstrói o DataFrame no formato de `carregar_dados` (categóricas com
+        os tipos fixos dos dicionários, "Data Hora Voo" como datetime).
+
+        Parâmetros
+        ----------
+        columns : list, opcional
+            - Colunas do dataset a serem reconstruídas. Se None, todas.
+        include_time_parts : bool, opcional
+            - Se True, acrescenta as partes de data pré-calculadas ("hora",
+            "dia_semana", "mes" e "dia_ano").
+
+        Retorna
+        -------
+        pandas.DataFrame
+            - DataFrame com as colunas pedidas.
+        """
+        df = {}
+        for name, (col, _) in FEATURE_ARRAYS.items():
+            if col in df or (columns is not None and col not in columns):
+                continue
+            values = self.arrays[name]
+            if col in CATEGORICAL_COLUMNS:
+                df[col] = pd.Categorical.from_codes(values, categories=self.categories[CATEGORICAL_COLUMNS[col]])
+            elif name == "partida_epoch":
+                df[col] = pd.to_datetime(np.asarray(values).astype("datetime64[s]").astype("datetime64[ns]"))
+            else:
+                df[col] = np.asarray(values)
+
+        if include_time_parts:
+            for name in ["hora", "dia_semana", "mes", "dia_ano"]:
+                df[name] = np.asarray(self.arrays[name])
+
+        return pd.DataFrame(df)
+
+def _iter_batches(source: pd.DataFrame | str, batch_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Lotes do dataset, a partir de um DataFrame ou de um arquivo Parquet (lido
+    lote a lote, sem carregar o arquivo inteiro).
+    """
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), batch_size):
+            yield source.iloc[start:start + batch_size]
+        return
+
+    columns = list(dict.fromkeys(col for col, _ in FEATURE_ARRAYS.values()))
+    for batch in pq.ParquetFile(source).iter_batches(batch_size=batch_size, columns=columns):
+        yield batch.to_pandas()
+
+def _num_rows(source: pd.DataFrame | str) -> int:
+    if isinstance(source, pd.DataFrame):
+        return len(source)
+    return pq.ParquetFile(source).metadata.num_rows
+
+def write_feature_store(
+    source: pd.DataFrame | str,
+    path: str,
+    categories: dict,
+    batch_size: int = 1_000_000
+) -> FeatureStore:
+    """
+    Grava o feature store numérico de um dataset de voos: um array `.npy`
+    contíguo por feature de `FEATURE_ARRAYS` e os dicionários categóricos.
+
+    Os arrays são pré-alocados com o tamanho final e preenchidos lote a lote,
+    de modo que o uso de memória fica limitado ao lote mesmo para um arquivo
+    Parquet muito grande. O diretório é escrito em um temporário e renomeado
+    ao final, de forma atômica.
+
+    Parâmetros
+    ----------
+    source : pandas.DataFrame | str
+        - Dataset (formato de `preprocess_csvs`) ou caminho do Parquet.
+    path : str
+        - Diretório do feature store.
+    categories : dict
+        - Dicionários categóricos globais, já completos com todos os valores
+        do dataset (ver `helpers.categories`).
+    batch_size : int, opcional
+        - Linhas convertidas por vez.
+
+    Retorna
+    -------
+    FeatureStore
+        - Feature store gravado, aberto como memory map.
+
+    Exceções
+    --------
+    ValueError
+        - Lançada quando algum valor categórico não consta nos dicionários.
+    """
+    n_rows = _num_rows(source)
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    tmp_path = os.path.join(parent, f".{uuid.uuid4().hex}.features.tmp")
+    os.makedirs(tmp_path)
+
+    try:
+        # Códigos em int16 enquanto os dicionários couberem
+        dtypes = {}
+        for name, (col, dtype) in FEATURE_ARRAYS.items():
+            if dtype is None:
+                size = len(categories[CATEGORICAL_COLUMNS[col]])
+                dtype = "int16" if size < np.iinfo("int16").max else "int32"
+            dtypes[name] = dtype
+
+        arrays = {
+            name: np.lib.format.open_memmap(os.path.join(tmp_path, f"{name}.npy"), mode="w+", dtype=dtype, shape=(n_rows,))
+            for name, dtype in dtypes.items()
+        }
+
+        start = 0
+        for batch in _iter_batches(source, batch_size):
+            end = start + len(batch)
+            values = time_parts(batch["Data Hora Voo"])
+            for name, (col, _) in FEATURE_ARRAYS.items():
+                if col in CATEGORICAL_COLUMNS:
+                    codes = category_codes(batch[col], categories[CATEGORICAL_COLUMNS[col]])
+                    if ((codes < 0) & batch[col].notna().to_numpy()).any():
+                        raise ValueError(f"Valores de {col} ausentes dos dicionários categóricos.")
+                    values[name] = codes
+                elif name not in values:
+                    values[name] = batch[col].to_numpy()
+                arrays[name][start:end] = values[name]
+            start = end
+
+        for array in arrays.values():
+            array.flush()
+        del arrays
+
+        save_categories(categories, categories_path(tmp_path))
+        meta = {"versao": FEATURE_STORE_VERSION, "linhas": n_rows, "arrays": dtypes}
+        with open(os.path.join(tmp_path, FEATURE_STORE_META_FILENAME), "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+
+        # Substitui o store anterior, se houver
+        if os.path.exists(path):
+            old_path = f"{tmp_path}.old"
+            os.replace(path, old_path)
+            os.replace(tmp_path, path)
+            shutil.rmtree(old_path)
+        else:
+            os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            shutil.rmtree(tmp_path)
+
+    return load_feature_store(path)
+
+def load_feature_store(path: str, columns: list | None = None, mmap_mode: str | None = "r") -> FeatureStore:
+    """
+    Abre um feature store gravado por `write_feature_store`.
+
+    Parâmetros
+    ----------
+    path : str
+        - Diretório do feature store.
+    columns : list, opcional
+        - Arrays de `FEATURE_ARRAYS` a serem abertos. Se None, todos.
+    mmap_mode : str | None, opcional
+        - Modo do memory map ("r" por padrão, somente leitura). Se None, os
+        arrays são lidos inteiros para a memória.
+
+    Retorna
+    -------
+    FeatureStore
+        - Feature store aberto.
+
+    Exceções
+    --------
+    FileNotFoundError
+        - Lançada quando o diretório não contém um feature store.
+    """
+    meta_path = os.path.join(path, FEATURE_STORE_META_FILENAME)
+    if not os.path.exists(meta_path):
+        raise FileNotFoundError(f"Feature store não encontrado em: {path}")
+
+    with open(meta_path, "r", encoding="utf-8") as f:
+        meta = json.load(f)
+
+    arrays = {
+        name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+        for name in meta["arrays"]
+        if columns is None or name in columns
+    }
+
+    return FeatureStore(path=path, arrays=arrays, categories=load_categories(categories_path(path)))
@@ -1,49 +1,139 @@
-def get_urls() -> list:
+import urllib.error
+import urllib.request
+from datetime import date
+
+URL_BASE = "https://sistemas.anac.gov.br/dadosabertos/Voos%20e%20opera%C3%A7%C3%B5es%20a%C3%A9reas/Voo%20Regular%20Ativo%20%28VRA%29"
+
+MESES = {
+    1:  "01%20-%20Janeiro",
+    2:  "02%20-%20Fevereiro",
+    3:  "03%20-%20Mar%C3%A7o",
+    4:  "04%20-%20Abril",
+    5:  "05%20-%20Maio",
+    6:  "06%20-%20Junho",
+    7:  "07%20-%20Julho",
+    8:  "08%20-%20Agosto",
+    9:  "09%20-%20Setembro",
+    10: "10%20-%20Outubro",
+    11: "11%20-%20Novembro",
+    12: "12%20-%20Dezembro"
+}
+
+def build_url(ano: int, mes: int) -> str:
+    """
+    Monta a URL do arquivo CSV do VRA de um determinado ano e mês.
+
+    Parâmetros
+    ----------
+    ano : int
+        - Ano do arquivo.
+    mes : int
+        - Mês do arquivo (1 a 12).
+
+    Retorna
+    -------
+    str
+        - URL no formato https://.../ANO/MM - Mês/VRA_ANOMM.csv
     """
-    Gera a lista completa de URLs dos arquivos CSV do conjunto 
+    return f"{URL_BASE}/{ano}/{MESES[mes]}/VRA_{ano}{mes}.csv"
+
+def url_exists(url: str, timeout: float = 10) -> bool:
+    """
+    Verifica se um arquivo está disponível no servidor, sem baixá-lo.
+
+    Tenta uma requisição HEAD e, caso o servidor não a suporte, uma
+    requisição GET limitada ao primeiro byte.
+
+    Parâmetros
+    ----------
+    url : str
+        - URL a ser verificada.
+    timeout : float, opcional
+        - Tempo máximo, em segundos, de espera por resposta do servidor.
+
+    Retorna
+    -------
+    bool
+        - True se o servidor responde com sucesso para a URL.
+    """
+    requests = [
+        urllib.request.Request(url, method="HEAD"),
+        urllib.request.Request(url, headers={"Range": "bytes=0-0"}),
+    ]
+    for request in requests:
+        try:
+            with urllib.request.urlopen(request, timeout=timeout):
+                return True
+        except urllib.error.HTTPError as e:
+            if e.code in (404, 410):
+                return False
+        except OSError:
+            return False
+    return False
+
+def get_urls(
+    ano_inicio: int = 2018,
+    ate: tuple[int, int] | None = (2025, 10),
+    descobrir: bool = False,
+    max_meses_ausentes: int = 6
+) -> list:
+    """
+    Gera a lista completa de URLs dos arquivos CSV do conjunto
     “Voo Regular Ativo (VRA)” disponibilizado pela ANAC.
 
-    A função constrói dinamicamente os caminhos de acesso aos arquivos 
-    organizados por ano e mês, conforme a estrutura oficial do portal de 
-    dados abertos da ANAC. São consideradas todas as combinações entre os anos 
-    de 2000 a 2025 e os 12 meses do ano, com exceção dos meses posteriores a 
-    outubro de 2025, pois esses arquivos ainda não estão disponíveis.
+    A função constrói dinamicamente os caminhos de acesso aos arquivos
+    organizados por ano e mês, conforme a estrutura oficial do portal de
+    dados abertos da ANAC. Por padrão, são consideradas todas as combinações
+    entre os anos de 2018 a 2025 e os 12 meses do ano, com exceção dos meses
+    posteriores a outubro de 2025.
+
+    Com `descobrir=True`, o último mês não é fixo: a função consulta o
+    servidor a partir do mês atual, retrocedendo até encontrar o arquivo
+    mais recente publicado, de modo que novos meses passam a ser incluídos
+    automaticamente.
 
     Para cada combinação válida, é gerada a URL correspondente no formato:
         https://.../ANO/MM - Mês/VRA_ANOMM.csv
 
     Retorna uma lista contendo todas as URLs resultantes, na ordem cronológica.
 
+    Parâmetros
+    ----------
+    ano_inicio : int, opcional
+        - Primeiro ano considerado. Padrão é 2018.
+    ate : tuple[int, int] | None, opcional
+        - Último (ano, mês) considerado. Padrão é (2025, 10). Se None, usa
+        o mês atual.
+    descobrir : bool, opcional
+        - Se True, ignora `ate` e descobre no servidor o último mês publicado.
+    max_meses_ausentes : int, opcional
+        - Quantidade máxima de meses, a partir do mês atual, consultados ao
+        descobrir o último mês publicado. Se nenhum estiver disponível, usa
+        `ate` (ou o mês atual, se None).
+
     Retorno
     -------
     list
         Lista de strings contendo as URLs completas dos arquivos CSV do VRA.
     """
+    hoje = date.today()
+    ultimo = ate if ate is not None else (hoje.year, hoje.month)
 
-    url_base = "https://sistemas.anac.gov.br/dadosabertos/Voos%20e%20opera%C3%A7%C3%B5es%20a%C3%A9reas/Voo%20Regular%20Ativo%20%28VRA%29"
-    anos = list(range(2018, 2026))
-    meses = {
-        1:  "01%20-%20Janeiro",
-        2:  "02%20-%20Fevereiro",
-        3:  "03%20-%20Mar%C3%A7o",
-        4:  "04%20-%20Abril",
-        5:  "05%20-%20Maio",
-        6:  "06%20-%20Junho",
-        7:  "07%20-%20Julho",
-        8:  "08%20-%20Agosto",
-        9:  "09%20-%20Setembro",
-        10: "10%20-%20Outubro",
-        11: "11%20-%20Novembro",
-        12: "12%20-%20Dezembro"
-    }
+    if descobrir:
+        ano, mes = hoje.year, hoje.month
+        for _ in range(max_meses_ausentes + 1):
+            if url_exists(build_url(ano, mes)):
+                ultimo = (ano, mes)
+                break
+            ano, mes = (ano, mes - 1) if mes > 1 else (ano - 1, 12)
 
     urls = []
 
-    for ano in anos:
-        for mes in meses.items():
-            if ano == 2025 and mes[0] > 10:
+    for ano in range(ano_inicio, ultimo[0] + 1):
+        for mes in MESES:
+            if (ano, mes) > ultimo:
                 continue
-            url = f"{url_base}/{ano}/{mes[1]}/VRA_{ano}{mes[0]}.csv"
+            url = build_url(ano, mes)
             urls.append(url)
-    
-    return urls
\ No newline at end of file
+
+    return urls
@@ -0,0 +1,331 @@
+import os
+import re
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from datetime import datetime, timezone
+
+from etl.save_df import write_parquet
+from etl.download_csvs import iter_downloads, url_filename
+from etl.raw_cache import fetch_cached
+from etl.preprocess_csvs import read_raw_csv, transform_df
+from etl.feature_engeneering import get_airport_registry
+from helpers.categories import CATEGORICAL_COLUMNS, update_categories
+from helpers.manifest import load_manifest, save_manifest
+from helpers.partitions import list_partitions
+
+# Manifesto do dataset particionado (arquivos iniciados por "_" são ignorados
+# pelos leitores de datasets Parquet)
+DATASET_MANIFEST_FILENAME = "_manifest.json"
+
+def url_partition(url: str) -> tuple[int, int]:
+    """
+    Obtém o ano e o mês de referência de um arquivo do VRA a partir da URL.
+
+    Parâmetros
+    ----------
+    url : str
+        - URL (ou caminho) de um arquivo no formato VRA_ANOMM.csv.
+
+    Retorna
+    -------
+    tuple[int, int]
+        - Tupla (ano, mês).
+
+    Exceções
+    --------
+    ValueError
+        - Lançada quando o nome do arquivo não segue o padrão do VRA.
+    """
+    match = re.fullmatch(r"VRA_(\d{4})(\d{1,2})\.csv", url_filename(url))
+    if match is None:
+        raise ValueError(f"Nome de arquivo fora do padrão VRA_ANOMM.csv: {url}")
+    return int(match.group(1)), int(match.group(2))
+
+def partition_path(dataset_dir: str, ano: int, mes: int) -> str:
+    """
+    Monta o caminho do arquivo Parquet de uma partição ano/mês.
+
+    Parâmetros
+    ----------
+    dataset_dir : str
+        - Diretório raiz do dataset particionado.
+    ano : int
+        - Ano da partição.
+    mes : int
+        - Mês da partição.
+
+    Retorna
+    -------
+    str
+        - Caminho no formato <dataset_dir>/ano=AAAA/mes=MM/part-0.parquet
+    """
+    return os.path.join(dataset_dir, f"ano={ano}", f"mes={mes:02d}", "part-0.parquet")
+
+def write_partition(df: pd.DataFrame, dataset_dir: str, ano: int, mes: int) -> str:
+    """
+    Grava (ou substitui) a partição ano/mês do dataset de forma atômica.
+
+    O DataFrame é gravado em um arquivo temporário no mesmo diretório da
+    partição e depois renomeado sobre o arquivo final, de modo que leitores
+    concorrentes nunca enxergam uma partição parcialmente escrita.
+
+    Parâmetros
+    ----------
+    df : pandas.DataFrame
+        - Dados do mês.
+    dataset_dir : str
+        - Diretório raiz do dataset particionado.
+    ano : int
+        - Ano da partição.
+    mes : int
+        - Mês da partição.
+
+    Retorna
+    -------
+    str
+        - Caminho do arquivo da partição.
+    """
+    return write_parquet(df, partition_path(dataset_dir, ano, mes))
+
+def build_filters(
+    inicio=None,
+    fim=None,
+    empresas: list | None = None,
+    origens: list | None = None,
+    destinos: list | None = None
+) -> pc.Expression | None:
+    """
+    Monta o filtro de linhas repassado aos leitores Parquet, que descartam
+    row groups inteiros pelas estatísticas (mín./máx.) de cada coluna.
+
+    Parâmetros
+    ----------
+    inicio : str | datetime, opcional
+        - Menor "Data Hora Voo" incluída.
+    fim : str | datetime, opcional
+        - Limite superior (exclusivo) de "Data Hora Voo".
+    empresas : list, opcional
+        - Empresas aéreas mantidas.
+    origens : list, opcional
+        - Aeródromos de origem mantidos.
+    destinos : list, opcional
+        - Aeródromos de destino mantidos.
+
+    Retorna
+    -------
+    pyarrow.compute.Expression | None
+        - Filtro combinando todas as condições informadas, ou None.
+    """
+    conditions = []
+    if inicio is not None:
+        conditions.append(pc.field("Data Hora Voo") >= pd.Timestamp(inicio))
+    if fim is not None:
+        conditions.append(pc.field("Data Hora Voo") < pd.Timestamp(fim))
+    for col, values in zip(CATEGORICAL_COLUMNS, [empresas, origens, destinos]):
+        if values is not None:
+            conditions.append(pc.field(col).isin(list(values)))
+
+    if not conditions:
+        return None
+
+    filters = conditions[0]
+    for condition in conditions[1:]:
+        filters = filters & condition
+    return filters
+
+def partition_in_range(path: str, inicio=None, fim=None) -> bool:
+    """
+    Verifica se uma partição ano/mês pode conter voos entre `inicio` e `fim`.
+
+    A comparação usa um mês de folga em cada extremo, pois um arquivo mensal
+    do VRA pode conter voos previstos na virada do mês.
+
+    Parâmetros
+    ----------
+    path : str
+        - Caminho do arquivo da partição.
+    inicio, fim : str | datetime, opcional
+        - Intervalo de "Data Hora Voo" (ver `build_filters`).
+
+    Retorna
+    -------
+    bool
+        - False apenas quando a partição está fora do intervalo.
+    """
+    match = re.search(r"ano=(\d{4})[\\/]mes=(\d{2})", path)
+    if match is None:
+        return True
+
+    mes = pd.Period(year=int(match.group(1)), month=int(match.group(2)), freq="M")
+    if inicio is not None and mes < pd.Timestamp(inicio).to_period("M") - 1:
+        return False
+    if fim is not None and mes > pd.Timestamp(fim).to_period("M") + 1:
+        return False
+    return True
+
+def read_partitioned_dataset(
+    dataset_dir: str,
+    columns: list | None = None,
+    filters: pc.Expression | None = None,
+    inicio=None,
+    fim=None
+) -> pd.DataFrame:
+    """
+    Lê as partições do dataset como um único DataFrame, em ordem
+    cronológica.
+
+    As partições fora do intervalo `inicio`/`fim` nem são abertas, e
+    `filters` é aplicado durante a leitura de cada partição, descartando
+    row groups pelas estatísticas. As colunas categóricas são lidas
+    diretamente como dicionários, preservando o tipo category.
+
+    As colunas de partição (ano/mês) não são incluídas no resultado.
+
+    Parâmetros
+    ----------
+    dataset_dir : str
+        - Diretório raiz do dataset particionado.
+    columns : list, opcional
+        - Subconjunto de colunas a serem lidas.
+    filters : pyarrow.compute.Expression, opcional
+        - Filtro de linhas (ver `build_filters`).
+    inicio, fim : str | datetime, opcional
+        - Intervalo de "Data Hora Voo" usado para descartar partições.
+
+    Retorna
+    -------
+    pandas.DataFrame
+        - Dataset consolidado.
+
+    Exceções
+    --------
+    FileNotFoundError
+        - Lançada quando o diretório não contém partições.
+    """
+    partitions = list_partitions(dataset_dir)
+    if not partitions:
+        raise FileNotFoundError(f"Nenhuma partição encontrada em {dataset_dir}")
+
+    read_dictionary = [col for col in CATEGORICAL_COLUMNS if columns is None or col in columns]
+    tables = [
+        pq.read_table(path, columns=columns, filters=filters, read_dictionary=read_dictionary)
+        for path in partitions
+        if partition_in_range(path, inicio, fim)
+    ]
+    if not tables:
+        schema = pq.read_schema(partitions[0])
+        tables = [schema.empty_table().select(columns) if columns is not None else schema.empty_table()]
+
+    return pa.concat_tables(tables).to_pandas()
+
+def update_partitioned_dataset(
+    urls: list,
+    aerodromos: pd.DataFrame,
+    dataset_dir: str,
+    cache_dir: str,
+    max_workers: int = 4,
+    revalidate: bool = True,
+    force: bool = False,
+    categories: dict | None = None
+) -> list[tuple[int, int]]:
+    """
+    Atualiza incrementalmente o dataset particionado por ano/mês.
+
+    Os CSVs são obtidos pelo cache local de arquivos brutos (ver
+    `etl.raw_cache`), e apenas os meses cujo arquivo bruto é novo ou mudou
+    (checksum diferente do registrado no manifesto do dataset) são
+    reprocessados e regravados como partições. Os demais meses não são lidos.
+
+    Parâmetros
+    ----------
+    urls : list
+        - Lista de URLs dos arquivos CSV.
+    aerodromos : pandas.DataFrame
+        - DataFrame contendo informações sobre aeródromos da ANAC.
+    dataset_dir : str
+        - Diretório raiz do dataset particionado.
+    cache_dir : str
+        - Diretório do cache local de CSVs brutos.
+    max_workers : int, opcional
+        - Limite de downloads simultâneos.
+    revalidate : bool, opcional
+        - Se True, revalida no servidor os arquivos já presentes no cache.
+    force : bool, opcional
+        - Se True, reprocessa todos os meses.
+    categories : dict, opcional
+        - Dicionários categóricos globais (ver `helpers.categories`),
+        completados no próprio objeto com as empresas e aeródromos dos meses
+        reprocessados. Como os dicionários só crescem, continuam cobrindo os
+        meses gravados em execuções anteriores.
+
+    Retorna
+    -------
+    list[tuple[int, int]]
+        - Lista de partições (ano, mês) gravadas.
+    """
+    aerodromos = get_airport_registry(aerodromos)
+    raw_manifest = load_manifest(cache_dir)
+    dataset_manifest = load_manifest(dataset_dir, filename=DATASET_MANIFEST_FILENAME)
+    updated = []
+
+    print(f"Verificando {len(urls)} arquivos CSV para atualização incremental...\n")
+
+    sources = iter_downloads(
+        urls,
+        cache_dir,
+        max_workers=max_workers,
+        download=fetch_cached,
+        manifest=raw_manifest,
+        revalidate=revalidate
+    )
+
+    for url, path, error in sources:
+        ano, mes = url_partition(url)
+        key = f"ano={ano}/mes={mes:02d}"
+
+        if error is not None:
+            print(f"❌ Falha ao baixar {url}\nErro: {error}")
+            continue
+
+        sha256 = raw_manifest[url]["sha256"]
+        entry = dataset_manifest.get(key)
+        if (
+            not force
+            and entry is not None
+            and entry.get("source_sha256") == sha256
+            and os.path.exists(partition_path(dataset_dir, ano, mes))
+        ):
+            continue
+
+        print(f"[{key}] Processando: {url_filename(url)}")
+
+        try:
+            df = read_raw_csv(path)
+        except Exception as e:
+            print(f"❌ Falha ao ler {url}\nErro: {e}")
+            continue
+
+        if df.empty:
+            print(f"⚠️ CSV vazio em {url}, ignorando.")
+            continue
+
+        df = transform_df(df, aerodromos=aerodromos)
+        write_partition(df, dataset_dir, ano, mes)
+        if categories is not None:
+            update_categories(categories, df)
+
+        dataset_manifest[key] = {
+            "source_url": url,
+            "source_sha256": sha256,
+            "rows": int(df.shape[0]),
+            "written_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+        save_manifest(dataset_dir, dataset_manifest, filename=DATASET_MANIFEST_FILENAME)
+        updated.append((ano, mes))
+        print(f"✔ {df.shape[0]} linhas gravadas.\n")
+
+    print(f"\n🏁 Finalizado. {len(updated)} partições atualizadas.\n")
+
+    return updated
@@ -1,14 +1,414 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+from collections import deque
+from typing import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from helpers.parsers import parse_categoricals, parse_datetime, parse_int
-from etl.feature_engeneering import clean_df, create_distance_col, create_y_col
+from helpers.categories import build_categories, update_categories
+from etl.download_csvs import iter_downloads
+from etl.raw_cache import fetch_cached
+from helpers.manifest import load_manifest
+from etl.feature_engeneering import AirportRegistry, clean_df, create_distance_col, create_y_col, flight_mask, get_airport_registry
+from etl.profiler import EtlProfiler, iter_profiled, profile_stage
 
-def preprocess_csvs(urls: list, aerodromos: pd.DataFrame) -> pd.DataFrame:
+# Colunas do CSV original disponibilizado pela ANAC
+RAW_COLUMNS = [
+    "Empresa Aérea",
+    "Número Voo",
+    "Código Autorização (DI)",
+    "Código Tipo Linha",
+    "Aeródromo Origem",
+    "Aeródromo Destino",
+    "Partida Prevista",
+    "Partida Real",
+    "Chegada Prevista",
+    "Chegada Real",
+    "Situação Voo",
+    "Código Justificativa"
+]
+
+# Colunas desejadas
+COLUMNS = [
+    "Empresa Aérea",
+    "Aeródromo Origem",
+    "Aeródromo Destino",
+    "Partida Prevista",
+    "Partida Real",
+]
+
+# Colunas usadas apenas nos filtros de `clean_df`
+FILTER_COLUMNS = [
+    "Código Autorização (DI)",
+    "Código Tipo Linha",
+    "Situação Voo",
+]
+
+# Colunas de filtro que o pandas converte para número quando todos os valores
+# do arquivo são numéricos, caso em que nenhum voo passa nos filtros de texto
+NUMERIC_INFERRED_COLUMNS = ["Código Autorização (DI)", "Código Tipo Linha"]
+
+def read_raw_csv(source: str) -> pd.DataFrame:
+    """
+    Lê um arquivo CSV bruto do VRA, ignorando as duas primeiras linhas
+    (“Atualizado em” e o cabeçalho original).
+
+    Parâmetros
+    ----------
+    source : str
+        - URL ou caminho local do arquivo CSV.
+
+    Retorna
+    -------
+    pandas.DataFrame
+        - DataFrame com as colunas de `RAW_COLUMNS`.
+    """
+    return pd.read_csv(
+        source,
+        sep=';',
+        quotechar='"',
+        skiprows=2,         # pula "Atualizado em" + header
+        header=None,
+        names=RAW_COLUMNS,
+        low_memory=False
+    )
+
+def read_filtered_csv(
+    source: str,
+    aerodromos: pd.DataFrame | AirportRegistry,
+    chunksize: int = 250_000
+) -> tuple[pd.DataFrame, int]:
+    """
+    Lê um arquivo CSV bruto do VRA aplicando os filtros de `clean_df`
+    durante a leitura, com resultado idêntico a
+    `clean_df(read_raw_csv(source), aerodromos, COLUMNS)`.
+
+    O arquivo é lido em blocos, apenas com as colunas de `COLUMNS` e
+    `FILTER_COLUMNS` e como texto, e cada bloco é reduzido às linhas válidas
+    (ver `flight_mask`) antes do próximo, de modo que as linhas descartadas
+    nunca se acumulam em memória.
+
+    Parâmetros
+    ----------
+    source : str
+        - URL ou caminho local do arquivo CSV.
+    aerodromos : pandas.DataFrame | AirportRegistry
+        - DataFrame de aeródromos ou registro já construído.
+    chunksize : int, opcional
+        - Quantidade de linhas por bloco.
+
+    Retorna
+    -------
+    tuple[pandas.DataFrame, int]
+        - Linhas válidas (colunas de `COLUMNS`) e quantidade de linhas lidas
+        do arquivo.
+
+    Observações
+    -----------
+    - Na leitura padrão, o pandas converte para número uma coluna de filtro
+      cujos valores no arquivo são todos numéricos, e nenhum voo passa no
+      filtro de texto. Para manter o resultado idêntico, o arquivo inteiro é
+      descartado nesse caso.
+    """
+    registry = get_airport_registry(aerodromos)
+    numeric = dict.fromkeys(NUMERIC_INFERRED_COLUMNS, True)
+    parts = []
+    lines = 0
+
+    chunks = pd.read_csv(
+        source,
+        sep=';',
+        quotechar='"',
+        skiprows=2,         # pula "Atualizado em" + header
+        header=None,
+        names=RAW_COLUMNS,
+        usecols=COLUMNS + FILTER_COLUMNS,
+        dtype=str,
+        chunksize=chunksize
+    )
+    for chunk in chunks:
+        lines += chunk.shape[0]
+        for col in NUMERIC_INFERRED_COLUMNS:
+            numeric[col] = numeric[col] and pd.to_numeric(chunk[col].dropna(), errors="coerce").notna().all()
+        parts.append(chunk.loc[flight_mask(chunk, registry), COLUMNS])
+
+    if not parts:
+        return pd.DataFrame(columns=COLUMNS), lines
+    if any(numeric.values()):
+        return parts[0].iloc[:0], lines
+
+    return pd.concat(parts), lines
+
+def transform_df(
+    df: pd.DataFrame,
+    aerodromos: pd.DataFrame | AirportRegistry,
+    filtered: bool = False,
+    profiler: EtlProfiler | None = None,
+    file: str | None = None
+) -> pd.DataFrame:
+    """
+    Aplica as etapas de limpeza, engenharia de features e tipagem a um
+    DataFrame bruto do VRA (um arquivo mensal).
+
+    Parâmetros
+    ----------
+    df : pandas.DataFrame
+        - DataFrame bruto lido por `read_raw_csv`.
+    aerodromos : pandas.DataFrame | AirportRegistry
+        - DataFrame contendo informações sobre aeródromos da ANAC ou registro
+        já construído por `build_airport_registry`.
+    filtered : bool, opcional
+        - Se True, `df` já foi filtrado na leitura (ver `read_filtered_csv`)
+        e a limpeza é ignorada.
+    profiler : EtlProfiler, opcional
+        - Se informado, registra cada etapa ("clean", "distance", "label" e
+        "typing") para o arquivo `file`.
+    file : str, opcional
+        - Arquivo registrado no `profiler`.
+
+    Retorna
+    -------
+    pandas.DataFrame
+        - DataFrame limpo, com as colunas "Distância (m)" e "Atrasado" e
+        tipagem otimizada.
+    """
+    aerodromos = get_airport_registry(aerodromos)
+
+    # Limpeza de dados
+    if not filtered:
+        with profile_stage(profiler, "clean", file, rows_in=df.shape[0]) as record:
+            df = clean_df(df, aerodromos=aerodromos, columns=COLUMNS)
+            record.rows_out = df.shape[0]
+
+    # Engenharia de Features
+    with profile_stage(profiler, "distance", file, rows_in=df.shape[0]) as record:
+        df = create_distance_col(df, aerodromos=aerodromos)
+        record.rows_out = df.shape[0]
+    with profile_stage(profiler, "label", file, rows_in=df.shape[0]) as record:
+        df = create_y_col(df)
+        record.rows_out = df.shape[0]
+
+    # Parsing de tipos de dados
+    with profile_stage(profiler, "typing", file, rows_in=df.shape[0]) as record:
+        df = parse_categoricals(df)
+        df = parse_datetime(df)
+        df = parse_int(df, col="Distância (m)", int_type='int32')
+        record.rows_out = df.shape[0]
+
+    return df
+
+def process_source(
+    url: str,
+    source: str | None,
+    error: Exception | None,
+    aerodromos: pd.DataFrame | AirportRegistry,
+    filter_on_read: bool = False,
+    profiler: EtlProfiler | None = None
+) -> tuple[pd.DataFrame | None, str | None]:
+    """
+    Lê e transforma um arquivo mensal do VRA (ver `read_raw_csv` e
+    `transform_df`).
+
+    Parâmetros
+    ----------
+    url : str
+        - URL do arquivo CSV (usada nas mensagens).
+    source : str | None
+        - URL ou caminho local de onde o arquivo será lido.
+    error : Exception | None
+        - Erro ocorrido no download do arquivo, se houver.
+    aerodromos : pandas.DataFrame
+        - DataFrame contendo informações sobre aeródromos da ANAC.
+    filter_on_read : bool, opcional
+        - Se True, os filtros são aplicados durante a leitura (ver
+        `read_filtered_csv`).
+    profiler : EtlProfiler, opcional
+        - Se informado, registra a leitura ("parse") e as etapas de
+        `transform_df`.
+
+    Retorna
+    -------
+    tuple[pandas.DataFrame | None, str | None]
+        - DataFrame processado e None, ou None e a mensagem de aviso quando o
+        arquivo não pôde ser baixado, lido ou está vazio.
+    """
+    if error is not None:
+        return None, f"❌ Falha ao baixar {url}\nErro: {error}"
+
+    try:
+        # Leitura do CSV bruto (já filtrado, com `filter_on_read`)
+        with profile_stage(profiler, "parse", url) as record:
+            if filter_on_read:
+                df, lines = read_filtered_csv(source, aerodromos)
+            else:
+                df = read_raw_csv(source)
+                lines = df.shape[0]
+            record.rows_in, record.rows_out = lines, df.shape[0]
+
+    except Exception as e:
+        return None, f"❌ Falha ao ler {url}\nErro: {e}"
+
+    if lines == 0:
+        return None, f"⚠️ CSV vazio em {url}, ignorando."
+
+    # Limpeza, engenharia de features e tipagem
+    return transform_df(df, aerodromos=aerodromos, filtered=filter_on_read, profiler=profiler, file=url), None
+
+# Aeródromos, modo de leitura e medição de cada processo do pool, definidos uma única vez por `_init_worker`
+_worker_aerodromos: AirportRegistry | None = None
+_worker_filter_on_read: bool = False
+_worker_profile: bool = False
+
+def _init_worker(aerodromos: AirportRegistry, filter_on_read: bool = False, profile: bool = False) -> None:
+    global _worker_aerodromos, _worker_filter_on_read, _worker_profile
+    _worker_aerodromos = aerodromos
+    _worker_filter_on_read = filter_on_read
+    _worker_profile = profile
+
+def _process_source_arrow(url: str, source: str) -> tuple[pa.Buffer | None, str | None, list]:
+    """
+    Executa `process_source` em um processo do pool e serializa o resultado
+    no formato Arrow IPC, evitando o pickle do DataFrame entre processos.
+    Também retorna os registros das etapas medidas no processo, se houver.
+    """
+    profiler = EtlProfiler() if _worker_profile else None
+    df, message = process_source(url, source, None, _worker_aerodromos, _worker_filter_on_read, profiler)
+    records = profiler.records if profiler is not None else []
+    if df is None:
+        return None, message, records
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    return sink.getvalue(), None, records
+
+def iter_processed(
+    sources: Iterator[tuple[str, str | None, Exception | None]],
+    aerodromos: pd.DataFrame | AirportRegistry,
+    n_workers: int = 1,
+    filter_on_read: bool = False,
+    profiler: EtlProfiler | None = None
+) -> Iterator[tuple[str, pd.DataFrame | None, str | None]]:
+    """
+    Processa os arquivos mensais, de forma sequencial ou em um pool de
+    processos, entregando os resultados na ordem cronológica das fontes.
+
+    Com `n_workers > 1`, cada arquivo é enviado a um processo do pool assim
+    que sua fonte fica disponível (ex.: ao fim do download), e os resultados
+    retornam no formato Arrow IPC, sendo convertidos de volta para DataFrame
+    no processo principal. O resultado é idêntico ao do modo sequencial.
+
+    Parâmetros
+    ----------
+    sources : Iterator[tuple[str, str | None, Exception | None]]
+        - Fontes dos arquivos, como geradas por `iter_sources`.
+    aerodromos : pandas.DataFrame
+        - DataFrame contendo informações sobre aeródromos da ANAC.
+    n_workers : int, opcional
+        - Quantidade de processos. Se 1 (padrão), processa sequencialmente.
+    filter_on_read : bool, opcional
+        - Se True, os filtros são aplicados durante a leitura (ver
+        `read_filtered_csv`).
+    profiler : EtlProfiler, opcional
+        - Se informado, recebe os registros das etapas de cada arquivo,
+        inclusive as medidas nos processos do pool.
+
+    Retorna
+    -------
+    Iterator[tuple[str, pandas.DataFrame | None, str | None]]
+        - Tuplas (url, DataFrame processado, mensagem de aviso).
+    """
+    # Registro de aeródromos construído uma única vez para todos os arquivos
+    aerodromos = get_airport_registry(aerodromos)
+
+    if n_workers <= 1:
+        for url, source, error in sources:
+            yield url, *process_source(url, source, error, aerodromos, filter_on_read, profiler)
+        return
+
+    def result(url: str, future) -> tuple[str, pd.DataFrame | None, str | None]:
+        buffer, message, records = future.result()
+        if profiler is not None:
+            profiler.extend(records)
+        if buffer is None:
+            return url, None, message
+        return url, pa.ipc.open_stream(buffer).read_all().to_pandas(), None
+
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker, initargs=(aerodromos, filter_on_read, profiler is not None)) as executor:
+        for url, source, error in sources:
+            if error is None:
+                future = executor.submit(_process_source_arrow, url, source)
+            else:
+                # Falhas de download são tratadas no processo principal
+                future = Future()
+                future.set_result((*process_source(url, source, error, aerodromos), []))
+            pending.append((url, future))
+
+            # Entrega, em ordem, os resultados já concluídos
+            while pending and pending[0][1].done():
+                yield result(*pending.popleft())
+
+        while pending:
+            yield result(*pending.popleft())
+
+def iter_sources(
+    urls: list,
+    download_dir: str | None = None,
+    max_workers: int = 4,
+    revalidate: bool = True
+) -> Iterator[tuple[str, str | None, Exception | None]]:
+    """
+    Gera as fontes de leitura dos CSVs, na ordem das URLs.
+
+    Parâmetros
+    ----------
+    urls : list
+        - Lista de URLs dos arquivos CSV.
+    download_dir : str, opcional
+        - Diretório do cache local de CSVs brutos. Se None, a própria URL é
+        usada como fonte.
+    max_workers : int, opcional
+        - Limite de downloads simultâneos.
+    revalidate : bool, opcional
+        - Se True, revalida no servidor os arquivos já presentes no cache.
+
+    Retorna
+    -------
+    Iterator[tuple[str, str | None, Exception | None]]
+        - Tuplas (url, fonte, erro), no mesmo formato de `iter_downloads`.
+    """
+    if download_dir is None:
+        return ((url, url, None) for url in urls)
+
+    return iter_downloads(
+        urls,
+        download_dir,
+        max_workers=max_workers,
+        download=fetch_cached,
+        manifest=load_manifest(download_dir),
+        revalidate=revalidate
+    )
+
+def preprocess_csvs(
+    urls: list,
+    aerodromos: pd.DataFrame,
+    download_dir: str | None = None,
+    max_workers: int = 4,
+    revalidate: bool = True,
+    n_workers: int = 1,
+    categories: dict | None = None,
+    engine: str = "pandas",
+    filter_on_read: bool = False,
+    profiler: EtlProfiler | None = None
+) -> pd.DataFrame:
     """
     Carrega, filtra e preprocessa múltiplos arquivos CSV do VRA (Voo Regular Ativo) 
     disponibilizados pela ANAC, retornando um único DataFrame consolidado.
 
-    Este procedimento realiza o download sequencial dos arquivos, aplica regras de ETL 
+    Este procedimento realiza o download dos arquivos, aplica regras de ETL 
     para limpeza e normalização dos dados e concatena os resultados em um DataFrame único. 
     Ao final, os dados retornados contêm apenas informações relevantes para análise de 
     voos realizados, com colunas categóricas otimizadas e datas convertidas para datetime.
@@ -29,6 +429,44 @@ def preprocess_csvs(urls: list, aerodromos: pd.DataFrame) -> pd.DataFrame:
         Lista contendo as URLs dos arquivos CSV a serem processados.
     aerodromos : pd.DataFrame
         DataFrame contendo informações sobre aeródromos da ANAC.
+    download_dir : str, opcional
+        Diretório do cache local de CSVs brutos (ver `etl.raw_cache`). Quando
+        informado, os downloads ocorrem de forma concorrente (ver
+        `etl.download_csvs.iter_downloads`), a leitura de cada arquivo se
+        sobrepõe ao download dos seguintes e apenas arquivos ausentes ou
+        modificados no servidor são baixados novamente. Se None (padrão), cada
+        CSV é lido diretamente da URL, de forma sequencial.
+    max_workers : int, opcional
+        Limite de downloads simultâneos quando `download_dir` é informado.
+    revalidate : bool, opcional
+        Se True (padrão), arquivos já presentes no cache são revalidados no
+        servidor com requisições condicionais (ETag/Last-Modified). Se False,
+        são usados sem nenhuma consulta à rede.
+    n_workers : int, opcional
+        Quantidade de processos usados nas etapas de limpeza, engenharia de
+        features e tipagem (ver `iter_processed`). Cada arquivo mensal é
+        processado por um processo do pool, e os resultados são reunidos na
+        ordem cronológica, idênticos ao modo sequencial. Padrão é 1.
+    categories : dict, opcional
+        Dicionários categóricos globais (ver `helpers.categories`). São
+        completados com as empresas e aeródromos observados (no próprio
+        objeto) e aplicados como tipos fixos a todos os meses antes da
+        concatenação, que assim preserva o tipo category sem unir categorias.
+        Se None, são construídos a partir de `aerodromos`.
+    engine : str, opcional
+        "pandas" (padrão) ou "pyarrow". Com "pyarrow", a leitura, os filtros
+        e a engenharia de features são feitos em Arrow (ver
+        `etl.arrow_engine.preprocess_csvs_arrow`), com resultado idêntico; o
+        leitor de CSV do Arrow já é multithread e `n_workers` é ignorado.
+    filter_on_read : bool, opcional
+        Se True, cada CSV é lido em blocos e os filtros de limpeza são
+        aplicados durante a leitura (ver `read_filtered_csv`), sem manter em
+        memória as linhas descartadas. O resultado é idêntico. Padrão é False.
+    profiler : EtlProfiler, opcional
+        Se informado, registra o tempo, o tempo de CPU, as linhas de entrada e
+        saída e o pico de memória de cada etapa ("download", "parse",
+        "clean", "distance", "label", "typing") de cada arquivo e da
+        concatenação final ("concat"). Ver `etl.profiler`.
 
     Retorno
     -------
@@ -42,36 +480,29 @@ def preprocess_csvs(urls: list, aerodromos: pd.DataFrame) -> pd.DataFrame:
       e uso de memória ao longo do processo.
     """
 
-    print(f"Iniciando o download e preprocessamento de {len(urls)} arquivos CSV...\n")
+    if engine == "pyarrow":
+        # Importado aqui: etl.arrow_engine depende deste módulo
+        from etl.arrow_engine import preprocess_csvs_arrow
+        return preprocess_csvs_arrow(
+            urls,
+            aerodromos,
+            download_dir=download_dir,
+            max_workers=max_workers,
+            revalidate=revalidate,
+            categories=categories,
+            profiler=profiler
+        )
+    if engine != "pandas":
+        raise ValueError(f"Engine inválido: {engine}. Use 'pandas' ou 'pyarrow'.")
 
-    # Colunas do CSV original disponibilizado pela ANAC
-    raw_columns = [
-        "Empresa Aérea",
-        "Número Voo",
-        "Código Autorização (DI)",
-        "Código Tipo Linha",
-        "Aeródromo Origem",
-        "Aeródromo Destino",
-        "Partida Prevista",
-        "Partida Real",
-        "Chegada Prevista",
-        "Chegada Real",
-        "Situação Voo",
-        "Código Justificativa"
-    ]
-
-    # Colunas desejadas
-    columns = [
-        "Empresa Aérea",
-        "Aeródromo Origem",
-        "Aeródromo Destino",
-        "Partida Prevista",
-        "Partida Real",
-    ] 
+    print(f"Iniciando o download e preprocessamento de {len(urls)} arquivos CSV...\n")
 
     # Inicializa o DataFrame mestre
     master_df = pd.DataFrame()
 
+    # Dicionários categóricos globais, com todos os aeródromos da ANAC
+    categories = build_categories(aerodromos, categories)
+
     # Inicializa lista para armazenar DataFrames individuais
     dfs = []
 
@@ -79,56 +510,39 @@ def preprocess_csvs(urls: list, aerodromos: pd.DataFrame) -> pd.DataFrame:
     lines = 0
     memory_usage = 0
 
-    for i, url in enumerate(urls, start=1):
+    sources = iter_sources(urls, download_dir=download_dir, max_workers=max_workers, revalidate=revalidate)
+    sources = iter_profiled(sources, profiler, "download")
+    results = iter_processed(sources, aerodromos, n_workers=n_workers, filter_on_read=filter_on_read, profiler=profiler)
 
-        print(f"[{i}/{len(urls)}] Carregando: {url.replace('https://sistemas.anac.gov.br/dadosabertos/Voos%20e%20opera%C3%A7%C3%B5es%20a%C3%A9reas/Voo%20Regular%20Ativo%20%28VRA%29', 'http://...')}")
+    for i, (url, df, message) in enumerate(results, start=1):
 
-        try:
-            # Leitura do CSV bruto
-            df = pd.read_csv(
-                url,
-                sep=';',
-                quotechar='"',
-                skiprows=2,         # pula "Atualizado em" + header
-                header=None,
-                names=raw_columns,
-                low_memory=False
-            )
-
-        except Exception as e:
-            print(f"❌ Falha ao ler {url}\nErro: {e}")
-            continue
+        print(f"[{i}/{len(urls)}] Carregando: {url.replace('https://sistemas.anac.gov.br/dadosabertos/Voos%20e%20opera%C3%A7%C3%B5es%20a%C3%A9reas/Voo%20Regular%20Ativo%20%28VRA%29', 'http://...')}")
 
-        if df.empty:
-            print(f"⚠️ CSV vazio em {url}, ignorando.")
+        if df is None:
+            print(message)
             continue
 
-        # Limpeza de dados
-        df = clean_df(df, aerodromos=aerodromos, columns=columns)
-
-        # Engenharia de Features
-        df = create_distance_col(df, aerodromos=aerodromos)
-        df = create_y_col(df)
-
-        # Parsing de tipos de dados
-        df = parse_categoricals(df)
-        df = parse_datetime(df)
-        df = parse_int(df, col="Distância (m)", int_type='int32')
-
         # Adiciona o df limpo à lista
         dfs.append(df)
 
         lines += df.shape[0]
-        memory_usage += df.memory_usage(deep=True).sum() / (1024 ** 2)
+        # Sem `deep=True`: após a tipagem não há colunas de objetos, e a
+        # varredura das categorias de texto custaria mais que a própria soma
+        memory_usage += df.memory_usage().sum() / (1024 ** 2)
         print(f"✔ {df.shape[0]} linhas carregadas.")
         print(f"   Total atual de linhas: {lines}")
         print(f"   Memória usada: {memory_usage:.2f} MB\n")
 
-    # Concatena todos os dfs ao DataFrame mestre
-    master_df = pd.concat(dfs, ignore_index=True)
+        # Acrescenta aos dicionários globais os valores novos do mês
+        categories = update_categories(categories, df)
+
+    # Aplica os mesmos tipos categóricos a todos os meses e concatena ao DataFrame mestre
+    with profile_stage(profiler, "concat", rows_in=lines) as record:
+        master_df = pd.concat([parse_categoricals(df, categories) for df in dfs], ignore_index=True)
+        record.rows_out = master_df.shape[0]
 
     print(f"\n🏁 Finalizado.\n")
     print(f"Total de linhas carregadas: {master_df.shape[0]}")
-    print(f"Memória usada no Dataframe Master: {master_df.memory_usage(deep=True).sum() / (1024 ** 2):.2f} MB\n")
+    print(f"Memória usada no Dataframe Master: {master_df.memory_usage().sum() / (1024 ** 2):.2f} MB\n")
 
     return master_df
\ No newline at end of file
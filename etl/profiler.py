@@ -0,0 +1,241 @@
+import os
+import json
+import time
+import pandas as pd
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Callable, Iterable, Iterator
+from helpers.memory import peak_rss_mb, reset_peak_rss, rss_mb
+
+# Etapas registradas pelo ETL, na ordem em que ocorrem para cada arquivo
+STAGES = ["download", "parse", "clean", "distance", "label", "typing", "concat", "calendar", "save", "feature_store", "delay_rates", "total"]
+
+@dataclass
+class StageRecord:
+    """
+    Medição de uma etapa do ETL sobre um arquivo (ou sobre o dataset todo,
+    com `file=None`).
+
+    Atributos
+    ---------
+    stage : str
+        - Nome da etapa (ver `STAGES`).
+    file : str | None
+        - URL do arquivo mensal.
+    wall_s : float
+        - Tempo decorrido, em segundos.
+    cpu_s : float
+        - Tempo de CPU do processo durante a etapa, em segundos. Inclui todas
+        as threads do processo, como os downloads simultâneos (ver
+        `etl.preprocess_csvs.iter_sources`), e não apenas a etapa.
+    rows_in, rows_out : int | None
+        - Linhas na entrada e na saída da etapa.
+    peak_rss_mb : float | None
+        - Pico de RSS do processo durante a etapa, em MB (o pico é zerado na
+        entrada de cada etapa; sem suporte a isso, fora do Linux, é o pico
+        desde o início do processo).
+    rss_delta_mb : float | None
+        - Variação do RSS entre o início e o fim da etapa, em MB (memória
+        retida pela etapa).
+    pid : int
+        - Processo em que a etapa rodou (relevante com `n_workers > 1`).
+    """
+    stage: str
+    file: str | None = None
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    rows_in: int | None = None
+    rows_out: int | None = None
+    peak_rss_mb: float | None = None
+    rss_delta_mb: float | None = None
+    pid: int = field(default_factory=os.getpid)
+
+class EtlProfiler:
+    """
+    Coleta o tempo, o tempo de CPU, as linhas de entrada e saída e o pico de
+    memória de cada etapa do ETL, por arquivo, e gera um relatório
+    estruturado ao final (ver `report`).
+    """
+    def __init__(self):
+        self.records: list[StageRecord] = []
+        # Etapas abertas (aninhadas, ex.: "total") e o pico observado em cada uma
+        self._open: list[list] = []
+
+    @contextmanager
+    def stage(self, stage: str, file: str | None = None, rows_in: int | None = None) -> Iterator[StageRecord]:
+        """
+        Mede o bloco `with` como uma etapa. O registro entregue pode ser
+        completado dentro do bloco (ex.: `record.rows_out`).
+
+        O pico de memória do processo é zerado na entrada da etapa, de modo
+        que cada etapa registra o próprio pico. Etapas aninhadas são
+        permitidas (o pico da etapa externa inclui o das internas), mas as
+        etapas de um mesmo processo devem ser sequenciais.
+        """
+        record = StageRecord(stage, file=file, rows_in=rows_in)
+
+        # Guarda nas etapas abertas o pico atingido até aqui, antes de zerá-lo
+        self._propagate_peak(peak_rss_mb())
+        entry = [record, None]
+        self._open.append(entry)
+        start_rss = rss_mb()
+        reset_peak_rss()
+
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield record
+        finally:
+            record.wall_s = time.perf_counter() - wall
+            record.cpu_s = time.process_time() - cpu
+
+            self._open.remove(entry)
+            peaks = [peak for peak in (peak_rss_mb(), entry[1]) if peak is not None]
+            record.peak_rss_mb = max(peaks) if peaks else None
+            self._propagate_peak(record.peak_rss_mb)
+
+            end_rss = rss_mb()
+            if start_rss is not None and end_rss is not None:
+                record.rss_delta_mb = end_rss - start_rss
+            self.records.append(record)
+
+    def _propagate_peak(self, peak: float | None) -> None:
+        """
+        Registra `peak` no pico observado de cada etapa aberta.
+        """
+        if peak is None:
+            return
+        for entry in self._open:
+            entry[1] = peak if entry[1] is None else max(entry[1], peak)
+
+    def extend(self, records: Iterable[StageRecord | dict]) -> None:
+        """
+        Acrescenta registros medidos em outro processo (ex.: no pool de
+        `preprocess_csvs`).
+        """
+        for record in records:
+            self.records.append(record if isinstance(record, StageRecord) else StageRecord(**record))
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Registros como DataFrame, uma linha por etapa de cada arquivo.
+        """
+        df = pd.DataFrame([asdict(record) for record in self.records], columns=list(StageRecord.__dataclass_fields__))
+        return df.astype({"rows_in": "Int64", "rows_out": "Int64", "peak_rss_mb": "float64", "rss_delta_mb": "float64"})
+
+    def report(self) -> dict:
+        """
+        Monta o relatório: totais por etapa, totais por arquivo (do mais lento
+        ao mais rápido) e todos os registros.
+        """
+        df = self.to_frame()
+
+        groups = df.groupby("stage", sort=False)
+        stages = groups.agg(
+            count=("stage", "size"),
+            wall_s=("wall_s", "sum"),
+            cpu_s=("cpu_s", "sum"),
+            peak_rss_mb=("peak_rss_mb", "max"),
+            rss_delta_mb=("rss_delta_mb", "sum"),
+        )
+        # Etapas sem contagem de linhas (ex.: "download") ficam nulas, e não zeradas
+        rows = groups[["rows_in", "rows_out"]].sum(min_count=1)
+        stages = stages.join(rows)[["count", "wall_s", "cpu_s", "rows_in", "rows_out", "peak_rss_mb", "rss_delta_mb"]]
+        stages = stages.reindex([s for s in STAGES if s in stages.index] + [s for s in stages.index if s not in STAGES])
+
+        # Linhas de entrada e saída do arquivo: primeira e última etapa com contagem
+        files = df[df["file"].notna()]
+        per_file = files.groupby("file", sort=False).agg(
+            wall_s=("wall_s", "sum"),
+            cpu_s=("cpu_s", "sum"),
+            rows_in=("rows_in", "first"),
+            rows_out=("rows_out", "last"),
+            peak_rss_mb=("peak_rss_mb", "max"),
+            rss_delta_mb=("rss_delta_mb", "sum"),
+        ).sort_values("wall_s", ascending=False)
+
+        def records(frame: pd.DataFrame) -> list[dict]:
+            frame = frame.astype(object)
+            return frame.where(frame.notna(), None).to_dict(orient="records")
+
+        return {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "stages": records(stages.reset_index()),
+            "files": records(per_file.reset_index()),
+            "records": records(df)
+        }
+
+    def save(self, path: str) -> str:
+        """
+        Grava o relatório (ver `report`) em JSON, de forma atômica.
+
+        Parâmetros
+        ----------
+        path : str
+            - Caminho do arquivo JSON.
+
+        Retorna
+        -------
+        str
+            - Caminho do arquivo gravado.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        return path
+
+def profile_stage(profiler: EtlProfiler | None, stage: str, file: str | None = None, rows_in: int | None = None):
+    """
+    `profiler.stage(...)`, ou um contexto sem medição quando `profiler` é
+    None. Em ambos os casos o bloco recebe um `StageRecord`.
+    """
+    if profiler is None:
+        return nullcontext(StageRecord(stage, file=file, rows_in=rows_in))
+    return profiler.stage(stage, file=file, rows_in=rows_in)
+
+def iter_profiled(
+    items: Iterable,
+    profiler: EtlProfiler | None,
+    stage: str,
+    file: Callable = lambda item: item[0]
+) -> Iterator:
+    """
+    Repassa os itens de um iterador, registrando como `stage` o tempo de
+    espera por cada um (ex.: a espera pelo download de cada arquivo em
+    `iter_sources`).
+
+    Parâmetros
+    ----------
+    items : Iterable
+        - Itens a serem repassados.
+    profiler : EtlProfiler | None
+        - Profiler. Se None, os itens são repassados sem medição.
+    stage : str
+        - Nome da etapa.
+    file : Callable, opcional
+        - Função que extrai de cada item o arquivo registrado.
+    """
+    if profiler is None:
+        yield from items
+        return
+
+    items = iter(items)
+    while True:
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            item = next(items)
+        except StopIteration:
+            return
+
+        profiler.records.append(StageRecord(
+            stage,
+            file=file(item),
+            wall_s=time.perf_counter() - wall,
+            cpu_s=time.process_time() - cpu,
+            peak_rss_mb=peak_rss_mb()
+        ))
+        yield item
@@ -0,0 +1,125 @@
+import os
+import hashlib
+from datetime import datetime, timezone
+
+from etl.download_csvs import fetch_url, url_filename
+from helpers.manifest import MANIFEST_FILENAME, load_manifest, manifest_lock, save_manifest
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Calcula o checksum SHA-256 de um arquivo local.
+
+    Parâmetros
+    ----------
+    path : str
+        - Caminho do arquivo.
+    chunk_size : int, opcional
+        - Tamanho, em bytes, dos blocos lidos.
+
+    Retorna
+    -------
+    str
+        - Checksum em hexadecimal.
+    """
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+def is_cached(entry: dict | None, path: str, verify: bool = False) -> bool:
+    """
+    Verifica se o arquivo descrito no manifesto está presente e íntegro no cache.
+
+    Parâmetros
+    ----------
+    entry : dict | None
+        - Entrada do manifesto correspondente ao arquivo.
+    path : str
+        - Caminho local esperado do arquivo.
+    verify : bool, opcional
+        - Se True, também confere o checksum SHA-256 (além do tamanho).
+
+    Retorna
+    -------
+    bool
+        - True se o arquivo existe e confere com o manifesto.
+    """
+    if entry is None or not os.path.exists(path):
+        return False
+    if os.path.getsize(path) != entry.get("size"):
+        return False
+    if verify and file_sha256(path) != entry.get("sha256"):
+        return False
+    return True
+
+def fetch_cached(
+    url: str,
+    cache_dir: str,
+    manifest: dict,
+    revalidate: bool = True,
+    verify: bool = False,
+    **fetch_kwargs
+) -> str:
+    """
+    Obtém um arquivo a partir do cache local, baixando-o apenas quando está
+    ausente, corrompido ou foi modificado no servidor.
+
+    Para arquivos já presentes no cache, é feita uma requisição condicional
+    (If-None-Match / If-Modified-Since) com o ETag e o Last-Modified
+    registrados no manifesto. Uma resposta 304 mantém o arquivo local sem
+    transferir o conteúdo novamente.
+
+    Parâmetros
+    ----------
+    url : str
+        - URL do arquivo.
+    cache_dir : str
+        - Diretório do cache.
+    manifest : dict
+        - Manifesto carregado por `load_manifest`. É atualizado e salvo em
+        disco a cada arquivo baixado ou revalidado.
+    revalidate : bool, opcional
+        - Se False, arquivos presentes no cache são usados sem consultar o
+        servidor.
+    verify : bool, opcional
+        - Se True, confere o checksum SHA-256 dos arquivos em cache.
+    **fetch_kwargs
+        - Argumentos adicionais repassados para `fetch_url`.
+
+    Retorna
+    -------
+    str
+        - Caminho local do arquivo.
+    """
+    filename = url_filename(url)
+    path = os.path.join(cache_dir, filename)
+    entry = manifest.get(url)
+    now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    headers = {}
+    if is_cached(entry, path, verify=verify):
+        if not revalidate:
+            return path
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    info = fetch_url(url, path, headers=headers, **fetch_kwargs)
+
+    with manifest_lock:
+        if info is None:
+            # 304: o arquivo do cache continua válido
+            manifest[url] = {**entry, "checked_at": now}
+        else:
+            manifest[url] = {
+                "url": url,
+                "file": filename,
+                **info,
+                "fetched_at": now,
+                "checked_at": now,
+            }
+        save_manifest(cache_dir, manifest)
+
+    return path
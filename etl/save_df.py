@@ -1,8 +1,92 @@
 import os
+import uuid
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from datetime import datetime
+from helpers.categories import CATEGORIES_FILENAME, categories_path, save_categories
 
-def save_df(df: pd.DataFrame, filename: str = "dados_voos", timestamp: bool = False, save_csv: bool = False) -> None:
+def write_parquet(
+    df: pd.DataFrame,
+    path: str,
+    compression: str = "snappy",
+    compression_level: int | None = None,
+    row_group_size: int | None = 1_000_000,
+    use_dictionary: bool | list = True,
+    write_statistics: bool | list = True,
+    sort_by: str | None = None
+) -> str:
+    """
+    Grava um DataFrame em Parquet com o `pyarrow`, de forma atômica: o
+    arquivo é escrito em um temporário no mesmo diretório e renomeado sobre
+    `path` ao final, de modo que leitores nunca enxergam um arquivo parcial.
+
+    Parâmetros
+    ----------
+    df : pandas.DataFrame
+        - DataFrame a ser gravado.
+    path : str
+        - Caminho do arquivo Parquet.
+    compression : str, opcional
+        - Codec de compressão ("snappy", "zstd", "gzip", "lz4", "brotli" ou
+        "none").
+    compression_level : int, opcional
+        - Nível de compressão do codec (ex.: 1 a 22 para "zstd").
+    row_group_size : int, opcional
+        - Máximo de linhas por row group. Row groups menores permitem
+        descartar mais dados pelas estatísticas na leitura filtrada.
+    use_dictionary : bool | list, opcional
+        - Codificação por dicionário em todas as colunas, em nenhuma ou
+        apenas nas colunas listadas.
+    write_statistics : bool | list, opcional
+        - Gravação das estatísticas (mín./máx.) por row group em todas as
+        colunas, em nenhuma ou apenas nas colunas listadas.
+    sort_by : str, opcional
+        - Coluna usada para ordenar as linhas antes da gravação (ex.: "Data
+        Hora Voo"), tornando as estatísticas de cada row group disjuntas.
+
+    Retorna
+    -------
+    str
+        - Caminho do arquivo gravado.
+    """
+    if sort_by is not None:
+        df = df.sort_values(sort_by, kind="stable", ignore_index=True)
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = os.path.join(os.path.dirname(os.path.abspath(path)), f".{uuid.uuid4().hex}.parquet.tmp")
+    try:
+        pq.write_table(
+            table,
+            tmp_path,
+            compression=compression,
+            compression_level=compression_level,
+            row_group_size=row_group_size,
+            use_dictionary=use_dictionary,
+            write_statistics=write_statistics
+        )
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return path
+
+def save_df(
+    df: pd.DataFrame,
+    filename: str = "dados_voos",
+    timestamp: bool = False,
+    save_csv: bool = False,
+    categories: dict | None = None,
+    compression: str = "snappy",
+    compression_level: int | None = None,
+    row_group_size: int | None = 1_000_000,
+    use_dictionary: bool | list = True,
+    write_statistics: bool | list = True,
+    sort_by: str | None = None
+) -> str:
     """
     Salva o DataFrame em formatos CSV e Parquet dentro do diretório root/data/.
 
@@ -15,15 +99,33 @@ def save_df(df: pd.DataFrame, filename: str = "dados_voos", timestamp: bool = Fa
     timestamp : bool, opcional
         - Se True, adiciona ao nome do arquivo um sufixo com data e hora
         no formato YYYYMMDD_HHMMSS, garantindo unicidade e versionamento.
+    categories : dict, opcional
+        - Dicionários categóricos globais (ver `helpers.categories`), salvos
+        junto ao Parquet em <filename>_categorias.json e usados por
+        `carregar_dados`.
+    compression, compression_level, row_group_size, use_dictionary, write_statistics, sort_by : opcionais
+        - Configurações do arquivo Parquet (ver `write_parquet`). Com
+        `sort_by="Data Hora Voo"`, leituras por período em `carregar_dados`
+        descartam quase todos os row groups fora do intervalo.
+
+    Retorna
+    -------
+    str
+        - Nome do arquivo salvo, sem extensão (com o sufixo de data e hora,
+        se houver), como usado por `carregar_dados`.
 
     Notas
     -----
     - O diretório ./data/ é criado automaticamente caso não exista.
     - Dois arquivos são gerados:
-        • <filename>.csv (codificação UTF-8)  
+        • <filename>.csv (codificação UTF-8)
         • <filename>.parquet (colunar, compactado)
     - O Parquet é recomendado para processamento posterior devido à maior velocidade
       de leitura e economia de memória.
+    - Os arquivos são gravados em temporários e renomeados ao final, de forma
+      atômica.
+    - Benchmark de escrita e leitura com diferentes configurações:
+      `python -m benchmarks.bench_parquet`.
     """
 
     # Garante que o diretório ./data/ exista
@@ -44,10 +146,28 @@ def save_df(df: pd.DataFrame, filename: str = "dados_voos", timestamp: bool = Fa
 
     # Salva o DataFrame em CSV
     if save_csv:
-        df.to_csv(f'{filepath}.csv', index=False, encoding="utf-8")
+        tmp_path = f'{filepath}.csv.tmp'
+        df.to_csv(tmp_path, index=False, encoding="utf-8")
+        os.replace(tmp_path, f'{filepath}.csv')
         print(f"   → ./data/{filename_raw}.csv")
-    
+
     # Salva o DataFrame em parquet
     print(f"📁 Arquivo salvo com sucesso:")
-    df.to_parquet(f'{filepath}.parquet', engine="fastparquet", index=False)
-    print(f"   → ./data/{filename_raw}.parquet")
\ No newline at end of file
+    write_parquet(
+        df,
+        f'{filepath}.parquet',
+        compression=compression,
+        compression_level=compression_level,
+        row_group_size=row_group_size,
+        use_dictionary=use_dictionary,
+        write_statistics=write_statistics,
+        sort_by=sort_by
+    )
+    print(f"   → ./data/{filename_raw}.parquet")
+
+    # Salva os dicionários categóricos junto ao Parquet
+    if categories is not None:
+        save_categories(categories, categories_path(f'{filepath}.parquet'))
+        print(f"   → ./data/{filename_raw}_{CATEGORIES_FILENAME}")
+
+    return filename_raw
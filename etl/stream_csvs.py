@@ -0,0 +1,217 @@
+import os
+import uuid
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from typing import Iterator
+
+from etl.preprocess_csvs import NUMERIC_INFERRED_COLUMNS, RAW_COLUMNS, iter_sources, transform_df
+from etl.feature_engeneering import get_airport_registry
+from helpers.categories import CATEGORICAL_COLUMNS, update_categories
+from helpers.calendar_features import CALENDAR_COLUMNS, add_calendar_features
+
+# Colunas lidas no modo streaming: as colunas desejadas mais as usadas nos filtros
+STREAM_COLUMNS = [
+    "Empresa Aérea",
+    "Código Autorização (DI)",
+    "Código Tipo Linha",
+    "Aeródromo Origem",
+    "Aeródromo Destino",
+    "Partida Prevista",
+    "Partida Real",
+    "Situação Voo",
+]
+
+# Tipos explícitos: as colunas usadas apenas nos filtros são lidas como category
+# (sem inferência numérica; descartadas após a limpeza), as demais como texto
+STREAM_DTYPES = {
+    "Empresa Aérea": str,
+    "Código Autorização (DI)": "category",
+    "Código Tipo Linha": "category",
+    "Aeródromo Origem": str,
+    "Aeródromo Destino": str,
+    "Partida Prevista": str,
+    "Partida Real": str,
+    "Situação Voo": "category",
+}
+
+# Schema do Parquet gerado, idêntico aos tipos de `transform_df`
+PARQUET_SCHEMA = pa.schema([
+    ("Empresa Aérea", pa.dictionary(pa.int32(), pa.string())),
+    ("Aeródromo Origem", pa.dictionary(pa.int32(), pa.string())),
+    ("Aeródromo Destino", pa.dictionary(pa.int32(), pa.string())),
+    ("Distância (m)", pa.int32()),
+    ("Data Hora Voo", pa.timestamp("ns")),
+    ("Atrasado", pa.int8()),
+])
+
+# Colunas de calendário acrescentadas ao schema com `calendar_features=True`
+CALENDAR_SCHEMA = pa.schema([(col, pa.from_numpy_dtype(dtype)) for col, dtype in CALENDAR_COLUMNS.items()])
+
+def iter_raw_chunks(source: str, chunksize: int = 250_000) -> Iterator[pd.DataFrame]:
+    """
+    Lê um arquivo CSV bruto do VRA em blocos, apenas com as colunas de
+    `STREAM_COLUMNS` e os tipos de `STREAM_DTYPES`.
+
+    Parâmetros
+    ----------
+    source : str
+        - URL ou caminho local do arquivo CSV.
+    chunksize : int, opcional
+        - Quantidade de linhas por bloco.
+
+    Retorna
+    -------
+    Iterator[pandas.DataFrame]
+        - Blocos do arquivo bruto.
+    """
+    return pd.read_csv(
+        source,
+        sep=';',
+        quotechar='"',
+        skiprows=2,         # pula "Atualizado em" + header
+        header=None,
+        names=RAW_COLUMNS,
+        usecols=STREAM_COLUMNS,
+        dtype=STREAM_DTYPES,
+        chunksize=chunksize
+    )
+
+def stream_csvs_to_parquet(
+    urls: list,
+    aerodromos: pd.DataFrame,
+    output_path: str,
+    chunksize: int = 250_000,
+    download_dir: str | None = None,
+    max_workers: int = 4,
+    revalidate: bool = True,
+    categories: dict | None = None,
+    calendar_features: bool = False
+) -> int:
+    """
+    Processa múltiplos CSVs do VRA em modo streaming, gravando o resultado
+    diretamente em um arquivo Parquet, com uso de memória limitado.
+
+    Cada arquivo é lido em blocos de `chunksize` linhas, somente com as
+    colunas necessárias e com tipos explícitos. Cada bloco passa pelas mesmas
+    etapas de `preprocess_csvs` (limpeza, distância, variável alvo e
+    tipagem) e é gravado assim que limpo, como um row group de um Parquet
+    temporário do mês. Ao final da leitura do mês, os row groups são copiados
+    um a um para o Parquet de saída (ou descartados, ver Observações). Assim,
+    o pico de memória acompanha o tamanho do bloco, e não o mês ou o dataset.
+
+    O arquivo é escrito em um temporário e renomeado ao final, de modo que
+    `output_path` nunca contém um resultado parcial.
+
+    Parâmetros
+    ----------
+    urls : list
+        - Lista contendo as URLs dos arquivos CSV a serem processados.
+    aerodromos : pandas.DataFrame
+        - DataFrame contendo informações sobre aeródromos da ANAC.
+    output_path : str
+        - Caminho do arquivo Parquet de saída.
+    chunksize : int, opcional
+        - Quantidade de linhas lidas por bloco.
+    download_dir : str, opcional
+        - Diretório do cache local de CSVs brutos (ver `preprocess_csvs`).
+    max_workers : int, opcional
+        - Limite de downloads simultâneos quando `download_dir` é informado.
+    revalidate : bool, opcional
+        - Se True, revalida no servidor os arquivos já presentes no cache.
+    categories : dict, opcional
+        - Dicionários categóricos globais (ver `helpers.categories`),
+        completados no próprio objeto com as empresas e aeródromos gravados.
+    calendar_features : bool, opcional
+        - Se True, grava também as features de calendário de cada bloco (ver
+        `helpers.calendar_features`).
+
+    Retorna
+    -------
+    int
+        - Quantidade total de linhas gravadas.
+
+    Observações
+    -----------
+    - As colunas de filtro são lidas como category, sem inferência de tipo.
+      No modo padrão, o pandas converte para número uma coluna de filtro
+      cujos valores no arquivo são todos numéricos (ex.: meses em que
+      "Código Autorização (DI)" contém apenas dígitos), e nenhum voo passa no
+      filtro de texto. Para manter o resultado idêntico ao de
+      `preprocess_csvs` (e de `read_filtered_csv`), esses meses também são
+      descartados aqui.
+    """
+    print(f"Iniciando o preprocessamento em streaming de {len(urls)} arquivos CSV...\n")
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    tmp_path = os.path.join(os.path.dirname(os.path.abspath(output_path)), f".{uuid.uuid4().hex}.parquet.tmp")
+
+    # Registro de aeródromos construído uma única vez para todos os blocos
+    aerodromos = get_airport_registry(aerodromos)
+
+    schema = pa.unify_schemas([PARQUET_SCHEMA, CALENDAR_SCHEMA]) if calendar_features else PARQUET_SCHEMA
+
+    lines = 0
+    sources = iter_sources(urls, download_dir=download_dir, max_workers=max_workers, revalidate=revalidate)
+
+    try:
+        with pq.ParquetWriter(tmp_path, schema) as writer:
+            for i, (url, source, error) in enumerate(sources, start=1):
+
+                print(f"[{i}/{len(urls)}] Carregando: {url.replace('https://sistemas.anac.gov.br/dadosabertos/Voos%20e%20opera%C3%A7%C3%B5es%20a%C3%A9reas/Voo%20Regular%20Ativo%20%28VRA%29', 'http://...')}")
+
+                if error is not None:
+                    print(f"❌ Falha ao baixar {url}\nErro: {error}")
+                    continue
+
+                file_lines = 0
+                numeric = dict.fromkeys(NUMERIC_INFERRED_COLUMNS, True)
+                month_path = f"{tmp_path}.{i}"
+                try:
+                    # Cada bloco limpo vai direto para o Parquet temporário do mês
+                    with pq.ParquetWriter(month_path, schema) as month_writer:
+                        for chunk in iter_raw_chunks(source, chunksize=chunksize):
+                            for col in NUMERIC_INFERRED_COLUMNS:
+                                values = pd.Series(chunk[col].cat.categories)
+                                numeric[col] = numeric[col] and pd.to_numeric(values, errors="coerce").notna().all()
+
+                            df = transform_df(chunk, aerodromos=aerodromos)
+                            if df.empty:
+                                continue
+                            if calendar_features:
+                                df = add_calendar_features(df)
+                            month_writer.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False))
+
+                    # Mesmo descarte do modo padrão (ver Observações); caso
+                    # contrário, copia os row groups do mês, um de cada vez
+                    if not any(numeric.values()):
+                        month = pq.ParquetFile(month_path)
+                        for group in range(month.num_row_groups):
+                            table = month.read_row_group(group)
+                            writer.write_table(table)
+                            if categories is not None:
+                                update_categories(categories, table.select(list(dict.fromkeys(CATEGORICAL_COLUMNS))).to_pandas())
+                            file_lines += table.num_rows
+
+                except Exception as e:
+                    print(f"❌ Falha ao ler {url}\nErro: {e}")
+
+                finally:
+                    if os.path.exists(month_path):
+                        os.remove(month_path)
+
+                lines += file_lines
+                print(f"✔ {file_lines} linhas gravadas.")
+                print(f"   Total atual de linhas: {lines}\n")
+
+        os.replace(tmp_path, output_path)
+
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    print(f"\n🏁 Finalizado.\n")
+    print(f"Total de linhas gravadas: {lines}")
+    print(f"   → {output_path}\n")
+
+    return lines
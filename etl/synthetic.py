@@ -0,0 +1,406 @@
+"""
+Gerador de dados sintéticos do VRA (Voo Regular Ativo), para executar e
+medir o ETL, o treino e a inferência sem acesso à rede da ANAC.
+
+Gera arquivos mensais exatamente no layout lido por `preprocess_csvs` (";"
+como separador, linha "Atualizado em", cabeçalho original e as 12 colunas de
+`RAW_COLUMNS`) e a tabela de aeródromos correspondente, com distribuições
+próximas às dos dados reais: concentração de tráfego em poucos aeródromos e
+empresas, horários em múltiplos de 5 minutos, atrasos com cauda longa,
+cancelamentos, voos internacionais e códigos de autorização e tipo de linha
+descartados pelos filtros.
+
+Uso:
+    python -m etl.synthetic --linhas 10000000 --meses 12 --dir data/sintetico
+    python -m etl.synthetic --linhas 1000000 --dir data/sintetico --servir 8765
+    python -m etl.synthetic --linhas 1000000 --dir data/sintetico --parquet dados_voos_sinteticos
+"""
+import os
+import time
+import argparse
+import threading
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from etl.preprocess_csvs import RAW_COLUMNS
+from etl.feature_engeneering import haversine
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Participação aproximada de cada empresa nos voos regulares
+EMPRESAS = {
+    "AZU": 0.34, "GLO": 0.30, "TAM": 0.27, "PTB": 0.03, "MAP": 0.015,
+    "ONE": 0.015, "TTL": 0.01, "SID": 0.005, "ACN": 0.005, "ASO": 0.005,
+    "TAP": 0.005,
+}
+
+# Aeródromos estrangeiros, ausentes da tabela de aeródromos (descartados no ETL)
+AERODROMOS_ESTRANGEIROS = ["KMIA", "KJFK", "KMCO", "LPPT", "LEMD", "SAEZ", "SCEL", "SPJC", "SUMU", "MPTO"]
+
+# Códigos de autorização (apenas "0" passa nos filtros)
+CODIGOS_DI = {"0": 0.88, "1": 0.02, "2": 0.02, "4": 0.03, "6": 0.02, "9": 0.01, "C": 0.01, "E": 0.01}
+
+# Tipos de linha (apenas "N", "R" e "H" passam nos filtros)
+TIPOS_LINHA = {"N": 0.72, "R": 0.05, "H": 0.03, "I": 0.12, "C": 0.04, "G": 0.03, "L": 0.01}
+
+# Situações do voo e justificativas mais comuns
+SITUACOES = {"REALIZADO": 0.91, "CANCELADO": 0.08, "NÃO INFORMADO": 0.01}
+JUSTIFICATIVAS_ATRASO = ["XN", "AS", "RA", "WO", "TD", "MX", "HI", "AT"]
+JUSTIFICATIVAS_CANCELAMENTO = ["XS", "XT", "XO", "XR", "XJ"]
+
+# Partidas por hora do dia (madrugada com pouco movimento, picos pela manhã e à noite)
+PESOS_HORA = np.array([
+    1, 0.6, 0.4, 0.3, 0.5, 2, 5, 7, 7, 6, 6, 6,
+    6, 6, 6, 6, 6, 7, 7, 7, 6, 5, 4, 2,
+])
+
+FORMATO_DATA = "%Y-%m-%d %H:%M:%S"
+
+def _normalize(weights) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Separa um dicionário de pesos em valores e probabilidades normalizadas.
+    """
+    values = np.array(list(weights))
+    p = np.array(list(weights.values()), dtype="float64")
+    return values, p / p.sum()
+
+def synthetic_airports(n_airports: int = 600, seed: int = 0) -> pd.DataFrame:
+    """
+    Gera uma tabela de aeródromos no formato de metadata/aerodromos.csv.
+
+    Parâmetros
+    ----------
+    n_airports : int, opcional
+        - Quantidade de aeródromos.
+    seed : int, opcional
+        - Semente do gerador aleatório.
+
+    Retorna
+    -------
+    pandas.DataFrame
+        - Colunas "Código OACI", "Latitude" e "Longitude", com coordenadas
+        dentro do território brasileiro. A ordem das linhas define o volume
+        de tráfego de cada aeródromo em `synthetic_month`.
+    """
+    rng = np.random.default_rng(seed)
+    letters = [chr(c) for c in range(ord("A"), ord("Z") + 1)]
+    codes = [f"{prefix}{a}{b}" for prefix in ["SB", "SD", "SN", "SW", "SI", "SJ", "SS"] for a in letters for b in letters]
+    if n_airports > len(codes):
+        raise ValueError(f"n_airports deve ser no máximo {len(codes)}.")
+
+    return pd.DataFrame({
+        "Código OACI": codes[:n_airports],
+        "Latitude": rng.uniform(-33.7, 5.2, n_airports).round(6),
+        "Longitude": rng.uniform(-73.9, -34.8, n_airports).round(6),
+    })
+
+def _format_minutes(minutes: np.ndarray, inicio: pd.Timestamp, date_format: str, missing: np.ndarray | None = None) -> np.ndarray:
+    """
+    Formata minutos a partir de `inicio` como texto, convertendo cada valor
+    distinto uma única vez. As posições de `missing` resultam em texto vazio.
+    """
+    uniques, inverse = np.unique(minutes, return_inverse=True)
+    text = (inicio + pd.to_timedelta(uniques, unit="m")).strftime(date_format).to_numpy(dtype=object)[inverse]
+    if missing is not None:
+        text[missing] = ""
+    return text
+
+def synthetic_month(
+    ano: int,
+    mes: int,
+    n_rows: int,
+    aerodromos: pd.DataFrame,
+    seed: int = 0,
+    date_format: str = FORMATO_DATA
+) -> pd.DataFrame:
+    """
+    Gera os voos de um mês no layout bruto do VRA (colunas de `RAW_COLUMNS`,
+    todas como texto).
+
+    Parâmetros
+    ----------
+    ano : int
+        - Ano do arquivo.
+    mes : int
+        - Mês do arquivo (1 a 12).
+    n_rows : int
+        - Quantidade de linhas.
+    aerodromos : pandas.DataFrame
+        - Tabela de aeródromos (ver `synthetic_airports`).
+    seed : int, opcional
+        - Semente do gerador aleatório.
+    date_format : str, opcional
+        - Formato das datas (ex.: "%Y-%m-%d %H:%M:%S" ou "%d/%m/%Y %H:%M",
+        ambos encontrados nos arquivos do VRA).
+
+    Retorna
+    -------
+    pandas.DataFrame
+        - Voos do mês, com texto vazio nos valores ausentes.
+    """
+    rng = np.random.default_rng(seed)
+    inicio = pd.Timestamp(ano, mes, 1)
+    codes = aerodromos["Código OACI"].to_numpy(dtype=object)
+    n_airports = len(codes)
+
+    # Tráfego concentrado nos primeiros aeródromos da tabela (lei de Zipf)
+    traffic = 1 / np.arange(1, n_airports + 1) ** 1.1
+    traffic /= traffic.sum()
+    origem = rng.choice(n_airports, n_rows, p=traffic)
+    destino = rng.choice(n_airports, n_rows, p=traffic)
+    same = origem == destino
+    destino[same] = (destino[same] + rng.integers(1, n_airports, same.sum())) % n_airports
+
+    # Duração prevista pela distância (~750 km/h + 25 min), em múltiplos de 5 minutos
+    lat = aerodromos["Latitude"].to_numpy(dtype="float64")
+    lon = aerodromos["Longitude"].to_numpy(dtype="float64")
+    distance_km = haversine(lat[origem], lon[origem], lat[destino], lon[destino]) / 1000
+    duration = (np.round((distance_km / 12.5 + 25) / 5) * 5).astype("int64")
+
+    # Partidas previstas em múltiplos de 5 minutos, com mais voos durante o dia
+    days = pd.Period(inicio, freq="M").days_in_month
+    hour = rng.choice(24, n_rows, p=PESOS_HORA / PESOS_HORA.sum())
+    prevista = rng.integers(0, days, n_rows) * 1440 + hour * 60 + rng.integers(0, 12, n_rows) * 5
+
+    # Atrasos: maioria pontual, com uma cauda exponencial de atrasos longos
+    late = rng.random(n_rows) < 0.22
+    delay = np.where(
+        late,
+        15 + rng.exponential(35, n_rows),
+        rng.normal(-2, 6, n_rows)
+    ).round().astype("int64").clip(-30)
+    real = prevista + delay
+    chegada_prevista = prevista + duration
+    chegada_real = real + duration + rng.normal(0, 5, n_rows).round().astype("int64")
+
+    situacoes, p_situacoes = _normalize(SITUACOES)
+    situacao = rng.choice(situacoes, n_rows, p=p_situacoes)
+    realizado = situacao == "REALIZADO"
+
+    # Voos não realizados (e alguns registros incompletos) não têm horários reais
+    sem_real = ~realizado | (rng.random(n_rows) < 0.005)
+
+    justificativa = np.full(n_rows, "", dtype=object)
+    atrasado = realizado & (delay > 15) & (rng.random(n_rows) < 0.6)
+    justificativa[atrasado] = rng.choice(JUSTIFICATIVAS_ATRASO, atrasado.sum())
+    cancelado = situacao == "CANCELADO"
+    justificativa[cancelado] = rng.choice(JUSTIFICATIVAS_CANCELAMENTO, cancelado.sum())
+
+    # Voos internacionais com origem ou destino fora da tabela de aeródromos
+    origem = codes[origem]
+    destino = codes[destino]
+    tipos, p_tipos = _normalize(TIPOS_LINHA)
+    tipo_linha = rng.choice(tipos, n_rows, p=p_tipos)
+    internacional = tipo_linha == "I"
+    exterior = internacional & (rng.random(n_rows) < 0.5)
+    origem[exterior] = rng.choice(AERODROMOS_ESTRANGEIROS, exterior.sum())
+    exterior = internacional & ~exterior
+    destino[exterior] = rng.choice(AERODROMOS_ESTRANGEIROS, exterior.sum())
+
+    empresas, p_empresas = _normalize(EMPRESAS)
+    codigos_di, p_di = _normalize(CODIGOS_DI)
+
+    return pd.DataFrame({
+        "Empresa Aérea": rng.choice(empresas, n_rows, p=p_empresas),
+        "Número Voo": rng.integers(1, 10000, n_rows).astype(str),
+        "Código Autorização (DI)": rng.choice(codigos_di, n_rows, p=p_di),
+        "Código Tipo Linha": tipo_linha,
+        "Aeródromo Origem": origem,
+        "Aeródromo Destino": destino,
+        "Partida Prevista": _format_minutes(prevista, inicio, date_format),
+        "Partida Real": _format_minutes(real, inicio, date_format, missing=sem_real),
+        "Chegada Prevista": _format_minutes(chegada_prevista, inicio, date_format),
+        "Chegada Real": _format_minutes(chegada_real, inicio, date_format, missing=sem_real),
+        "Situação Voo": situacao,
+        "Código Justificativa": justificativa,
+    }, columns=RAW_COLUMNS)
+
+def write_synthetic_month(
+    path: str,
+    ano: int,
+    mes: int,
+    n_rows: int,
+    aerodromos: pd.DataFrame,
+    seed: int = 0,
+    date_format: str = FORMATO_DATA,
+    chunksize: int = 1_000_000
+) -> str:
+    """
+    Grava um arquivo mensal sintético no layout do VRA, em blocos de
+    `chunksize` linhas (uso de memória limitado mesmo em meses muito
+    grandes) e de forma atômica.
+
+    Parâmetros
+    ----------
+    path : str
+        - Caminho do arquivo CSV.
+    ano, mes : int
+        - Ano e mês do arquivo.
+    n_rows : int
+        - Quantidade de linhas.
+    aerodromos : pandas.DataFrame
+        - Tabela de aeródromos (ver `synthetic_airports`).
+    seed : int, opcional
+        - Semente do gerador aleatório.
+    date_format : str, opcional
+        - Formato das datas (ver `synthetic_month`).
+    chunksize : int, opcional
+        - Quantidade de linhas geradas e gravadas por vez.
+
+    Retorna
+    -------
+    str
+        - Caminho do arquivo gravado.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+
+    # Escrita pelo `pyarrow.csv`, sem aspas (como `to_csv`, ~5x mais rápido)
+    options = pv.WriteOptions(delimiter=";", quoting_style="none", include_header=False)
+
+    try:
+        with pa.OSFile(tmp_path, "wb") as f:
+            f.write(f"Atualizado em: {pd.Timestamp.now():%Y-%m-%d}\n{';'.join(RAW_COLUMNS)}\n".encode("utf-8"))
+            for i, start in enumerate(range(0, n_rows, chunksize)):
+                df = synthetic_month(ano, mes, min(chunksize, n_rows - start), aerodromos, seed=seed * 100_003 + i, date_format=date_format)
+                pv.write_csv(pa.Table.from_pandas(df, preserve_index=False), f, options)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return path
+
+def generate_synthetic_vra(
+    output_dir: str,
+    n_rows: int = 1_000_000,
+    n_months: int = 12,
+    ano_inicio: int = 2018,
+    n_airports: int = 600,
+    seed: int = 0,
+    date_format: str = FORMATO_DATA,
+    chunksize: int = 1_000_000
+) -> tuple[list, pd.DataFrame]:
+    """
+    Gera um conjunto de arquivos mensais sintéticos do VRA e a tabela de
+    aeródromos correspondente.
+
+    Parâmetros
+    ----------
+    output_dir : str
+        - Diretório de saída. Recebe VRA_<ano><mes>.csv (mesmo nome dos
+        arquivos da ANAC) e aerodromos.csv.
+    n_rows : int, opcional
+        - Total de linhas, distribuídas igualmente entre os meses (ex.: de
+        100 mil a 100 milhões).
+    n_months : int, opcional
+        - Quantidade de meses, a partir de janeiro de `ano_inicio`.
+    ano_inicio : int, opcional
+        - Ano do primeiro arquivo.
+    n_airports : int, opcional
+        - Quantidade de aeródromos da tabela.
+    seed : int, opcional
+        - Semente do gerador aleatório.
+    date_format : str, opcional
+        - Formato das datas (ver `synthetic_month`).
+    chunksize : int, opcional
+        - Linhas geradas por vez em cada mês.
+
+    Retorna
+    -------
+    tuple[list, pandas.DataFrame]
+        - Caminhos dos arquivos mensais, em ordem cronológica, e tabela de
+        aeródromos.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    aerodromos = synthetic_airports(n_airports, seed=seed)
+    aerodromos.to_csv(os.path.join(output_dir, "aerodromos.csv"), index=False)
+
+    paths = []
+    rows_per_month = np.diff(np.linspace(0, n_rows, n_months + 1).round().astype("int64"))
+    for i, rows in enumerate(rows_per_month):
+        ano, mes = ano_inicio + i // 12, i % 12 + 1
+        path = os.path.join(output_dir, f"VRA_{ano}{mes}.csv")
+        paths.append(write_synthetic_month(path, ano, mes, int(rows), aerodromos, seed=seed + i, date_format=date_format, chunksize=chunksize))
+
+    return paths, aerodromos
+
+def serve_directory(directory: str, port: int = 0) -> tuple[ThreadingHTTPServer, str]:
+    """
+    Serve um diretório por HTTP em uma thread em segundo plano, para que os
+    arquivos sintéticos sejam baixados como os da ANAC (inclusive pelo cache
+    de `etl.raw_cache`, que usa o cabeçalho Last-Modified).
+
+    Parâmetros
+    ----------
+    directory : str
+        - Diretório servido.
+    port : int, opcional
+        - Porta local. Se 0 (padrão), uma porta livre é escolhida.
+
+    Retorna
+    -------
+    tuple[http.server.ThreadingHTTPServer, str]
+        - Servidor (encerrado com `server.shutdown()`) e URL base, ex.:
+        http://127.0.0.1:8765.
+    """
+    class QuietHandler(SimpleHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), partial(QuietHandler, directory=directory))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--linhas", type=int, default=1_000_000, help="total de linhas (todos os meses)")
+    parser.add_argument("--meses", type=int, default=12)
+    parser.add_argument("--ano-inicio", type=int, default=2018)
+    parser.add_argument("--aerodromos", type=int, default=600, help="quantidade de aeródromos")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--formato-data", default=FORMATO_DATA)
+    parser.add_argument("--dir", default=os.path.join(PROJECT_ROOT, "data", "sintetico"), help="diretório de saída")
+    parser.add_argument("--parquet", help="se informado, processa os arquivos em modo streaming e grava ./data/<nome>.parquet")
+    parser.add_argument("--servir", type=int, help="serve o diretório nesta porta ao final")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    paths, aerodromos = generate_synthetic_vra(
+        args.dir,
+        n_rows=args.linhas,
+        n_months=args.meses,
+        ano_inicio=args.ano_inicio,
+        n_airports=args.aerodromos,
+        seed=args.seed,
+        date_format=args.formato_data
+    )
+    size = sum(os.path.getsize(path) for path in paths) / (1024 ** 2)
+    print(f"✔ {len(paths)} arquivos ({args.linhas} linhas, {size:.1f} MB) gerados em {time.perf_counter() - start:.1f}s.")
+    print(f"📁 {args.dir}")
+
+    if args.parquet:
+        from etl.stream_csvs import stream_csvs_to_parquet
+        from helpers.categories import build_categories, categories_path, save_categories
+
+        output_path = os.path.join(PROJECT_ROOT, "data", f"{args.parquet}.parquet")
+        categories = build_categories(aerodromos)
+        stream_csvs_to_parquet(paths, aerodromos, output_path=output_path, categories=categories)
+        save_categories(categories, categories_path(output_path))
+        print(f"   → ./data/{args.parquet}.parquet (use `carregar_dados(\"{args.parquet}\")`)")
+
+    if args.servir is not None:
+        server, base_url = serve_directory(args.dir, args.servir)
+        print(f"\nServindo {args.dir} em {base_url}/VRA_<ano><mes>.csv (Ctrl+C para encerrar)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,12 @@
 from .label_plot import label_plot
 from .plot_central_tendency import plot_central_tendency
 from .plot_feature import plot_feature
-from .parsers import parse_categoricals, parse_datetime, parse_int
\ No newline at end of file
+from .parsers import parse_categoricals, parse_datetime, parse_int
+from .categories import build_categories, update_categories, load_categories, save_categories, categories_path
+from .delay_rates import build_delay_rate_tables, add_delay_rate_features, load_delay_rates, save_delay_rates, delay_rates_path
+from .calendar_features import calendar_features, add_calendar_features, brazilian_holidays
+from .model_artifacts import save_model, load_model, model_artifact_path, import_model_dependencies, LazyModel
+from .model_metadata import build_model_metadata, load_model_metadata, save_model_metadata, model_metadata_path, list_models
+from .manifest import load_manifest, save_manifest
+from .partitions import list_partitions
+from .memory import rss_mb, peak_rss_mb, reset_peak_rss
\ No newline at end of file
@@ -0,0 +1,225 @@
+import numpy as np
+import pandas as pd
+from functools import lru_cache
+
+# Valor das partes de data quando "Data Hora Voo" é nula
+MISSING_TIME_PART = -1
+
+# Features de calendário derivadas de "Data Hora Voo" e seus tipos
+CALENDAR_COLUMNS = {
+    "Hora": "int8",
+    "Dia Semana": "int8",          # 0 = segunda-feira
+    "Mês": "int8",
+    "Dia Ano": "int16",
+    "Feriado": "int8",             # 1 = feriado nacional
+    "Dias Até Feriado": "int8",    # 0 no próprio feriado
+    "Dias Desde Feriado": "int8",
+}
+
+# Limite da distância, em dias, até o feriado mais próximo
+HOLIDAY_PROXIMITY_MAX = 30
+
+# Feriados nacionais de data fixa (mês, dia) e ano de início de vigência
+FIXED_HOLIDAYS = [
+    ((1, 1), None),    # Confraternização Universal
+    ((4, 21), None),   # Tiradentes
+    ((5, 1), None),    # Dia do Trabalho
+    ((9, 7), None),    # Independência
+    ((10, 12), None),  # Nossa Senhora Aparecida
+    ((11, 2), None),   # Finados
+    ((11, 15), None),  # Proclamação da República
+    ((11, 20), 2024),  # Consciência Negra (Lei 14.759/2023)
+    ((12, 25), None),  # Natal
+]
+
+# Feriados móveis, em dias a partir do domingo de Páscoa
+EASTER_HOLIDAYS = [
+    -48,  # Segunda-feira de Carnaval
+    -47,  # Terça-feira de Carnaval
+    -2,   # Sexta-feira Santa
+    60,   # Corpus Christi
+]
+
+def easter_sunday(year: int) -> np.datetime64:
+    """
+    Domingo de Páscoa de um ano (algoritmo de Meeus/Jones/Butcher, calendário
+    gregoriano).
+    """
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return np.datetime64(f"{year:04d}-{month:02d}-{day + 1:02d}", "D")
+
+@lru_cache(maxsize=None)
+def brazilian_holidays(first_year: int, last_year: int) -> np.ndarray:
+    """
+    Tabela dos feriados nacionais brasileiros (fixos, Carnaval, Sexta-feira
+    Santa e Corpus Christi) entre dois anos, calculada localmente, sem
+    consultas externas.
+
+    Parâmetros
+    ----------
+    first_year, last_year : int
+        - Intervalo de anos (inclusive).
+
+    Retorna
+    -------
+    numpy.ndarray
+        - Datas dos feriados (datetime64[D]), ordenadas e sem repetição.
+    """
+    holidays = []
+    for year in range(first_year, last_year + 1):
+        for (month, day), since in FIXED_HOLIDAYS:
+            if since is None or year >= since:
+                holidays.append(np.datetime64(f"{year:04d}-{month:02d}-{day:02d}", "D"))
+        easter = easter_sunday(year)
+        holidays.extend(easter + np.timedelta64(offset, "D") for offset in EASTER_HOLIDAYS)
+
+    holidays = np.unique(np.array(holidays, dtype="datetime64[D]"))
+    holidays.setflags(write=False)
+    return holidays
+
+def time_parts(data_hora: pd.Series) -> dict[str, np.ndarray]:
+    """
+    Decompõe "Data Hora Voo" em epoch e partes de data, de forma vetorizada
+    (aritmética sobre datetime64, sem acessores `.dt`).
+
+    Parâmetros
+    ----------
+    data_hora : pandas.Series
+        - Datas e horas de partida (datetime64, sem fuso horário).
+
+    Retorna
+    -------
+    dict[str, numpy.ndarray]
+        - Arrays "partida_epoch", "hora", "dia_semana", "mes" e "dia_ano".
+    """
+    seconds = data_hora.to_numpy(dtype="datetime64[ns]").astype("datetime64[s]")
+    missing = np.isnat(seconds)
+    days = seconds.astype("datetime64[D]")
+    years = days.astype("datetime64[Y]")
+
+    parts = {
+        "partida_epoch": seconds.astype("int64"),
+        "hora": (seconds - days).astype("int64") // 3600,
+        # 1970-01-01 foi uma quinta-feira
+        "dia_semana": (days.astype("int64") + 3) % 7,
+        "mes": days.astype("datetime64[M]").astype("int64") % 12 + 1,
+        "dia_ano": (days - years.astype("datetime64[D]")).astype("int64") + 1,
+    }
+    for name in ["hora", "dia_semana", "mes", "dia_ano"]:
+        parts[name][missing] = MISSING_TIME_PART
+
+    return parts
+
+def holiday_parts(data_hora: pd.Series) -> dict[str, np.ndarray]:
+    """
+    Indicador de feriado e distância, em dias, até o próximo feriado e desde
+    o anterior, por busca binária na tabela de `brazilian_holidays`.
+
+    Parâmetros
+    ----------
+    data_hora : pandas.Series
+        - Datas e horas de partida (datetime64, sem fuso horário).
+
+    Retorna
+    -------
+    dict[str, numpy.ndarray]
+        - Arrays "feriado", "dias_ate_feriado" e "dias_desde_feriado", com as
+        distâncias limitadas a `HOLIDAY_PROXIMITY_MAX` e -1 para datas nulas.
+    """
+    days = data_hora.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+    missing = np.isnat(days)
+    day_numbers = days.astype("int64")
+
+    if missing.all():
+        empty = np.full(len(days), MISSING_TIME_PART, dtype="int64")
+        return {"feriado": empty, "dias_ate_feriado": empty.copy(), "dias_desde_feriado": empty.copy()}
+
+    # Um ano de margem para as distâncias na virada do ano
+    years = days[~missing].astype("datetime64[Y]").astype("int64") + 1970
+    holidays = brazilian_holidays(int(years.min()) - 1, int(years.max()) + 1).astype("int64")
+
+    position = np.searchsorted(holidays, np.where(missing, holidays[0], day_numbers))
+    next_holiday = holidays[np.minimum(position, len(holidays) - 1)]
+    is_holiday = next_holiday == day_numbers
+    # Feriado anterior: o próprio dia quando é feriado
+    previous_holiday = np.where(is_holiday, day_numbers, holidays[np.maximum(position - 1, 0)])
+
+    parts = {
+        "feriado": is_holiday.astype("int64"),
+        "dias_ate_feriado": np.minimum(next_holiday - day_numbers, HOLIDAY_PROXIMITY_MAX),
+        "dias_desde_feriado": np.minimum(day_numbers - previous_holiday, HOLIDAY_PROXIMITY_MAX),
+    }
+    for values in parts.values():
+        values[missing] = MISSING_TIME_PART
+
+    return parts
+
+def calendar_features(data_hora: pd.Series, columns: list | None = None) -> pd.DataFrame:
+    """
+    Calcula as features de calendário (ver `CALENDAR_COLUMNS`) de
+    "Data Hora Voo" em uma única passagem vetorizada. Usada tanto pelo ETL,
+    que grava as colunas no dataset, quanto pela API.
+
+    Parâmetros
+    ----------
+    data_hora : pandas.Series
+        - Datas e horas de partida (datetime64, sem fuso horário).
+    columns : list, opcional
+        - Colunas de `CALENDAR_COLUMNS` a serem calculadas. Se None, todas.
+
+    Retorna
+    -------
+    pandas.DataFrame
+        - Features de calendário em inteiros pequenos, com o mesmo índice de
+        `data_hora`. Datas nulas recebem -1.
+    """
+    parts = time_parts(data_hora)
+    parts.update(holiday_parts(data_hora))
+
+    names = {
+        "Hora": "hora",
+        "Dia Semana": "dia_semana",
+        "Mês": "mes",
+        "Dia Ano": "dia_ano",
+        "Feriado": "feriado",
+        "Dias Até Feriado": "dias_ate_feriado",
+        "Dias Desde Feriado": "dias_desde_feriado",
+    }
+
+    return pd.DataFrame(
+        {
+            col: parts[names[col]].astype(dtype)
+            for col, dtype in CALENDAR_COLUMNS.items()
+            if columns is None or col in columns
+        },
+        index=data_hora.index
+    )
+
+def add_calendar_features(df: pd.DataFrame, columns: list | None = None) -> pd.DataFrame:
+    """
+    Acrescenta a `df` as features de calendário de "Data Hora Voo" (ver
+    `calendar_features`), substituindo as que já existirem.
+
+    Parâmetros
+    ----------
+    df : pandas.DataFrame
+        - Voos com a coluna "Data Hora Voo" já convertida para datetime.
+    columns : list, opcional
+        - Colunas de `CALENDAR_COLUMNS` a serem acrescentadas. Se None, todas.
+
+    Retorna
+    -------
+    pandas.DataFrame
+        - `df` com as colunas de calendário.
+    """
+    features = calendar_features(df["Data Hora Voo"], columns=columns)
+    return pd.concat([df.drop(columns=[col for col in features if col in df]), features], axis=1)
@@ -0,0 +1,211 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+from typing import Iterable
+
+# Colunas categóricas e o dicionário global usado por cada uma
+CATEGORICAL_COLUMNS = {
+    "Empresa Aérea": "empresas",
+    "Aeródromo Origem": "aerodromos",
+    "Aeródromo Destino": "aerodromos",
+}
+
+CATEGORIES_FILENAME = "categorias.json"
+
+def categories_path(path: str) -> str:
+    """
+    Monta o caminho do arquivo de dicionários categóricos salvo junto a um
+    dataset ou modelo.
+
+    Parâmetros
+    ----------
+    path : str
+        - Caminho do dataset (arquivo .parquet ou diretório particionado) ou
+        do modelo (.pkl).
+
+    Retorna
+    -------
+    str
+        - <diretório>/_categorias.json para diretórios, ou
+        <arquivo sem extensão>_categorias.json para arquivos.
+    """
+    if os.path.isdir(path):
+        return os.path.join(path, f"_{CATEGORIES_FILENAME}")
+    return f"{os.path.splitext(path)[0]}_{CATEGORIES_FILENAME}"
+
+def load_categories(path: str) -> dict | None:
+    """
+    Carrega os dicionários categóricos de um arquivo JSON.
+
+    Parâmetros
+    ----------
+    path : str
+        - Caminho do arquivo JSON.
+
+    Retorna
+    -------
+    dict | None
+        - Dicionários ("versao", "empresas" e "aerodromos"), ou None caso o
+        arquivo não exista.
+    """
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def save_categories(categories: dict, path: str) -> None:
+    """
+    Salva os dicionários categóricos em JSON, de forma atômica (arquivo
+    temporário + rename).
+
+    Parâmetros
+    ----------
+    categories : dict
+        - Dicionários a serem salvos.
+    path : str
+        - Caminho do arquivo JSON.
+
+    Retorna
+    -------
+    None
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(categories, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def append_categories(categories: dict | None, name: str, values: Iterable) -> dict:
+    """
+    Acrescenta ao final de um dicionário os valores ainda não registrados.
+
+    Os dicionários só crescem: valores existentes nunca mudam de posição,
+    de modo que os códigos das categorias continuam válidos entre versões.
+    Quando algum valor é acrescentado, a versão é incrementada.
+
+    Parâmetros
+    ----------
+    categories : dict | None
+        - Dicionários a serem atualizados (alterados no próprio objeto). Se
+        None, cria dicionários vazios.
+    name : str
+        - Nome do dicionário ("empresas" ou "aerodromos").
+    values : Iterable
+        - Valores observados. Valores nulos são ignorados.
+
+    Retorna
+    -------
+    dict
+        - Dicionários atualizados.
+    """
+    if categories is None:
+        categories = {"versao": 0, "empresas": [], "aerodromos": []}
+
+    known = set(categories[name])
+    new = sorted({str(value) for value in values if pd.notna(value)} - known)
+
+    if new:
+        categories[name].extend(new)
+        categories["versao"] += 1
+
+    return categories
+
+def build_categories(aerodromos: pd.DataFrame, categories: dict | None = None) -> dict:
+    """
+    Constrói (ou completa) os dicionários categóricos com todos os códigos
+    OACI da tabela de aeródromos da ANAC.
+
+    Parâmetros
+    ----------
+    aerodromos : pandas.DataFrame
+        - DataFrame contendo informações sobre aeródromos da ANAC.
+    categories : dict | None, opcional
+        - Dicionários existentes (ex.: carregados de metadata/categorias.json).
+
+    Retorna
+    -------
+    dict
+        - Dicionários atualizados.
+    """
+    return append_categories(categories, "aerodromos", aerodromos["Código OACI"].unique())
+
+def update_categories(categories: dict | None, df: pd.DataFrame) -> dict:
+    """
+    Acrescenta aos dicionários as empresas e aeródromos observados em um
+    DataFrame (ver `append_categories`).
+
+    Parâmetros
+    ----------
+    categories : dict | None
+        - Dicionários a serem atualizados (alterados no próprio objeto).
+    df : pandas.DataFrame
+        - DataFrame com as colunas de `CATEGORICAL_COLUMNS`.
+
+    Retorna
+    -------
+    dict
+        - Dicionários atualizados.
+    """
+    for col, name in CATEGORICAL_COLUMNS.items():
+        if col not in df:
+            continue
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            # Apenas as categorias efetivamente usadas nas linhas
+            codes = df[col].cat.codes.to_numpy()
+            used = np.bincount(codes[codes >= 0], minlength=len(df[col].cat.categories)) > 0
+            values = df[col].cat.categories[used]
+        else:
+            values = df[col].unique()
+        categories = append_categories(categories, name, values)
+
+    return categories
+
+def category_codes(values: pd.Series, dictionary: list | pd.Index) -> np.ndarray:
+    """
+    Converte valores em códigos de um dicionário categórico global.
+
+    Para colunas categóricas, apenas as categorias são consultadas no
+    dicionário e os códigos são obtidos por indexação.
+
+    Parâmetros
+    ----------
+    values : pandas.Series
+        - Valores a serem convertidos.
+    dictionary : list | pandas.Index
+        - Dicionário global (ex.: `categories["aerodromos"]`). Um
+        `pandas.Index` já construído evita recriar a tabela hash a cada
+        chamada.
+
+    Retorna
+    -------
+    numpy.ndarray
+        - Posição de cada valor no dicionário, ou -1 para valores nulos ou
+        ausentes do dicionário.
+    """
+    index = dictionary if isinstance(dictionary, pd.Index) else pd.Index(dictionary)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        lookup = np.append(index.get_indexer(values.cat.categories), -1)
+        return lookup[values.cat.codes.to_numpy()]
+    return index.get_indexer(values)
+
+def categorical_dtypes(categories: dict) -> dict[str, pd.CategoricalDtype]:
+    """
+    Gera os tipos categóricos fixos de cada coluna a partir dos dicionários.
+
+    Parâmetros
+    ----------
+    categories : dict
+        - Dicionários categóricos.
+
+    Retorna
+    -------
+    dict[str, pandas.CategoricalDtype]
+        - Tipo de cada coluna de `CATEGORICAL_COLUMNS`.
+    """
+    return {
+        col: pd.CategoricalDtype(categories[name])
+        for col, name in CATEGORICAL_COLUMNS.items()
+    }
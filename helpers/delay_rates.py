@@ -0,0 +1,367 @@
+import os
+import uuid
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from functools import cached_property
+
+from helpers.categories import category_codes
+
+# Arquivo das tabelas de taxa de atraso salvo junto ao dataset ou ao modelo
+DELAY_RATES_FILENAME = "taxas_atraso.npz"
+
+# Colunas do dataset usadas no cálculo das tabelas
+DELAY_RATE_COLUMNS = ["Empresa Aérea", "Aeródromo Origem", "Aeródromo Destino", "Data Hora Voo", "Atrasado"]
+
+# Chaves das taxas de atraso e rótulo usado nos nomes das features
+DELAY_RATE_KEYS = {
+    "rota": "Rota",
+    "companhia": "Companhia",
+    "origem": "Origem",
+    "hora": "Hora",
+}
+
+def delay_rates_path(path: str) -> str:
+    """
+    Monta o caminho do arquivo de taxas de atraso salvo junto a um dataset
+    ou modelo (ver `helpers.categories.categories_path`).
+
+    Parâmetros
+    ----------
+    path : str
+        - Caminho do dataset (.parquet ou diretório) ou do modelo (.pkl).
+
+    Retorna
+    -------
+    str
+        - <diretório>/_taxas_atraso.npz para diretórios, ou
+        <arquivo sem extensão>_taxas_atraso.npz para arquivos.
+    """
+    if os.path.isdir(path):
+        return os.path.join(path, f"_{DELAY_RATES_FILENAME}")
+    return f"{os.path.splitext(path)[0]}_{DELAY_RATES_FILENAME}"
+
+def month_index(data_hora: pd.Series) -> np.ndarray:
+    """
+    Meses desde janeiro de 1970 de cada "Data Hora Voo" (-1 para nulos).
+    """
+    months = data_hora.to_numpy(dtype="datetime64[ns]").astype("datetime64[M]")
+    return np.where(np.isnat(months), -1, months.astype("int64"))
+
+def hour_of_day(data_hora: pd.Series) -> np.ndarray:
+    """
+    Hora do dia de cada "Data Hora Voo" (-1 para nulos).
+    """
+    values = data_hora.to_numpy(dtype="datetime64[ns]")
+    hours = (values - values.astype("datetime64[D]")).astype("timedelta64[h]").astype("int64")
+    return np.where(np.isnat(values), -1, hours)
+
+@dataclass(frozen=True)
+class DelayRateTables:
+    """
+    Tabelas de taxa de atraso e volume de voos por rota, companhia, aeródromo
+    de origem e hora do dia, em janelas móveis de meses.
+
+    Cada tabela é um array [mês, chave]: a linha do mês `m` acumula apenas
+    os voos dos `w` meses anteriores a `m` (o próprio mês não entra), de modo
+    que a feature de um voo nunca usa dados do mesmo mês ou posteriores. A
+    última linha (mês seguinte ao último do histórico) é a usada para voos
+    futuros na API. A consulta é uma indexação em array por voo, sem merges.
+
+    As taxas são suavizadas em direção à taxa global do histórico anterior
+    ao mês (também sem o próprio mês):
+    (atrasos + peso * taxa_global[mês]) / (voos + peso). A linha 0, sem
+    nenhum voo anterior, tem taxa global NaN.
+
+    Atributos
+    ---------
+    first_month : int
+        - Primeiro mês do histórico, em meses desde janeiro de 1970.
+    windows : tuple[int, ...]
+        - Tamanhos das janelas, em meses.
+    prior : numpy.ndarray
+        - Taxa global de atraso de todos os voos anteriores a cada mês (uma
+        por linha das tabelas; NaN na linha 0).
+    prior_weight : float
+        - Peso (em voos) da taxa global na suavização.
+    empresas, aerodromos : numpy.ndarray
+        - Dicionários categóricos usados nos códigos das chaves.
+    routes : numpy.ndarray
+        - Rotas observadas (origem * len(aerodromos) + destino); o id de cada
+        rota é sua posição.
+    rates, volumes : dict[str, numpy.ndarray]
+        - Taxas (float32) e volumes (int32) de cada chave e janela, indexados
+        por "<chave>_<janela>m" (ex.: "rota_12m").
+    """
+    first_month: int
+    windows: tuple
+    prior: np.ndarray
+    prior_weight: float
+    empresas: np.ndarray
+    aerodromos: np.ndarray
+    routes: np.ndarray
+    rates: dict
+    volumes: dict
+
+    @cached_property
+    def _indexes(self) -> dict[str, pd.Index]:
+        """
+        Tabelas hash dos dicionários e das rotas, construídas uma única vez
+        (consulta O(1) por valor).
+        """
+        return {
+            "empresas": pd.Index(self.empresas),
+            "aerodromos": pd.Index(self.aerodromos),
+            "routes": pd.Index(self.routes),
+        }
+
+    def key_ids(self, df: pd.DataFrame) -> dict[str, np.ndarray]:
+        """
+        Ids de cada chave para os voos de `df` (-1 quando a chave não tem
+        histórico).
+        """
+        origem = category_codes(df["Aeródromo Origem"], self._indexes["aerodromos"])
+        destino = category_codes(df["Aeródromo Destino"], self._indexes["aerodromos"])
+        pair = np.where((origem >= 0) & (destino >= 0), origem * len(self.aerodromos) + destino, -1)
+
+        return {
+            "rota": self._indexes["routes"].get_indexer(pair),
+            "companhia": category_codes(df["Empresa Aérea"], self._indexes["empresas"]),
+            "origem": origem,
+            "hora": hour_of_day(df["Data Hora Voo"]),
+        }
+
+    def lookup(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Consulta as taxas de atraso e volumes de cada voo.
+
+        Parâmetros
+        ----------
+        df : pandas.DataFrame
+            - Voos com "Empresa Aérea", "Aeródromo Origem", "Aeródromo
+            Destino" e "Data Hora Voo".
+
+        Retorna
+        -------
+        pandas.DataFrame
+            - Uma coluna "Taxa Atraso <Chave> (<janela>m)" (float32) e uma
+            "Voos <Chave> (<janela>m)" (int32) por chave e janela, com o mesmo
+            índice de `df`. Voos de chaves sem histórico recebem a taxa global
+            anterior ao seu mês e volume 0.
+        """
+        n_months = next(iter(self.rates.values())).shape[0]
+        month = month_index(df["Data Hora Voo"])
+        # Antes do histórico: linha 0 (vazia); depois: última linha
+        row = np.where(month < 0, 0, month - self.first_month).clip(0, n_months - 1)
+
+        features = {}
+        for key, ids in self.key_ids(df).items():
+            for window in self.windows:
+                name = f"{key}_{window}m"
+                rates, volumes = self.rates[name], self.volumes[name]
+                valid = (ids >= 0) & (ids < rates.shape[1])
+                col = ids.clip(0, max(rates.shape[1] - 1, 0))
+
+                label = f"{DELAY_RATE_KEYS[key]} ({window}m)"
+                features[f"Taxa Atraso {label}"] = np.where(valid, rates[row, col], self.prior[row]).astype("float32")
+                features[f"Voos {label}"] = np.where(valid, volumes[row, col], 0).astype("int32")
+
+        return pd.DataFrame(features, index=df.index)
+
+    @property
+    def feature_names(self) -> list:
+        """
+        Nomes das colunas geradas por `lookup`.
+        """
+        return [
+            f"{kind} {DELAY_RATE_KEYS[key]} ({window}m)"
+            for key in DELAY_RATE_KEYS
+            for window in self.windows
+            for kind in ["Taxa Atraso", "Voos"]
+        ]
+
+def build_delay_rate_tables(
+    df: pd.DataFrame,
+    categories: dict,
+    windows: tuple = (3, 12),
+    prior_weight: float = 20.0
+) -> DelayRateTables:
+    """
+    Calcula as tabelas de taxa de atraso por rota, companhia, aeródromo de
+    origem e hora do dia em uma única passagem vetorizada por chave: os voos
+    e atrasos de cada (mês, chave) são contados com `numpy.bincount`, e as
+    janelas móveis são diferenças da soma acumulada ao longo dos meses.
+
+    Parâmetros
+    ----------
+    df : pandas.DataFrame
+        - Dataset de voos (formato de `carregar_dados`).
+    categories : dict
+        - Dicionários categóricos globais (ver `helpers.categories`).
+    windows : tuple, opcional
+        - Tamanhos das janelas, em meses.
+    prior_weight : float, opcional
+        - Peso, em voos, da taxa global na suavização das taxas de chaves com
+        poucos voos.
+
+    Retorna
+    -------
+    DelayRateTables
+        - Tabelas de consulta.
+
+    Exceções
+    --------
+    ValueError
+        - Lançada quando o dataset não tem nenhum voo com data.
+    """
+    month = month_index(df["Data Hora Voo"])
+    valid = month >= 0
+    if not valid.any():
+        raise ValueError("O dataset não contém voos com data para calcular as taxas de atraso.")
+
+    first_month = int(month[valid].min())
+    n_months = int(month[valid].max()) - first_month + 1
+    row = month[valid] - first_month
+    y = df["Atrasado"].to_numpy()[valid].astype("float64")
+
+    # Taxa global acumulada até o início de cada mês (linha 0 = nenhum voo)
+    total_flights = np.concatenate([[0.0], np.bincount(row, minlength=n_months).cumsum()])
+    total_delays = np.concatenate([[0.0], np.bincount(row, weights=y, minlength=n_months).cumsum()])
+    prior = np.divide(total_delays, total_flights, out=np.full(n_months + 1, np.nan), where=total_flights > 0)
+
+    empresas = np.array(categories["empresas"])
+    aerodromos = np.array(categories["aerodromos"])
+
+    # Rotas observadas, identificadas pelo par de códigos de aeródromo
+    origem = category_codes(df["Aeródromo Origem"], aerodromos)[valid]
+    destino = category_codes(df["Aeródromo Destino"], aerodromos)[valid]
+    pair = np.where((origem >= 0) & (destino >= 0), origem * len(aerodromos) + destino, -1)
+    routes, route = np.unique(pair, return_inverse=True)
+    if len(routes) and routes[0] == -1:
+        routes, route = routes[1:], route - 1
+
+    keys = {
+        "rota": (route, len(routes)),
+        "companhia": (category_codes(df["Empresa Aérea"], empresas)[valid], len(empresas)),
+        "origem": (origem, len(aerodromos)),
+        "hora": (hour_of_day(df["Data Hora Voo"])[valid], 24),
+    }
+
+    rates, volumes = {}, {}
+    for key, (ids, n_keys) in keys.items():
+        known = ids >= 0
+        flat = row[known] * n_keys + ids[known]
+        size = n_months * n_keys
+
+        # Totais acumulados até o início de cada mês (linha 0 = nenhum voo)
+        flights = np.zeros((n_months + 1, n_keys))
+        delays = np.zeros((n_months + 1, n_keys))
+        flights[1:] = np.bincount(flat, minlength=size).reshape(n_months, n_keys).cumsum(axis=0)
+        delays[1:] = np.bincount(flat, weights=y[known], minlength=size).reshape(n_months, n_keys).cumsum(axis=0)
+
+        for window in windows:
+            start = np.maximum(np.arange(n_months + 1) - window, 0)
+            n = flights - flights[start]
+            d = delays - delays[start]
+            rates[f"{key}_{window}m"] = ((d + prior_weight * prior[:, np.newaxis]) / (n + prior_weight)).astype("float32")
+            volumes[f"{key}_{window}m"] = n.astype("int32")
+
+    return DelayRateTables(
+        first_month=first_month,
+        windows=tuple(windows),
+        prior=prior,
+        prior_weight=float(prior_weight),
+        empresas=empresas,
+        aerodromos=aerodromos,
+        routes=routes,
+        rates=rates,
+        volumes=volumes,
+    )
+
+def add_delay_rate_features(df: pd.DataFrame, tables: DelayRateTables) -> pd.DataFrame:
+    """
+    Acrescenta a `df` as features de taxa de atraso (ver
+    `DelayRateTables.lookup`). Usada tanto no treino quanto na API.
+
+    Parâmetros
+    ----------
+    df : pandas.DataFrame
+        - Voos.
+    tables : DelayRateTables
+        - Tabelas de consulta.
+
+    Retorna
+    -------
+    pandas.DataFrame
+        - `df` com as colunas de taxa de atraso e volume.
+    """
+    return pd.concat([df, tables.lookup(df)], axis=1)
+
+def save_delay_rates(tables: DelayRateTables, path: str) -> None:
+    """
+    Salva as tabelas de taxa de atraso em um arquivo .npz (sem compressão),
+    de forma atômica.
+
+    Parâmetros
+    ----------
+    tables : DelayRateTables
+        - Tabelas a serem salvas.
+    path : str
+        - Caminho do arquivo .npz.
+
+    Retorna
+    -------
+    None
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = os.path.join(os.path.dirname(os.path.abspath(path)), f".{uuid.uuid4().hex}.npz")
+
+    arrays = {
+        "first_month": np.array(tables.first_month),
+        "windows": np.array(tables.windows),
+        "prior": tables.prior,
+        "prior_weight": np.array(tables.prior_weight),
+        "empresas": tables.empresas.astype(str),
+        "aerodromos": tables.aerodromos.astype(str),
+        "routes": tables.routes,
+    }
+    arrays.update({f"rates/{name}": values for name, values in tables.rates.items()})
+    arrays.update({f"volumes/{name}": values for name, values in tables.volumes.items()})
+
+    try:
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def load_delay_rates(path: str) -> DelayRateTables | None:
+    """
+    Carrega as tabelas de taxa de atraso salvas por `save_delay_rates`.
+
+    Parâmetros
+    ----------
+    path : str
+        - Caminho do arquivo .npz.
+
+    Retorna
+    -------
+    DelayRateTables | None
+        - Tabelas de consulta, ou None caso o arquivo não exista.
+    """
+    if not os.path.exists(path):
+        return None
+
+    with np.load(path) as data:
+        return DelayRateTables(
+            first_month=int(data["first_month"]),
+            windows=tuple(int(w) for w in data["windows"]),
+            prior=data["prior"],
+            prior_weight=float(data["prior_weight"]),
+            empresas=data["empresas"],
+            aerodromos=data["aerodromos"],
+            routes=data["routes"],
+            rates={name.split("/", 1)[1]: data[name] for name in data.files if name.startswith("rates/")},
+            volumes={name.split("/", 1)[1]: data[name] for name in data.files if name.startswith("volumes/")},
+        )
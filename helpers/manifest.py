@@ -0,0 +1,62 @@
+import os
+import json
+import threading
+
+# Nome padrão do arquivo de manifesto (cache de arquivos brutos do ETL)
+MANIFEST_FILENAME = "manifest.json"
+
+# Serializa as atualizações de manifestos entre threads (reentrante: quem já o
+# detém pode chamar `save_manifest`)
+manifest_lock = threading.RLock()
+
+def load_manifest(cache_dir: str, filename: str = MANIFEST_FILENAME) -> dict:
+    """
+    Carrega um manifesto JSON de cache (ex.: o cache de arquivos brutos do
+    ETL ou o cache de experimentos).
+
+    Parâmetros
+    ----------
+    cache_dir : str
+        - Diretório do cache.
+    filename : str, opcional
+        - Nome do arquivo de manifesto.
+
+    Retorna
+    -------
+    dict
+        - Manifesto (ex.: no cache de arquivos brutos, indexado pela URL, com
+        "file", "size", "sha256", "etag", "last_modified", "fetched_at" e
+        "checked_at"). Vazio caso o manifesto ainda não exista.
+    """
+    manifest_path = os.path.join(cache_dir, filename)
+    if not os.path.exists(manifest_path):
+        return {}
+
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def save_manifest(cache_dir: str, manifest: dict, filename: str = MANIFEST_FILENAME) -> None:
+    """
+    Salva um manifesto de cache de forma atômica (arquivo temporário + rename).
+
+    Parâmetros
+    ----------
+    cache_dir : str
+        - Diretório do cache.
+    manifest : dict
+        - Manifesto a ser salvo.
+    filename : str, opcional
+        - Nome do arquivo de manifesto.
+
+    Retorna
+    -------
+    None
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    manifest_path = os.path.join(cache_dir, filename)
+    tmp_path = f"{manifest_path}.tmp"
+
+    with manifest_lock:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp_path, manifest_path)
@@ -0,0 +1,69 @@
+import sys
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+def rss_mb() -> float | None:
+    """
+    Memória residente (RSS) atual do processo, em MB.
+
+    Retorna
+    -------
+    float | None
+        - RSS em MB (VmRSS de /proc), ou None fora do Linux.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+def peak_rss_mb() -> float | None:
+    """
+    Pico de memória residente (RSS) do processo atual, em MB.
+
+    Usa VmHWM de /proc quando disponível (no Linux, o ru_maxrss é herdado do
+    processo pai através do execve) e, nos demais sistemas, o ru_maxrss.
+
+    Retorna
+    -------
+    float | None
+        - Pico de RSS em MB, ou None quando não há como medi-lo (Windows).
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss é dado em bytes no macOS e em KB nos demais sistemas
+    return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+def reset_peak_rss() -> bool:
+    """
+    Zera o pico de memória residente (VmHWM) do processo, para que
+    `peak_rss_mb` passe a medir o pico a partir deste ponto.
+
+    Retorna
+    -------
+    bool
+        - True se o pico foi zerado (Linux); False quando não há suporte, caso
+        em que `peak_rss_mb` continua sendo o pico de toda a vida do processo.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
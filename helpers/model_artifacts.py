@@ -0,0 +1,242 @@
+import os
+import time
+import uuid
+import pickle
+import joblib
+import warnings
+import importlib
+import threading
+
+# Extensões de artefato de modelo
+MODEL_EXTENSIONS = [".joblib", ".pkl"]
+
+# Formatos aceitos por `save_model` e sua extensão
+ARTIFACT_FORMATS = {"joblib": ".joblib", "pickle": ".pkl"}
+
+# Bibliotecas importadas pelos modelos ao serem desserializados
+MODEL_DEPENDENCIES = ["automlx", "sklearn", "lightgbm", "xgboost"]
+
+def model_artifact_path(path: str) -> str:
+    """
+    Localiza o artefato de um modelo a partir do caminho sem extensão (ou com
+    uma das extensões de `MODEL_EXTENSIONS`).
+
+    Parâmetros
+    ----------
+    path : str
+        - Caminho do modelo, com ou sem extensão.
+
+    Retorna
+    -------
+    str
+        - O próprio caminho, quando já tem extensão de artefato. Caso
+        contrário, o artefato existente (`save_model` mantém um único
+        formato por modelo; se houver os dois, o gravado por último) ou, se
+        nenhum existir, o caminho com extensão .pkl.
+    """
+    if os.path.splitext(path)[1] in MODEL_EXTENSIONS:
+        return path
+
+    existing = [f"{path}{extension}" for extension in MODEL_EXTENSIONS if os.path.exists(f"{path}{extension}")]
+    if not existing:
+        return f"{path}.pkl"
+
+    return max(existing, key=os.path.getmtime)
+
+def save_model(estimator, path: str, artifact_format: str = "pickle", compress: int = 0) -> str:
+    """
+    Salva um modelo treinado, de forma atômica. Um artefato do mesmo modelo
+    no outro formato é removido, para que nunca seja carregado no lugar do
+    novo.
+
+    No formato "joblib", os arrays numpy do modelo (ex.: coeficientes,
+    árvores do scikit-learn, tabelas dos encoders) são gravados fora do
+    grafo de objetos, sem compressão e alinhados, e podem ser abertos como
+    memory map por `load_model`: a carga lê apenas o grafo de objetos, e
+    processos que servem o mesmo modelo compartilham as páginas dos arrays.
+
+    Parâmetros
+    ----------
+    estimator : automlx._interface.classifier.AutoClassifier
+        - Modelo treinado.
+    path : str
+        - Caminho do artefato, sem extensão.
+    artifact_format : str, opcional
+        - "pickle" (padrão, .pkl) ou "joblib" (.joblib).
+    compress : int, opcional
+        - Nível de compressão (0 a 9) do formato "joblib", para
+        armazenamento. Artefatos comprimidos não podem ser abertos como
+        memory map. Padrão é 0.
+
+    Retorna
+    -------
+    str
+        - Caminho do artefato gravado.
+
+    Exceções
+    --------
+    ValueError
+        - Lançada para formatos desconhecidos ou compressão no formato
+        "pickle".
+    """
+    if artifact_format not in ARTIFACT_FORMATS:
+        raise ValueError(f"Formato de artefato inválido: {artifact_format}. Use 'pickle' ou 'joblib'.")
+    if compress and artifact_format != "joblib":
+        raise ValueError("A compressão só está disponível no formato 'joblib'.")
+
+    artifact_path = f"{path}{ARTIFACT_FORMATS[artifact_format]}"
+    directory = os.path.dirname(os.path.abspath(artifact_path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = os.path.join(directory, f".{uuid.uuid4().hex}.tmp")
+
+    try:
+        if artifact_format == "joblib":
+            joblib.dump(estimator, tmp_path, compress=compress)
+        else:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(estimator, f)
+        os.replace(tmp_path, artifact_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    # Remove o artefato anterior em outro formato
+    for extension in MODEL_EXTENSIONS:
+        stale_path = f"{path}{extension}"
+        if stale_path != artifact_path and os.path.exists(stale_path):
+            os.remove(stale_path)
+
+    return artifact_path
+
+def load_model(path: str, mmap: bool = True):
+    """
+    Carrega um modelo salvo em .pkl ou .joblib (ver `save_model`).
+
+    Parâmetros
+    ----------
+    path : str
+        - Caminho do modelo, com ou sem extensão (ver `model_artifact_path`).
+    mmap : bool, opcional
+        - Se True (padrão), os arrays de um artefato .joblib sem compressão
+        são abertos como memory map somente leitura, em vez de copiados para
+        a memória.
+
+    Retorna
+    -------
+    automlx._interface.classifier.AutoClassifier
+        - Modelo carregado.
+
+    Exceções
+    --------
+    FileNotFoundError
+        - Lançada quando o modelo não existe.
+    """
+    artifact_path = model_artifact_path(path)
+    if not os.path.exists(artifact_path):
+        raise FileNotFoundError(f"Modelo não encontrado: {artifact_path}")
+
+    if artifact_path.endswith(".joblib"):
+        # Artefatos comprimidos ignoram o mmap_mode (com aviso) e são lidos inteiros
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message="mmap_mode .* is not compatible with compressed file")
+            return joblib.load(artifact_path, mmap_mode="r" if mmap else None)
+
+    with open(artifact_path, "rb") as f:
+        return pickle.load(f)
+
+def import_model_dependencies() -> list[str]:
+    """
+    Importa as bibliotecas dos modelos (`MODEL_DEPENDENCIES`) que estiverem
+    instaladas, para que medições de tempo e memória da carga de um artefato
+    não incluam a importação delas.
+
+    Retorna
+    -------
+    list[str]
+        - Bibliotecas importadas.
+    """
+    imported = []
+    for module in MODEL_DEPENDENCIES:
+        try:
+            importlib.import_module(module)
+            imported.append(module)
+        except ImportError:
+            pass
+    return imported
+
+def _identity(model):
+    # Desserializa um `LazyModel` como o próprio modelo
+    return model
+
+class LazyModel:
+    """
+    Proxy de um modelo salvo que só o carrega (ver `load_model`) no primeiro
+    acesso a um atributo, como `predict_proba`.
+
+    A carga é feita uma única vez, mesmo com acessos simultâneos de várias
+    threads. Ao ser serializado (pickle), o proxy carrega e serializa o
+    próprio modelo, de modo que hashes e processos filhos veem o modelo real.
+
+    Atributos
+    ---------
+    path : str
+        - Caminho do artefato.
+    name : str
+        - Nome do modelo, usado nas mensagens.
+    load_s : float | None
+        - Tempo da carga, em segundos, ou None se ainda não carregado.
+    error : Exception | None
+        - Erro da carga, relançado nos acessos seguintes.
+    """
+    def __init__(self, path: str, name: str | None = None, mmap: bool = True):
+        self.path = path
+        self.name = name or os.path.basename(path)
+        self.mmap = mmap
+        self.load_s = None
+        self.error = None
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._model is not None
+
+    def load(self):
+        """
+        Carrega o modelo (apenas na primeira chamada) e o retorna.
+
+        Exceções
+        --------
+        RuntimeError
+            - Lançada quando a carga falha (o erro original é encadeado).
+        """
+        if self._model is None:
+            with self._lock:
+                if self._model is None and self.error is None:
+                    start = time.perf_counter()
+                    try:
+                        self._model = load_model(self.path, mmap=self.mmap)
+                    except Exception as e:
+                        self.error = e
+                    self.load_s = time.perf_counter() - start
+                    if self.error is None:
+                        print(f"✔ Modelo '{self.name}' carregado em {self.load_s:.2f}s")
+                    else:
+                        print(f"❌ Erro ao carregar o modelo '{self.name}': {self.error}")
+
+        if self.error is not None:
+            raise RuntimeError(f"O modelo '{self.name}' não pôde ser carregado.") from self.error
+        return self._model
+
+    def __getattr__(self, attr: str):
+        # Chamado apenas para atributos que não são do proxy
+        if attr.startswith("__") or attr in ("_model", "_lock"):
+            raise AttributeError(attr)
+        return getattr(self.load(), attr)
+
+    def __reduce_ex__(self, protocol):
+        return _identity, (self.load(),)
+
+    def __repr__(self) -> str:
+        status = "carregado" if self.loaded else "erro" if self.error is not None else "não carregado"
+        return f"LazyModel({self.name!r}, {status})"
@@ -0,0 +1,196 @@
+import os
+import json
+import hashlib
+from datetime import datetime, timezone
+
+METADATA_FILENAME = "metadata.json"
+
+# Campos do sidecar omitidos nas listagens de modelos (volumosos)
+LISTING_EXCLUDED_FIELDS = ["categories", "specifications", "features"]
+
+def model_metadata_path(path: str) -> str:
+    """
+    Monta o caminho do sidecar de metadados salvo junto a um modelo.
+
+    O sidecar é compartilhado pelos formatos .pkl e .joblib do mesmo modelo;
+    o campo "artifact" indica a qual artefato ele se refere (ver
+    `artifact_matches_metadata`).
+
+    Parâmetros
+    ----------
+    path : str
+        - Caminho do modelo (.pkl ou .joblib).
+
+    Retorna
+    -------
+    str
+        - <arquivo sem extensão>_metadata.json.
+    """
+    return f"{os.path.splitext(path)[0]}_{METADATA_FILENAME}"
+
+def file_sha256(path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    Hash SHA-256 de um arquivo, lido em blocos.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def build_model_metadata(
+    estimator,
+    artifact_path: str,
+    categories: dict | None = None,
+    derived_features: list | None = None,
+    training_time: float | None = None
+) -> dict:
+    """
+    Monta os metadados de um modelo exportado, com os mesmos campos de
+    `utils.get_model_metadata` e as informações do artefato.
+
+    Parâmetros
+    ----------
+    estimator : automlx._interface.classifier.AutoClassifier
+        - Modelo treinado.
+    artifact_path : str
+        - Caminho do artefato já gravado (ver `helpers.model_artifacts`).
+    categories : dict, opcional
+        - Dicionários categóricos usados no treino (ver `helpers.categories`).
+    derived_features : list, opcional
+        - Features calculadas na inferência a partir dos sidecars (ex.: taxas
+        de atraso, ver `helpers.delay_rates`).
+    training_time : float, opcional
+        - Tempo de treinamento, em segundos. Se None, usa o
+        `training_time_` do modelo, quando existir.
+
+    Retorna
+    -------
+    dict
+        - Metadados serializáveis em JSON.
+    """
+    features_raw = getattr(estimator, "selected_features_names_raw_", None)
+    specifications = getattr(estimator, "selected_model_params_", None)
+    score_metric = getattr(estimator, "score_metric_", None)
+
+    return {
+        "artifact": os.path.basename(artifact_path),
+        "format": "joblib" if artifact_path.endswith(".joblib") else "pickle",
+        "size_bytes": os.path.getsize(artifact_path),
+        "sha256": file_sha256(artifact_path),
+        "model": str(getattr(estimator, "selected_model_", type(estimator).__name__)),
+        "model_type": type(estimator).__name__,
+        "specifications": json.loads(json.dumps(specifications, default=str)),
+        "features": list(getattr(estimator, "selected_features_names_", None) or []),
+        # Mantém a ordem original, sem repetições
+        "features_raw": list(dict.fromkeys(features_raw)) if features_raw is not None else [],
+        "derived_features": list(derived_features or []),
+        "categories": categories,
+        "training_time": training_time if training_time is not None else getattr(estimator, "training_time_", None),
+        "score_metric": None if score_metric is None else str(score_metric),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+def save_model_metadata(metadata: dict, path: str) -> None:
+    """
+    Salva os metadados de um modelo em JSON, de forma atômica (arquivo
+    temporário + rename).
+
+    Parâmetros
+    ----------
+    metadata : dict
+        - Metadados a serem salvos (ver `build_model_metadata`).
+    path : str
+        - Caminho do arquivo JSON.
+
+    Retorna
+    -------
+    None
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def load_model_metadata(path: str) -> dict | None:
+    """
+    Carrega os metadados de um modelo de um arquivo JSON.
+
+    Parâmetros
+    ----------
+    path : str
+        - Caminho do arquivo JSON.
+
+    Retorna
+    -------
+    dict | None
+        - Metadados, ou None caso o arquivo não exista.
+    """
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def artifact_matches_metadata(metadata: dict, artifact_path: str, check_hash: bool = False) -> bool:
+    """
+    Verifica se o artefato em disco é o mesmo descrito pelos metadados: mesmo
+    nome de arquivo (campo "artifact", que distingue .pkl de .joblib) e mesmo
+    tamanho. Metadados que não coincidem não devem ser usados no lugar do
+    modelo.
+
+    Parâmetros
+    ----------
+    metadata : dict
+        - Metadados do modelo.
+    artifact_path : str
+        - Caminho do artefato.
+    check_hash : bool, opcional
+        - Se True, compara também o SHA-256 (lê o arquivo inteiro); caso
+        contrário, apenas o tamanho.
+
+    Retorna
+    -------
+    bool
+        - True quando o artefato existe e coincide com os metadados.
+    """
+    if metadata.get("artifact") != os.path.basename(artifact_path):
+        return False
+    if not os.path.exists(artifact_path) or os.path.getsize(artifact_path) != metadata.get("size_bytes"):
+        return False
+    return not check_hash or file_sha256(artifact_path) == metadata.get("sha256")
+
+def list_models(models_dir: str) -> list[dict]:
+    """
+    Lista os modelos de um diretório a partir dos sidecars de metadados, sem
+    carregar os artefatos.
+
+    Parâmetros
+    ----------
+    models_dir : str
+        - Diretório dos modelos.
+
+    Retorna
+    -------
+    list[dict]
+        - Um resumo por modelo ("name", os metadados, exceto os campos de
+        `LISTING_EXCLUDED_FIELDS`, e "artifact_matches", que indica se o
+        artefato em disco é o descrito, ver `artifact_matches_metadata`), em
+        ordem alfabética.
+    """
+    if not os.path.isdir(models_dir):
+        return []
+
+    suffix = f"_{METADATA_FILENAME}"
+    models = []
+    for filename in sorted(os.listdir(models_dir)):
+        if not filename.endswith(suffix):
+            continue
+        metadata = load_model_metadata(os.path.join(models_dir, filename))
+        summary = {key: value for key, value in metadata.items() if key not in LISTING_EXCLUDED_FIELDS}
+        summary["artifact_matches"] = artifact_matches_metadata(metadata, os.path.join(models_dir, metadata.get("artifact") or ""))
+        models.append({"name": filename[:-len(suffix)], **summary})
+
+    return models
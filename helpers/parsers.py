@@ -1,33 +1,174 @@
+import numpy as np
 import pandas as pd
+from helpers.categories import categorical_dtypes
 
-def parse_categoricals(df: pd.DataFrame) -> pd.DataFrame:
+# Formatos de data e hora encontrados nos arquivos do VRA, testados na
+# detecção do formato de cada coluna
+DATETIME_FORMATS = [
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%d/%m/%Y %H:%M:%S",
+    "%d/%m/%Y %H:%M",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M",
+]
+
+def parse_categoricals(df: pd.DataFrame, categories: dict | None = None) -> pd.DataFrame:
     """
     Converte colunas categóricas do DataFrame para o tipo category.
 
+    Com `categories`, as colunas recebem os tipos categóricos fixos dos
+    dicionários globais (ver `helpers.categories`), idênticos entre meses,
+    datasets, treino e inferência. Valores fora dos dicionários viram nulos.
+
+    Sem `categories`, as categorias são inferidas dos próprios dados. Colunas
+    que já são categóricas (ex.: lidas de um Parquet gravado em blocos) têm
+    suas categorias ordenadas, para que o resultado não dependa da ordem em
+    que os valores apareceram na leitura.
+
+    Colunas ausentes do DataFrame (ex.: leitura de um subconjunto de
+    colunas) são ignoradas, e colunas que já têm o tipo final não são
+    convertidas novamente.
+
     Parâmetros
     ----------
     df : pandas.DataFrame
         - DataFrame contendo os dados a serem tipados.
+    categories : dict | None, opcional
+        - Dicionários categóricos globais.
 
     Retorna
     -------
     pandas.DataFrame
         - DataFrame com as colunas categóricas convertidas.
     """
+    if categories is not None:
+        for col, dtype in categorical_dtypes(categories).items():
+            if col in df and df[col].dtype != dtype:
+                df[col] = df[col].astype(dtype)
+        return df
+
     categorical_columns = [
         "Empresa Aérea",
         "Aeródromo Origem",
         "Aeródromo Destino",
     ]
     for col in categorical_columns:
-        df[col] = df[col].astype('category')
+        if col not in df:
+            continue
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            current = df[col].cat.categories
+            if not current.is_monotonic_increasing:
+                df[col] = df[col].cat.reorder_categories(current.sort_values())
+        else:
+            df[col] = df[col].astype('category')
     
     return df
 
+def detect_datetime_format(values: pd.Index, sample_size: int = 1000) -> str | None:
+    """
+    Detecta o formato de data e hora de um conjunto de valores a partir de
+    uma amostra.
+
+    Cada formato de `DATETIME_FORMATS` é aplicado à amostra e só é aceito se
+    todos os valores que ele consegue interpretar coincidirem com o resultado
+    da interpretação genérica (`format="mixed", dayfirst=True`). Entre os
+    formatos aceitos, é escolhido o que interpreta mais valores da amostra.
+
+    Parâmetros
+    ----------
+    values : pandas.Index
+        - Valores (texto) distintos da coluna.
+    sample_size : int, opcional
+        - Quantidade máxima de valores usados na detecção.
+
+    Retorna
+    -------
+    str | None
+        - Formato detectado, ou None se nenhum formato conhecido interpreta
+        ao menos metade da amostra.
+    """
+    values = values[values.notna()]
+    if values.empty:
+        return None
+
+    # Amostra espaçada ao longo da coluna (e não apenas o início do arquivo)
+    step = max(1, len(values) // sample_size)
+    sample = values[::step][:sample_size].astype(str)
+    expected = pd.to_datetime(sample, format="mixed", dayfirst=True, errors="coerce")
+
+    best_format, best_count = None, len(sample) / 2
+    for fmt in DATETIME_FORMATS:
+        parsed = pd.to_datetime(sample, format=fmt, errors="coerce")
+        mask = parsed.notna()
+        count = mask.sum()
+        if count >= best_count and count > 0 and (parsed[mask] == expected[mask]).all():
+            best_format, best_count = fmt, count
+
+    return best_format
+
+def to_datetime_fast(values: pd.Series, sample_size: int = 1000) -> pd.Series:
+    """
+    Converte uma coluna de texto para datetime, com resultado idêntico a
+    `pd.to_datetime(values, format="mixed", dayfirst=True, errors="coerce")`.
+
+    Os valores distintos são convertidos uma única vez (horários previstos se
+    repetem muito entre voos) e o resultado é replicado para todas as linhas.
+    O formato é detectado a partir de uma amostra (ver
+    `detect_datetime_format`) e aplicado a toda a coluna de forma
+    vetorizada; apenas os valores fora do formato detectado passam pela
+    interpretação genérica, que é lenta.
+
+    Parâmetros
+    ----------
+    values : pandas.Series
+        - Coluna de texto (ou categórica) com datas e horas.
+    sample_size : int, opcional
+        - Quantidade máxima de valores usados na detecção do formato.
+
+    Retorna
+    -------
+    pandas.Series
+        - Coluna do tipo datetime64[ns]; valores inválidos viram NaT.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        return values
+
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes, uniques = values.cat.codes.to_numpy(), values.cat.categories
+    else:
+        codes, uniques = pd.factorize(values)
+
+    uniques = pd.Index(uniques, dtype=object)
+    fmt = detect_datetime_format(uniques, sample_size=sample_size)
+
+    if fmt is None:
+        parsed = pd.to_datetime(uniques, format="mixed", dayfirst=True, errors="coerce")
+    else:
+        parsed = pd.to_datetime(uniques, format=fmt, errors="coerce")
+        fallback = parsed.isna() & uniques.notna()
+        if fallback.any():
+            parsed = parsed.where(
+                ~fallback,
+                pd.to_datetime(uniques.where(fallback), format="mixed", dayfirst=True, errors="coerce")
+            )
+
+    # Valores com fuso horário: mantém o comportamento da interpretação genérica
+    if parsed.dtype != "datetime64[ns]":
+        return pd.to_datetime(values, format="mixed", dayfirst=True, errors="coerce")
+
+    # Código -1 (valor nulo) aponta para o NaT acrescentado ao final
+    lookup = np.append(parsed.to_numpy(dtype="datetime64[ns]"), np.datetime64("NaT", "ns"))
+    return pd.Series(lookup[codes], index=values.index, name=values.name)
+
 def parse_datetime(df: pd.DataFrame) -> pd.DataFrame:
     """
     Converte colunas de data e hora do DataFrame para o tipo datetime.
 
+    O formato de cada coluna é detectado a partir de uma amostra e os
+    valores distintos são convertidos uma única vez (ver `to_datetime_fast`).
+    Colunas ausentes ou que já são datetime não são alteradas.
+
     Parâmetros
     ----------
     df : pandas.DataFrame
@@ -42,7 +183,8 @@ def parse_datetime(df: pd.DataFrame) -> pd.DataFrame:
         "Data Hora Voo",
     ]
     for col in datetime_columns:
-        df[col] = pd.to_datetime(df[col], format="mixed", dayfirst=True, errors='coerce')
+        if col in df:
+            df[col] = to_datetime_fast(df[col])
     
     return df
 
@@ -64,5 +206,6 @@ def parse_int(df: pd.DataFrame, col: str, int_type: str = 'int32') -> pd.DataFra
     pandas.DataFrame
         - DataFrame com a coluna convertida para o tipo inteiro definido.
     """
-    df[col] = df[col].astype(int_type) # type: ignore
+    if df[col].dtype != int_type:
+        df[col] = df[col].astype(int_type) # type: ignore
     return df
\ No newline at end of file
@@ -0,0 +1,24 @@
+import os
+
+def list_partitions(dataset_dir: str) -> list[str]:
+    """
+    Lista os arquivos das partições do dataset em ordem cronológica.
+
+    Parâmetros
+    ----------
+    dataset_dir : str
+        - Diretório raiz do dataset particionado.
+
+    Retorna
+    -------
+    list[str]
+        - Caminhos dos arquivos Parquet das partições.
+    """
+    partitions = []
+    for root, _, files in os.walk(dataset_dir):
+        for file in files:
+            if file.endswith(".parquet") and not file.startswith((".", "_")):
+                partitions.append(os.path.join(root, file))
+
+    # "ano=AAAA/mes=MM" com mês de dois dígitos: a ordem lexicográfica é cronológica
+    return sorted(partitions)
@@ -5,4 +5,7 @@ from .evaluate_model import evaluate_model
 from .document_model import document_model
 from .get_model_metadata import get_model_metadata
 from .plot_automl_results import plot_algorithm_selection, plot_adaptive_sampling, plot_feature_selection, plot_model_tuning
-from .experiment_automl_pipelines import run_experiments, evaluate_experimental_models, load_experimental_models
\ No newline at end of file
+from .experiment_automl_pipelines import run_experiments, run_experiment_jobs, evaluate_experimental_models, load_experimental_models
+from .evaluation_engine import compare_models, threshold_metrics
+from .streaming_metrics import ScoreHistogram, stream_evaluate
+from .inference_benchmark import benchmark_inference
\ No newline at end of file
@@ -18,32 +18,44 @@ from datetime import datetime
 from typing import Literal, Any
 from sklearn.linear_model import LogisticRegression
 from sklearn.ensemble import RandomForestClassifier
+from helpers.model_artifacts import model_artifact_path
+from helpers.model_metadata import artifact_matches_metadata, load_model_metadata, model_metadata_path
+from utils.get_model_metadata import get_model_metadata
+from utils.inference_benchmark import benchmark_inference
 
 OutputFormat = Literal['.md', '.txt', '.html']
 def document_model(
     model: LogisticRegression | RandomForestClassifier,
     model_name: str,
-    model_metadata: dict[str, Any],
-    model_features: list[str],
+    model_metadata: dict[str, Any] | None,
+    model_features: list[str] | None,
     x: pd.DataFrame,
     y: pd.Series,
     output_format: OutputFormat = '.md',
-    timestamp: bool = False
+    timestamp: bool = False,
+    performance: bool | dict = True,
+    artifact_path: str | None = None
 ) -> None:
     """
     Gera a documentação de um modelo treinado, incluindo especificações,
-    features esperadas e exemplos de entrada e saída.
+    features esperadas, exemplos de entrada e saída e o perfil de desempenho
+    da inferência.
 
     Parâmetros
     ----------
     model : LogisticRegression ou RandomForestClassifier
         - Modelo treinado a ser documentado.
     model_name : str
-        - Nome identificador do modelo.
-    model_metadata : dict[str, Any]
-        - Metadados do modelo, incluindo tipo e parâmetros utilizados.
-    model_features : list[str]
-        - Lista de features esperadas pelo modelo.
+        - Nome identificador do modelo. Quando coincide com o nome de um
+        modelo exportado (ex.: "experimental_models/01_lgbm"), seu sidecar
+        de metadados é usado (ver `helpers.model_metadata`).
+    model_metadata : dict[str, Any] | None
+        - Metadados do modelo, incluindo tipo e parâmetros utilizados. Se
+        None, são lidos do sidecar do modelo exportado ou, na falta dele,
+        extraídos do modelo (`get_model_metadata`).
+    model_features : list[str] | None
+        - Lista de features esperadas pelo modelo. Se None, usa as
+        "features_raw" dos metadados.
     x : pandas.DataFrame
         - DataFrame de entrada utilizado como exemplo na documentação.
     y : pandas.Series
@@ -52,6 +64,15 @@ def document_model(
         - Formato do arquivo de saída (.md, .txt ou .html).
     timestamp : bool, opcional
         - Se True, adiciona um sufixo de data e hora ao nome do arquivo.
+    performance : bool | dict, opcional
+        - Se True (padrão), mede latência de uma linha, vazão em lotes,
+        tamanho do artefato, tempo de carga e memória após a carga com
+        `utils.inference_benchmark.benchmark_inference`, usando `x` como
+        amostra. Aceita também o resultado de uma medição anterior; se
+        False, a seção é omitida.
+    artifact_path : str, opcional
+        - Artefato do modelo usado nas medições de tamanho e carga. Se None,
+        usa o modelo exportado com o nome `model_name`, quando existir.
 
     Retorna
     -------
@@ -193,6 +214,47 @@ def document_model(
 
         return "\n".join(lines)
     
+    def format_performance_summary(perf: dict) -> str:
+        """
+        Gera um resumo textual em estilo Markdown das medições de
+        `benchmark_inference`.
+
+        Parâmetros
+        ----------
+        perf : dict
+            - Resultado de `benchmark_inference`.
+
+        Retorna
+        -------
+        str
+            - Tabelas de latência e vazão seguidas das medidas do artefato.
+        """
+        def fmt(value, spec: str) -> str:
+            return "-" if value is None else format(value, spec)
+
+        environment = perf["environment"]
+        lines = [
+            f"Measured on {environment['measured_at']} ({environment['cpus']} CPUs, Python {environment['python']}).",
+            "",
+            "| Single-row latency | ms |",
+            "| ------------------ | -- |",
+        ]
+        lines += [f"| {name} | {ms:.3f} |" for name, ms in perf["single_row_ms"].items()]
+        lines += ["", "| Batch size | Batch (ms) | Rows/s |", "| ---------- | ---------- | ------ |"]
+        lines += [
+            f"| {int(row.batch_size)} | {row.batch_ms:.2f} | {row.rows_per_s:,.0f} |"
+            for row in perf["batches"].itertuples()
+        ]
+        lines += [
+            "",
+            f"- Artifact size: {fmt(perf['artifact_size_mb'], '.2f')} MB",
+            f"- Load time: {fmt(perf['load_s'], '.3f')} s",
+            f"- Resident memory after load: {fmt(perf['rss_after_load_mb'], '.1f')} MB "
+            f"(+{fmt(perf['rss_load_delta_mb'], '.1f')} MB from loading)",
+        ]
+
+        return "\n".join(lines)
+
     # Format tabular output for markdown and txt
     x_head_text = format_model_input_summary(x)
     y_head_text = format_model_output_summary(y, model=model, x_subset=x)
@@ -201,17 +263,37 @@ def document_model(
     x_head_html = x.head().to_html()
     y_head_html = y.head().to_frame(name="target").to_html()
 
-    specs = model_metadata
-    model_type = specs['model']
-    parameters = specs['specifications']
-
     # Garante que o diretório ./models/ exista
     models_dir = os.path.join(os.path.dirname(__file__), "..", "models")
     models_dir = os.path.abspath(models_dir)
     os.makedirs(models_dir, exist_ok=True)
 
+    # Metadados: sidecar do modelo exportado (se descrever o artefato em
+    # disco), antes de inspecionar o modelo
+    if model_metadata is None:
+        exported_path = model_artifact_path(os.path.join(models_dir, model_name))
+        model_metadata = load_model_metadata(model_metadata_path(exported_path))
+        if model_metadata is not None and not artifact_matches_metadata(model_metadata, exported_path):
+            model_metadata = None
+    if model_metadata is None:
+        model_metadata = get_model_metadata(model)
+    if model_features is None:
+        model_features = model_metadata['features_raw']
+
+    specs = model_metadata
+    model_type = specs['model']
+    parameters = specs['specifications'] or {}
+
+    # Perfil de desempenho da inferência
+    if performance is True:
+        if artifact_path is None:
+            candidate = model_artifact_path(os.path.join(models_dir, model_name))
+            artifact_path = candidate if os.path.exists(candidate) else None
+        performance = benchmark_inference(model, x, artifact_path=artifact_path)
+    performance_text = format_performance_summary(performance) if performance else None
+
     # Output filename
-    filename = f'model_documentation_{model_name}{output_format}'
+    filename = f'model_documentation_{os.path.basename(model_name)}{output_format}'
 
     # Se timestamp=True, adiciona YYYYMMDD_HHMMSS ao nome do arquivo
     filename_raw = filename
@@ -238,6 +320,9 @@ def document_model(
             f.write("\n" + x_head_text + "\n\n")
             f.write("\n## Sample Output - y.head()\n")
             f.write("\n" + y_head_text + "\n\n")
+            if performance_text is not None:
+                f.write("\n## Inference Performance\n")
+                f.write("\n" + performance_text + "\n")
 
     elif output_format == '.txt':
         with open(filepath, 'w', encoding='utf-8') as f:
@@ -252,6 +337,9 @@ def document_model(
             f.write(x_head_text + "\n")
             f.write("Sample Output - y.head():\n")
             f.write(y_head_text + "\n")
+            if performance_text is not None:
+                f.write("\nInference Performance:\n")
+                f.write(performance_text + "\n")
 
     elif output_format == '.html':
         with open(filepath, 'w', encoding='utf-8') as f:
@@ -266,6 +354,20 @@ def document_model(
             f.write(x_head_html)
             f.write("\n<h2>Sample Output - y.head()</h2>\n")
             f.write(y_head_html)
+            if performance:
+                latency = pd.Series(performance["single_row_ms"], name="ms").to_frame()
+                f.write("\n<h2>Inference Performance</h2>\n")
+                f.write(latency.round(3).to_html())
+                f.write("\n" + performance["batches"].round(2).to_html(index=False))
+                f.write("\n<ul>\n")
+                for label, key, spec, unit in [
+                    ("Artifact size", "artifact_size_mb", ".2f", "MB"),
+                    ("Load time", "load_s", ".3f", "s"),
+                    ("Resident memory after load", "rss_after_load_mb", ".1f", "MB"),
+                ]:
+                    value = '-' if performance[key] is None else format(performance[key], spec)
+                    f.write(f"<li><b>{label}</b>: {value} {unit}</li>\n")
+                f.write("</ul>\n")
 
     else:
         raise ValueError("Invalid output_format. Choose from '.md', '.txt', or '.html'.")
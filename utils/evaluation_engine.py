@@ -0,0 +1,312 @@
+import os
+import time
+import uuid
+import pickle
+import hashlib
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from sklearn.metrics import roc_auc_score
+
+from helpers.model_artifacts import LazyModel
+from utils.experiment_cache import data_fingerprint
+
+# Diretório padrão do cache de probabilidades das avaliações
+EVALUATION_CACHE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "models", "evaluation_cache"))
+
+class _HashWriter:
+    """
+    Arquivo apenas de escrita que repassa os bytes a um hash, para calcular
+    o hash de um pickle sem materializá-lo em memória.
+    """
+    def __init__(self):
+        self.digest = hashlib.sha256()
+
+    def write(self, data) -> int:
+        self.digest.update(data)
+        return len(data)
+
+def model_fingerprint(estimator) -> str:
+    """
+    Impressão digital (SHA-256) de um modelo treinado, calculada sobre seu
+    pickle em fluxo.
+
+    Parâmetros
+    ----------
+    estimator : automlx._interface.classifier.AutoClassifier
+        - Modelo treinado.
+
+    Retorna
+    -------
+    str
+        - Hash hexadecimal, idêntico para modelos idênticos (carregados ou
+        via `LazyModel`).
+    """
+    if isinstance(estimator, LazyModel):
+        estimator = estimator.load()
+
+    writer = _HashWriter()
+    pickle.dump(estimator, writer, protocol=pickle.HIGHEST_PROTOCOL)
+    return writer.digest.hexdigest()
+
+def cached_predict_proba(
+    estimator,
+    X_test: pd.DataFrame,
+    test_fingerprint: str | None = None,
+    cache_dir: str | None = EVALUATION_CACHE_DIR
+) -> tuple[np.ndarray, float | None]:
+    """
+    Probabilidade da classe positiva para `X_test`, lida do cache em disco
+    quando o mesmo modelo já foi avaliado no mesmo conjunto de teste.
+
+    Parâmetros
+    ----------
+    estimator : automlx._interface.classifier.AutoClassifier
+        - Modelo treinado.
+    X_test : pandas.DataFrame
+        - Conjunto de teste.
+    test_fingerprint : str, opcional
+        - Impressão digital de `X_test` (ver
+        `utils.experiment_cache.data_fingerprint`), calculada se None.
+    cache_dir : str | None, opcional
+        - Diretório do cache. Se None, as probabilidades não são guardadas.
+
+    Retorna
+    -------
+    tuple[numpy.ndarray, float | None]
+        - Probabilidades (float64) e o tempo do `predict_proba`, em
+        segundos, ou None quando lidas do cache.
+    """
+    path = None
+    if cache_dir is not None:
+        if test_fingerprint is None:
+            test_fingerprint = data_fingerprint(X_test)
+        key = hashlib.sha256(f"{model_fingerprint(estimator)}:{test_fingerprint}".encode()).hexdigest()
+        path = os.path.join(cache_dir, f"{key}.npy")
+        if os.path.exists(path):
+            return np.load(path), None
+
+    start = time.perf_counter()
+    proba = np.asarray(estimator.predict_proba(X_test))[:, 1].astype("float64")
+    elapsed = time.perf_counter() - start
+
+    if path is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = os.path.join(cache_dir, f".{uuid.uuid4().hex}.npy")
+        try:
+            np.save(tmp_path, proba)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    return proba, elapsed
+
+def predict_probabilities(
+    models: dict,
+    X_test: pd.DataFrame,
+    n_jobs: int = 4,
+    cache_dir: str | None = EVALUATION_CACHE_DIR
+) -> dict[str, tuple[np.ndarray, float | None]]:
+    """
+    Executa uma única passagem de `predict_proba` por modelo, em paralelo
+    entre modelos (threads: a inferência do LightGBM, XGBoost e
+    scikit-learn libera o GIL) e com cache em disco (ver
+    `cached_predict_proba`).
+
+    Parâmetros
+    ----------
+    models : dict
+        - Modelos treinados, indexados por nome.
+    X_test : pandas.DataFrame
+        - Conjunto de teste.
+    n_jobs : int, opcional
+        - Quantidade de modelos avaliados simultaneamente.
+    cache_dir : str | None, opcional
+        - Diretório do cache. Se None, as probabilidades não são guardadas.
+
+    Retorna
+    -------
+    dict[str, tuple[numpy.ndarray, float | None]]
+        - Probabilidades e tempo de inferência de cada modelo. Modelos que
+        falham (ex.: um `LazyModel` cujo artefato não pode ser lido) são
+        informados e omitidos, sem interromper os demais.
+    """
+    test_fingerprint = data_fingerprint(X_test) if cache_dir is not None else None
+
+    with ThreadPoolExecutor(max_workers=max(1, n_jobs)) as executor:
+        futures = {
+            name: executor.submit(cached_predict_proba, estimator, X_test, test_fingerprint, cache_dir)
+            for name, estimator in models.items()
+        }
+        probabilities = {}
+        for name, future in futures.items():
+            try:
+                probabilities[name] = future.result()
+            except Exception as e:
+                print(f"❌ Erro ao avaliar o modelo '{name}': {e}")
+
+    return probabilities
+
+def threshold_metrics(y_true, proba: np.ndarray, thresholds=0.5) -> pd.DataFrame:
+    """
+    Matriz de confusão e métricas de classificação de um vetor de
+    probabilidades para vários limiares de uma vez.
+
+    As probabilidades são ordenadas uma única vez; a quantidade de positivos
+    até cada limiar (inclusive) sai de uma busca binária na soma acumulada dos
+    rótulos, sem reclassificar o conjunto de teste a cada limiar.
+
+    Parâmetros
+    ----------
+    y_true : array-like
+        - Classes reais (0/1).
+    proba : numpy.ndarray
+        - Probabilidade da classe positiva.
+    thresholds : float | array-like, opcional
+        - Limiares; o voo é classificado como atrasado quando
+        `proba > limiar`. No limiar 0.5, a classificação coincide com a de
+        `estimator.predict` (argmax, que atribui os empates à classe 0).
+
+    Retorna
+    -------
+    pandas.DataFrame
+        - Uma linha por limiar, com "tn", "fp", "fn", "tp", "accuracy" e
+        precisão, recall e F1 de cada classe e suas médias macro.
+    """
+    y_true = np.asarray(y_true).astype("int64")
+    thresholds = np.atleast_1d(np.asarray(thresholds, dtype="float64"))
+
+    order = np.argsort(proba, kind="stable")
+    sorted_proba = proba[order]
+    positives_below = np.concatenate([[0], np.cumsum(y_true[order])])
+
+    n = len(y_true)
+    positives = int(positives_below[-1])
+    # Probabilidades iguais ao limiar contam como negativas (ver `thresholds`)
+    below = np.searchsorted(sorted_proba, thresholds, side="right")
+
+    fn = positives_below[below]
+    tn = below - fn
+    tp = positives - fn
+    fp = n - below - tp
+
+    return metrics_from_counts(thresholds, tn, fp, fn, tp)
+
+def metrics_from_counts(thresholds, tn, fp, fn, tp) -> pd.DataFrame:
+    """
+    Métricas de classificação a partir das matrizes de confusão de cada
+    limiar (ver `threshold_metrics`).
+
+    Parâmetros
+    ----------
+    thresholds : array-like
+        - Limiares.
+    tn, fp, fn, tp : array-like
+        - Contagens da matriz de confusão de cada limiar.
+
+    Retorna
+    -------
+    pandas.DataFrame
+        - Uma linha por limiar, com as contagens, "accuracy" e precisão,
+        recall e F1 de cada classe e suas médias macro.
+    """
+    thresholds, tn, fp, fn, tp = (np.atleast_1d(np.asarray(values)) for values in (thresholds, tn, fp, fn, tp))
+    n = tn + fp + fn + tp
+
+    def ratio(num, den):
+        return np.divide(num, den, out=np.zeros(len(thresholds)), where=den > 0)
+
+    metrics = pd.DataFrame({"threshold": thresholds, "tn": tn, "fp": fp, "fn": fn, "tp": tp})
+    metrics["accuracy"] = ratio(tp + tn, n)
+    for label, (hit, false_pos, miss) in {"0": (tn, fn, fp), "1": (tp, fp, fn)}.items():
+        precision = ratio(hit, hit + false_pos)
+        recall = ratio(hit, hit + miss)
+        metrics[f"precision_{label}"] = precision
+        metrics[f"recall_{label}"] = recall
+        metrics[f"f1_{label}"] = ratio(2 * precision * recall, precision + recall)
+    for metric in ["precision", "recall", "f1"]:
+        metrics[f"{metric}_macro"] = (metrics[f"{metric}_0"] + metrics[f"{metric}_1"]) / 2
+
+    return metrics
+
+def format_classification_report(row: pd.Series, digits: int = 2) -> str:
+    """
+    Relatório de classificação no formato do
+    `sklearn.metrics.classification_report`, a partir de uma linha de
+    `threshold_metrics`.
+    """
+    support = {"0": row["tn"] + row["fp"], "1": row["tp"] + row["fn"]}
+    total = support["0"] + support["1"]
+    width = max(len("weighted avg"), digits)
+    header = f"{'':>{width}}  {'precision':>9} {'recall':>9} {'f1-score':>9} {'support':>9}"
+
+    def line(name, precision, recall, f1, count):
+        return f"{name:>{width}}  {precision:>9.{digits}f} {recall:>9.{digits}f} {f1:>9.{digits}f} {int(count):>9}"
+
+    lines = [header, ""]
+    for label in ["0", "1"]:
+        lines.append(line(label, row[f"precision_{label}"], row[f"recall_{label}"], row[f"f1_{label}"], support[label]))
+    lines.append("")
+    lines.append(f"{'accuracy':>{width}}  {'':>9} {'':>9} {row['accuracy']:>9.{digits}f} {int(total):>9}")
+    lines.append(line("macro avg", row["precision_macro"], row["recall_macro"], row["f1_macro"], total))
+    weights = {label: support[label] / total if total else 0 for label in support}
+    weighted = [sum(row[f"{metric}_{label}"] * weights[label] for label in support) for metric in ["precision", "recall", "f1"]]
+    lines.append(line("weighted avg", *weighted, total))
+
+    return "\n".join(lines) + "\n"
+
+def compare_models(
+    models: dict,
+    X_test: pd.DataFrame,
+    y_test: pd.Series,
+    thresholds=0.5,
+    n_jobs: int = 4,
+    cache_dir: str | None = EVALUATION_CACHE_DIR
+) -> pd.DataFrame:
+    """
+    Avalia vários modelos no mesmo conjunto de teste: uma passagem de
+    `predict_proba` por modelo (em paralelo e com cache, ver
+    `predict_probabilities`) e as métricas de todos os limiares calculadas
+    a partir das probabilidades (ver `threshold_metrics`).
+
+    Parâmetros
+    ----------
+    models : dict
+        - Modelos treinados, indexados por nome.
+    X_test : pandas.DataFrame
+        - Conjunto de teste.
+    y_test : pandas.Series
+        - Classes reais do conjunto de teste.
+    thresholds : float | array-like, opcional
+        - Limiares de classificação avaliados.
+    n_jobs : int, opcional
+        - Quantidade de modelos avaliados simultaneamente.
+    cache_dir : str | None, opcional
+        - Diretório do cache de probabilidades. Se None, não há cache.
+
+    Retorna
+    -------
+    pandas.DataFrame
+        - Uma linha por modelo e limiar (índice "model", "threshold"), com
+        "roc_auc", "predict_s" (NaN quando lido do cache), a matriz de
+        confusão e as métricas de `threshold_metrics`, ordenada pelo ROC AUC.
+        Modelos que falham na inferência são omitidos (ver
+        `predict_probabilities`).
+    """
+    probabilities = predict_probabilities(models, X_test, n_jobs=n_jobs, cache_dir=cache_dir)
+    if not probabilities:
+        raise RuntimeError("Nenhum modelo pôde ser avaliado.")
+    y_true = np.asarray(y_test).astype("int64")
+
+    frames = []
+    for name, (proba, elapsed) in probabilities.items():
+        metrics = threshold_metrics(y_true, proba, thresholds)
+        metrics.insert(0, "model", name)
+        metrics.insert(2, "roc_auc", roc_auc_score(y_true, proba))
+        metrics.insert(3, "predict_s", np.nan if elapsed is None else elapsed)
+        frames.append(metrics)
+
+    comparison = pd.concat(frames, ignore_index=True)
+    comparison = comparison.sort_values(["roc_auc", "model", "threshold"], ascending=[False, True, True], kind="stable")
+    return comparison.set_index(["model", "threshold"])
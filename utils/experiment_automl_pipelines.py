@@ -1,13 +1,72 @@
 import os
-import pickle
+import time
 import automlx
+import traceback
+import numpy as np
 import pandas as pd
-from typing import Dict
+import matplotlib.pyplot as plt
+import multiprocessing as mp
+from typing import Callable, Dict
 from typing import Literal
-from utils.evaluate_model import evaluate_model
+from contextlib import contextmanager
+from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures.process import BrokenProcessPool
+from sklearn.metrics import ConfusionMatrixDisplay
+from helpers.model_artifacts import LazyModel, load_model, model_artifact_path
+from helpers.model_metadata import artifact_matches_metadata, load_model_metadata, model_metadata_path
+from helpers.manifest import load_manifest
+from utils.evaluation_engine import EVALUATION_CACHE_DIR, compare_models, format_classification_report
 from utils.export_model import export_model
+from utils.experiment_cache import EXPERIMENT_CACHE_DIR, EXPERIMENT_MANIFEST_FILENAME, data_fingerprint, experiment_key, load_cached_experiment, store_experiment
 
-def export_experimental_models(experimental_models: dict[str, automlx._interface]) -> None: # type: ignore
+# Variáveis de ambiente que limitam as threads das bibliotecas nativas
+# (OpenMP do LightGBM/XGBoost, BLAS do numpy/scikit-learn)
+THREAD_LIMIT_VARS = [
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+]
+
+@dataclass
+class ExperimentResult:
+    """
+    Resultado de um experimento executado por `run_experiments`.
+
+    Atributos
+    ---------
+    name : str
+        - Nome do experimento (chave de `pipeline_configs`).
+    estimator : automlx._interface | None
+        - Modelo treinado, ou None em caso de falha.
+    wall_s : float
+        - Tempo de treinamento, em segundos.
+    cores : list[int] | None
+        - Núcleos reservados ao experimento (modo paralelo).
+    error : str | None
+        - Traceback da falha, se houver.
+    """
+    name: str
+    estimator: object | None = None
+    wall_s: float = 0.0
+    cores: list | None = None
+    error: str | None = None
+
+def experimental_models_path() -> str:
+    """
+    Caminho absoluto do diretório ./models/experimental_models.
+    """
+    experimental_models_dir = os.path.join(os.path.dirname(__file__), "..", "models", "experimental_models")
+    return os.path.abspath(experimental_models_dir)
+
+def export_experimental_models(
+    experimental_models: dict[str, automlx._interface], # type: ignore
+    artifact_format: str = "pickle",
+    compress: int = 0,
+    training_times: dict[str, float] | None = None
+) -> None:
     """
     Exporta modelos experimentais treinados para o diretório
     ./models/experimental_models.
@@ -17,24 +76,237 @@ def export_experimental_models(experimental_models: dict[str, automlx._interface
     experimental_models : dict[str, automlx._interface]
         - Dicionário contendo os modelos experimentais e seus respectivos
         identificadores.
+    artifact_format : str, opcional
+        - Formato dos artefatos: "pickle" (padrão) ou "joblib" (ver
+        `helpers.model_artifacts`).
+    compress : int, opcional
+        - Nível de compressão do formato "joblib".
+    training_times : dict[str, float], opcional
+        - Tempo de treinamento de cada modelo, em segundos, registrado nos
+        metadados exportados.
 
     Retorna
     -------
     None
     """
     # Garante que o diretório ./models/experimental_models exista
-    experimental_models_dir = os.path.join(os.path.dirname(__file__), "..", "models", "experimental_models")
-    experimental_models_dir = os.path.abspath(experimental_models_dir)
-    os.makedirs(experimental_models_dir, exist_ok=True)
+    os.makedirs(experimental_models_path(), exist_ok=True)
 
     # Exporta os modelos
     for name, estimator in experimental_models.items():
         export_model(
             estimator,
             filename=f'experimental_models/{name}',
-            timestamp=False
+            timestamp=False,
+            artifact_format=artifact_format,
+            compress=compress,
+            training_time=(training_times or {}).get(name)
         )
 
+def job_core_sets(n_jobs: int, cores_per_job: int | None = None) -> list[list[int]]:
+    """
+    Divide os núcleos disponíveis ao processo entre `n_jobs` experimentos
+    simultâneos, em blocos contíguos e disjuntos.
+
+    Parâmetros
+    ----------
+    n_jobs : int
+        - Quantidade de experimentos simultâneos.
+    cores_per_job : int, opcional
+        - Núcleos de cada experimento. Se None, os núcleos disponíveis são
+        divididos igualmente (no mínimo 1 por experimento).
+
+    Retorna
+    -------
+    list[list[int]]
+        - Núcleos de cada vaga de execução. Se `n_jobs * cores_per_job`
+        exceder os núcleos disponíveis, os blocos se repetem circularmente.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        available = sorted(os.sched_getaffinity(0))
+    else:
+        available = list(range(os.cpu_count() or 1))
+
+    if cores_per_job is None:
+        cores_per_job = max(1, len(available) // n_jobs)
+
+    return [
+        [available[(job * cores_per_job + i) % len(available)] for i in range(cores_per_job)]
+        for job in range(n_jobs)
+    ]
+
+@contextmanager
+def thread_limits(n_threads: int):
+    """
+    Define `THREAD_LIMIT_VARS` durante o bloco `with`, restaurando os valores
+    anteriores ao final. Processos criados dentro do bloco herdam os limites.
+    """
+    previous = {var: os.environ.get(var) for var in THREAD_LIMIT_VARS}
+    os.environ.update({var: str(n_threads) for var in THREAD_LIMIT_VARS})
+    try:
+        yield
+    finally:
+        for var, value in previous.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+
+# Dados de treino de cada processo do pool, definidos uma única vez por `_init_experiment_worker`
+_worker_X_train: pd.DataFrame | None = None
+_worker_y_train: pd.Series | None = None
+
+def _init_experiment_worker(X_train: pd.DataFrame, y_train: pd.Series, n_threads: int) -> None:
+    global _worker_X_train, _worker_y_train
+    _worker_X_train = X_train
+    _worker_y_train = y_train
+    # Limita os processos e threads do AutoMLx aos núcleos da vaga
+    automlx.init(engine="local", engine_opts={"n_jobs": n_threads, "model_n_jobs": n_threads})
+
+def _run_experiment(
+    name: str,
+    config: dict,
+    cores: list,
+    time_budget: float,
+    cv: int | str,
+    random_state: int
+) -> ExperimentResult:
+    """
+    Treina um experimento em um processo do pool, restrito aos núcleos
+    `cores`. Falhas são devolvidas no resultado, sem interromper os demais.
+    """
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cores)
+
+    start = time.perf_counter()
+    try:
+        pipeline = automlx.Pipeline(**config, random_state=random_state) # type: ignore
+        estimator = pipeline.fit(_worker_X_train, _worker_y_train, time_budget=time_budget, cv=cv)
+        return ExperimentResult(name, estimator, time.perf_counter() - start, cores)
+    except Exception:
+        return ExperimentResult(name, None, time.perf_counter() - start, cores, traceback.format_exc())
+
+def run_experiment_jobs(
+    pipeline_configs: Dict[str, dict],
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    n_jobs: int,
+    cores_per_job: int | None = None,
+    time_budget: float = -1,
+    cv: int|Literal["auto"] = "auto",
+    export_models: bool = True,
+    random_state: int = 7,
+    on_result: Callable[[ExperimentResult], None] | None = None,
+) -> dict[str, ExperimentResult]:
+    """
+    Executa os experimentos em até `n_jobs` processos simultâneos, cada um
+    com um bloco fixo de núcleos (afinidade de CPU, limites de threads das
+    bibliotecas nativas e `n_jobs` do AutoMLx), evitando que os
+    experimentos disputem os mesmos núcleos.
+
+    Parâmetros
+    ----------
+    pipeline_configs : Dict[str, dict]
+        - Configurações dos pipelines a serem testados.
+    X_train : pandas.DataFrame
+        - Dados de entrada utilizados no treinamento.
+    y_train : pandas.Series
+        - Variável alvo utilizada no treinamento.
+    n_jobs : int
+        - Quantidade de experimentos simultâneos.
+    cores_per_job : int, opcional
+        - Núcleos de cada experimento (ver `job_core_sets`).
+    time_budget : float, opcional
+        - Tempo máximo de execução de cada experimento.
+    cv : int ou "auto", opcional
+        - Estratégia de validação cruzada.
+    export_models : bool, opcional
+        - Se True, cada modelo é exportado para ./models/experimental_models
+        assim que seu experimento termina.
+    random_state : int, opcional
+        - Semente para reprodutibilidade dos experimentos.
+    on_result : Callable, opcional
+        - Função chamada no processo principal com o resultado de cada
+        experimento bem-sucedido, assim que ele termina (ex.: gravação no
+        cache de experimentos).
+
+    Retorna
+    -------
+    dict[str, ExperimentResult]
+        - Resultado de cada experimento, na ordem de `pipeline_configs`.
+
+    Observações
+    -----------
+    - Os dados de treino são copiados uma vez para cada processo, de modo
+      que o pico de memória cresce com `n_jobs`.
+    - Os processos são criados com o método "spawn", já que o AutoMLx
+      mantém seu próprio pool de processos, que não sobrevive a um fork.
+    """
+    core_sets = job_core_sets(n_jobs, cores_per_job)
+    n_threads = len(core_sets[0])
+    configs = iter(pipeline_configs.items())
+    total = len(pipeline_configs)
+    results = {}
+
+    print(f"🚀 Running {total} experiments in {n_jobs} parallel jobs ({n_threads} cores each)\n")
+
+    if export_models:
+        os.makedirs(experimental_models_path(), exist_ok=True)
+
+    with thread_limits(n_threads), ProcessPoolExecutor(
+        max_workers=n_jobs,
+        mp_context=mp.get_context("spawn"),
+        initializer=_init_experiment_worker,
+        initargs=(X_train, y_train, n_threads)
+    ) as executor:
+        running = {}
+        free_slots = list(range(n_jobs))
+
+        def submit_next() -> None:
+            # Cada vaga livre recebe o próximo experimento, com os núcleos da vaga
+            for name, config in configs:
+                slot = free_slots[0]
+                try:
+                    future = executor.submit(_run_experiment, name, config, core_sets[slot], time_budget, cv, random_state)
+                except BrokenProcessPool:
+                    # Pool inutilizado por um processo encerrado abruptamente
+                    results[name] = ExperimentResult(name, cores=core_sets[slot], error=traceback.format_exc())
+                    print(f"❌ [{len(results)}/{total}] Not started: {name} (process pool is broken)")
+                    continue
+                free_slots.pop(0)
+                running[future] = (slot, name)
+                print(f"⏳ Started: {name} (cores {core_sets[slot]})")
+                if not free_slots:
+                    return
+
+        submit_next()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                slot, name = running.pop(future)
+                free_slots.append(slot)
+
+                try:
+                    result = future.result()
+                except Exception:
+                    # Ex.: processo encerrado pelo sistema por falta de memória
+                    result = ExperimentResult(name, cores=core_sets[slot], error=traceback.format_exc())
+                results[name] = result
+
+                if result.error is not None:
+                    print(f"❌ [{len(results)}/{total}] Failed: {name}\n{result.error}")
+                    continue
+
+                print(f"✔ [{len(results)}/{total}] Finished: {name} in {result.wall_s:.1f}s")
+                if export_models:
+                    export_model(result.estimator, filename=f'experimental_models/{name}', timestamp=False, training_time=result.wall_s)
+                if on_result is not None:
+                    on_result(result)
+
+            submit_next()
+
+    return {name: results[name] for name in pipeline_configs}
+
 def run_experiments(
     pipeline_configs: Dict[str, dict],
     X_train: pd.DataFrame,
@@ -43,6 +315,10 @@ def run_experiments(
     cv: int|Literal["auto"] = "auto",
     export_models: bool = True,
     random_state: int = 7,
+    n_jobs: int = 1,
+    cores_per_job: int | None = None,
+    cache: bool = True,
+    cache_dir: str = EXPERIMENT_CACHE_DIR,
 ) -> dict[str, automlx._interface]: # type: ignore
     """
     Executa experimentos de treinamento de modelos a partir de diferentes
@@ -61,24 +337,107 @@ def run_experiments(
     cv : int ou "auto", opcional
         - Estratégia de validação cruzada.
     export_models : bool, opcional
-        - Define se os modelos experimentais serão exportados.
+        - Define se os modelos experimentais serão exportados. Cada modelo é
+        exportado assim que seu experimento termina.
     random_state : int, opcional
         - Semente para reprodutibilidade dos experimentos.
+    n_jobs : int, opcional
+        - Quantidade de experimentos executados simultaneamente, em
+        processos separados (ver `run_experiment_jobs`). Se 1 (padrão), os
+        experimentos rodam sequencialmente no processo atual.
+    cores_per_job : int, opcional
+        - Núcleos reservados a cada experimento quando `n_jobs > 1`. Se None,
+        os núcleos disponíveis são divididos igualmente.
+    cache : bool, opcional
+        - Se True (padrão), cada experimento é identificado pelo hash de sua
+        configuração, `random_state`, `cv`, `time_budget` e dos dados de
+        treino (ver `utils.experiment_cache`). Experimentos cuja chave já
+        consta no cache são carregados em vez de retreinados, e os demais
+        são gravados no cache ao terminar.
+    cache_dir : str, opcional
+        - Diretório do cache de experimentos. Padrão é
+        ./models/experiment_cache.
 
     Retorna
     -------
     dict[str, automlx._interface]
         - Dicionário contendo os modelos treinados em cada experimento.
+        No modo paralelo, experimentos que falharam são reportados ao final
+        e não constam no dicionário.
     """
     experimental_models = {}
+    pending = pipeline_configs
+
+    if cache:
+        fingerprint = data_fingerprint(X_train, y_train)
+        keys = {
+            name: experiment_key(config, random_state, cv, time_budget, fingerprint)
+            for name, config in pipeline_configs.items()
+        }
+
+        # Tempo de treinamento registrado no cache, reaproveitado nos metadados
+        cached_entries = load_manifest(cache_dir, filename=EXPERIMENT_MANIFEST_FILENAME)
+
+        pending = {}
+        for name, config in pipeline_configs.items():
+            estimator = load_cached_experiment(keys[name], cache_dir)
+            if estimator is None:
+                pending[name] = config
+                continue
+
+            print(f"♻️  Reusing cached experiment: {name} ({keys[name][:12]})")
+            experimental_models[name] = estimator
+            if export_models:
+                wall_s = cached_entries.get(keys[name], {}).get("wall_s")
+                export_experimental_models({name: estimator}, training_times=None if wall_s is None else {name: wall_s})
+
+    def on_result(result: ExperimentResult) -> None:
+        if cache:
+            store_experiment(
+                keys[result.name],
+                result.name,
+                result.estimator,
+                pipeline_configs[result.name],
+                random_state,
+                cv,
+                time_budget,
+                fingerprint,
+                wall_s=result.wall_s,
+                cache_dir=cache_dir
+            )
+
+    if n_jobs > 1 and pending:
+        results = run_experiment_jobs(
+            pending,
+            X_train,
+            y_train,
+            n_jobs=n_jobs,
+            cores_per_job=cores_per_job,
+            time_budget=time_budget,
+            cv=cv,
+            export_models=export_models,
+            random_state=random_state,
+            on_result=on_result,
+        )
 
-    for name, config in pipeline_configs.items():
+        print(f"\n{'='*60}")
+        print(f"🏁 All experiments completed!")
+        print(f"{'='*60}\n")
+        for name, result in results.items():
+            status = "❌ failed" if result.error is not None else "✔"
+            print(f"{status} {name}: {result.wall_s:.1f}s (cores {result.cores})")
+
+        experimental_models.update({name: result.estimator for name, result in results.items() if result.error is None})
+        return {name: experimental_models[name] for name in pipeline_configs if name in experimental_models}
+
+    for name, config in pending.items():
         print(f"\n{'='*60}")
         print(f"🚀 Running experiment: {name}")
         print(f"{'='*60}\n")
 
         pipeline = automlx.Pipeline(**config, random_state=random_state) # type: ignore
 
+        start = time.perf_counter()
         estimator = pipeline.fit(
             X_train,
             y_train,
@@ -86,27 +445,40 @@ def run_experiments(
             cv=cv,
         )
 
+        wall_s = time.perf_counter() - start
+
         # Store for later inspection
         experimental_models[name] = estimator
+
+        if export_models:
+            export_experimental_models({name: estimator}, training_times={name: wall_s})
+        on_result(ExperimentResult(name, estimator, wall_s))
     
     print(f"\n{'='*60}")
     print(f"🏁 All experiments completed!")
     print(f"{'='*60}\n")
 
-    if export_models:
-        print("=> Exporting experimental models...\n")
-        export_experimental_models(experimental_models)
-
-    return experimental_models
+    return {name: experimental_models[name] for name in pipeline_configs}
 
 def evaluate_experimental_models(
     experimental_models: dict[str, automlx._interface], # type: ignore
     X_test: pd.DataFrame,
     y_test: pd.Series,
-) -> None:
+    thresholds=0.5,
+    n_jobs: int = 4,
+    cache: bool = True,
+    print_reports: bool = True,
+    print_confusion_matrix: bool = False,
+) -> pd.DataFrame:
     """
     Avalia modelos experimentais treinados utilizando um conjunto de teste.
 
+    Cada modelo executa uma única passagem de `predict_proba`, em paralelo
+    entre modelos e com as probabilidades guardadas em cache por modelo e
+    conjunto de teste (ver `utils.evaluation_engine`). ROC AUC, relatório de
+    classificação e matriz de confusão de cada limiar são calculados a
+    partir dessas probabilidades, sem nova inferência.
+
     Parâmetros
     ----------
     experimental_models : dict[str, automlx._interface]
@@ -115,60 +487,145 @@ def evaluate_experimental_models(
         - Dados de entrada utilizados na avaliação.
     y_test : pandas.Series
         - Variável alvo utilizada na avaliação.
+    thresholds : float | array-like, opcional
+        - Limiares de classificação avaliados. Padrão é 0.5.
+    n_jobs : int, opcional
+        - Quantidade de modelos avaliados simultaneamente.
+    cache : bool, opcional
+        - Se True (padrão), as probabilidades são guardadas em
+        ./models/evaluation_cache e reutilizadas nas próximas avaliações.
+    print_reports : bool, opcional
+        - Se True (padrão), exibe o ROC AUC e o relatório de classificação de
+        cada modelo no primeiro limiar.
+    print_confusion_matrix : bool, opcional
+        - Se True, exibe também a matriz de confusão normalizada de cada
+        modelo no primeiro limiar.
 
     Retorna
     -------
-    None
+    pandas.DataFrame
+        - Tabela comparativa (ver `utils.evaluation_engine.compare_models`),
+        com uma linha por modelo e limiar.
     """
-    for name, estimator in experimental_models.items():
-        print(f"\n{'='*60}")
-        print(f"📊 Experiment results: {name}")
-        print(f"{'='*60}\n")
+    comparison = compare_models(
+        experimental_models,
+        X_test,
+        y_test,
+        thresholds=thresholds,
+        n_jobs=n_jobs,
+        cache_dir=EVALUATION_CACHE_DIR if cache else None
+    )
+
+    if print_reports or print_confusion_matrix:
+        # Relatórios no primeiro limiar informado (a tabela é ordenada por limiar)
+        first_threshold = float(np.atleast_1d(thresholds)[0])
+        evaluated = set(comparison.index.get_level_values("model"))
+        for name in experimental_models:
+            # Modelos que falharam na inferência não estão na tabela
+            if name not in evaluated:
+                continue
+            row = comparison.loc[(name, first_threshold)]
 
-        evaluate_model(estimator, X_test, y_test)
+            print(f"\n{'='*60}")
+            print(f"📊 Experiment results: {name}")
+            print(f"{'='*60}\n")
 
-def load_experimental_models(pipeline_configs: dict[str, dict]) -> dict[str, automlx._interface]: # type: ignore
+            print(f'=> Roc_auc score em dados de teste: {row["roc_auc"]}\n')
+            print(f'=> Relatório de Classificação (limiar {first_threshold}):\n')
+            print(format_classification_report(row))
+
+            if print_confusion_matrix:
+                cm = np.array([[row["tn"], row["fp"]], [row["fn"], row["tp"]]], dtype="float")
+                cm = cm / cm.sum(axis=1)[:, np.newaxis]
+                disp = ConfusionMatrixDisplay(
+                    confusion_matrix=cm,
+                    display_labels=["Não Atrasou", "Atrasou"]
+                )
+
+                print('=> Matriz de Confusão:')
+                disp.plot(cmap="viridis")
+                plt.show()
+                plt.close()
+
+    return comparison
+
+def load_experimental_models(
+    pipeline_configs: dict[str, dict],
+    lazy: bool = False,
+    n_jobs: int = 4
+) -> dict[str, automlx._interface]: # type: ignore
     """
     Carrega modelos experimentais previamente salvos a partir das
-    configurações de pipeline informadas.
+    configurações de pipeline informadas (artefatos .pkl ou .joblib; ver
+    `helpers.model_artifacts`).
+
+    Quando o modelo tem sidecar de metadados (ver `helpers.model_metadata`)
+    que descreve o artefato, ele é lido antes do artefato: artefatos cujo
+    tamanho não coincide com o registrado (ex.: ponteiros do Git LFS ou arquivos truncados) são
+    ignorados sem serem desserializados.
 
     Parâmetros
     ----------
     pipeline_configs : dict[str, dict]
         - Dicionário contendo os nomes dos pipelines esperados.
+    lazy : bool, opcional
+        - Se True, retorna proxies (`LazyModel`) que carregam cada modelo no
+        primeiro acesso a um atributo (ex.: `predict_proba`). Se False
+        (padrão), carrega todos os modelos imediatamente, em paralelo.
+    n_jobs : int, opcional
+        - Modelos carregados simultaneamente no modo imediato (threads).
 
     Retorna
     -------
     dict[str, automlx._interface]
-        - Dicionário com os modelos experimentais carregados com sucesso.
+        - Dicionário com os modelos experimentais (ou seus proxies) na ordem
+        de `pipeline_configs`. Modelos ausentes ou que falharam na carga são
+        informados e omitidos, sem interromper os demais.
     """
     print("Carregando modelos experimentais...\n")
 
-    experimental_models_dir = os.path.join(
-        os.path.dirname(__file__),
-        "..",
-        "models",
-        "experimental_models"
-    )
-    experimental_models_dir = os.path.abspath(experimental_models_dir)
-
-    loaded_models = {}
+    experimental_models_dir = experimental_models_path()
 
+    # Localiza os artefatos e descarta os ausentes ou divergentes dos metadados
+    model_paths = {}
     for name in pipeline_configs.keys():
-        model_path = os.path.join(experimental_models_dir, f"{name}.pkl")
-        print(f"🔄 Carregando modelo: {name}")
+        model_path = model_artifact_path(os.path.join(experimental_models_dir, name))
 
         if not os.path.exists(model_path):
-            print(f"⚠️  O modelo '{name}' não existe.\n")
+            print(f"⚠️  O modelo '{name}' não existe.")
+            continue
+
+        # Só descarta quando o sidecar descreve este artefato (um sidecar do
+        # outro formato é apenas ignorado)
+        metadata = load_model_metadata(model_metadata_path(model_path))
+        describes_artifact = metadata is not None and metadata.get("artifact") == os.path.basename(model_path)
+        if describes_artifact and not artifact_matches_metadata(metadata, model_path):
+            print(f"❌ O artefato do modelo '{name}' não coincide com seus metadados (arquivo truncado ou ponteiro do Git LFS).")
             continue
 
-        try:
-            with open(model_path, "rb") as f:
-                loaded_models[name] = pickle.load(f)
+        model_paths[name] = model_path
 
-        except Exception as e:
-            print(f"❌ Erro ao carregar o modelo '{name}': {e}\n")
+    if lazy:
+        print(f"\n⏳ {len(model_paths)} modelos serão carregados no primeiro uso.")
+        return {name: LazyModel(path, name=name) for name, path in model_paths.items()}
+
+    def timed_load(path: str):
+        start = time.perf_counter()
+        model = load_model(path)
+        return model, time.perf_counter() - start
+
+    loaded_models = {}
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, n_jobs)) as executor:
+        futures = {executor.submit(timed_load, path): name for name, path in model_paths.items()}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                loaded_models[name], load_s = future.result()
+                print(f"✔ {name}: {load_s:.2f}s")
+            except Exception as e:
+                print(f"❌ Erro ao carregar o modelo '{name}': {e}")
 
-    print("\n🏁 Modelos carregados com sucesso!")
+    print(f"\n🏁 {len(loaded_models)}/{len(pipeline_configs)} modelos carregados em {time.perf_counter() - start:.2f}s")
 
-    return loaded_models
\ No newline at end of file
+    return {name: loaded_models[name] for name in pipeline_configs if name in loaded_models}
\ No newline at end of file
@@ -0,0 +1,181 @@
+import os
+import json
+import uuid
+import pickle
+import hashlib
+import automlx
+import numpy as np
+import pandas as pd
+from datetime import datetime, timezone
+from helpers.manifest import load_manifest, save_manifest
+
+# Diretório padrão do cache de experimentos e nome do seu manifesto
+EXPERIMENT_CACHE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "models", "experiment_cache"))
+EXPERIMENT_MANIFEST_FILENAME = "_manifest.json"
+
+def data_fingerprint(X: pd.DataFrame, y: pd.Series | None = None) -> str:
+    """
+    Impressão digital (SHA-256) de um conjunto de dados: nomes e tipos das
+    colunas, índice e o hash vetorizado de cada linha
+    (`pandas.util.hash_pandas_object`).
+
+    Parâmetros
+    ----------
+    X : pandas.DataFrame
+        - Dados de entrada.
+    y : pandas.Series, opcional
+        - Variável alvo.
+
+    Retorna
+    -------
+    str
+        - Hash hexadecimal, idêntico para dados idênticos.
+    """
+    digest = hashlib.sha256()
+    for data in [X, y]:
+        if data is None:
+            continue
+        frame = data.to_frame() if isinstance(data, pd.Series) else data
+        digest.update(json.dumps([[str(col), str(dtype)] for col, dtype in frame.dtypes.items()]).encode())
+        digest.update(np.ascontiguousarray(pd.util.hash_pandas_object(frame, index=True).to_numpy()).tobytes())
+
+    return digest.hexdigest()
+
+def experiment_key(
+    config: dict,
+    random_state: int,
+    cv: int | str,
+    time_budget: float,
+    fingerprint: str
+) -> str:
+    """
+    Chave de cache de um experimento: hash da configuração do pipeline, dos
+    parâmetros de treino, da impressão digital dos dados e da versão do
+    AutoMLx.
+
+    Parâmetros
+    ----------
+    config : dict
+        - Configuração do pipeline (valor de `pipeline_configs`).
+    random_state : int
+        - Semente do experimento.
+    cv : int | str
+        - Estratégia de validação cruzada.
+    time_budget : float
+        - Tempo máximo de execução.
+    fingerprint : str
+        - Impressão digital dos dados de treino (ver `data_fingerprint`).
+
+    Retorna
+    -------
+    str
+        - Hash hexadecimal do experimento.
+    """
+    payload = {
+        "config": config,
+        "random_state": random_state,
+        "cv": cv,
+        "time_budget": time_budget,
+        "data": fingerprint,
+        "automlx": getattr(automlx, "__version__", None),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+def load_cached_experiment(key: str, cache_dir: str = EXPERIMENT_CACHE_DIR) -> object | None:
+    """
+    Carrega o modelo de um experimento do cache.
+
+    Parâmetros
+    ----------
+    key : str
+        - Chave do experimento (ver `experiment_key`).
+    cache_dir : str, opcional
+        - Diretório do cache.
+
+    Retorna
+    -------
+    automlx._interface | None
+        - Modelo treinado, ou None quando a chave não consta no manifesto,
+        o artefato não existe ou não pode ser lido.
+    """
+    entry = load_manifest(cache_dir, filename=EXPERIMENT_MANIFEST_FILENAME).get(key)
+    if entry is None:
+        return None
+
+    path = os.path.join(cache_dir, entry["artifact"])
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception as e:
+        print(f"⚠️  Artefato em cache ilegível ({entry['artifact']}), o experimento será refeito: {e}")
+        return None
+
+def store_experiment(
+    key: str,
+    name: str,
+    estimator: automlx._interface, # type: ignore
+    config: dict,
+    random_state: int,
+    cv: int | str,
+    time_budget: float,
+    fingerprint: str,
+    wall_s: float | None = None,
+    cache_dir: str = EXPERIMENT_CACHE_DIR
+) -> str:
+    """
+    Grava o modelo de um experimento no cache (<chave>.pkl, de forma
+    atômica) e registra no manifesto os parâmetros que formam a chave.
+
+    Parâmetros
+    ----------
+    key : str
+        - Chave do experimento (ver `experiment_key`).
+    name : str
+        - Nome do experimento.
+    estimator : automlx._interface
+        - Modelo treinado.
+    config, random_state, cv, time_budget, fingerprint
+        - Parâmetros usados em `experiment_key`.
+    wall_s : float, opcional
+        - Tempo de treinamento, em segundos.
+    cache_dir : str, opcional
+        - Diretório do cache.
+
+    Retorna
+    -------
+    str
+        - Caminho do artefato gravado.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    artifact = f"{key}.pkl"
+    path = os.path.join(cache_dir, artifact)
+    tmp_path = os.path.join(cache_dir, f".{uuid.uuid4().hex}.pkl.tmp")
+
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(estimator, f)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    manifest = load_manifest(cache_dir, filename=EXPERIMENT_MANIFEST_FILENAME)
+    manifest[key] = {
+        "name": name,
+        "artifact": artifact,
+        "config": json.loads(json.dumps(config, default=str)),
+        "random_state": random_state,
+        "cv": cv,
+        "time_budget": time_budget,
+        "data_fingerprint": fingerprint,
+        "automlx_version": getattr(automlx, "__version__", None),
+        "wall_s": wall_s,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    save_manifest(cache_dir, manifest, filename=EXPERIMENT_MANIFEST_FILENAME)
+
+    return path
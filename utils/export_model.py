@@ -1,11 +1,24 @@
 import os
-import pickle
 import automlx
 from datetime import datetime
+from helpers.categories import categories_path, save_categories
+from helpers.delay_rates import DELAY_RATES_FILENAME, DelayRateTables, delay_rates_path, save_delay_rates
+from helpers.model_artifacts import save_model
+from helpers.model_metadata import METADATA_FILENAME, build_model_metadata, model_metadata_path, save_model_metadata
 
-def export_model(estimator: automlx._interface.classifier.AutoClassifier, filename: str, timestamp: bool = False) -> str: # type: ignore
+def export_model(
+    estimator: automlx._interface.classifier.AutoClassifier, # type: ignore
+    filename: str,
+    timestamp: bool = False,
+    categories: dict | None = None,
+    delay_rates: DelayRateTables | None = None,
+    artifact_format: str = "pickle",
+    compress: int = 0,
+    training_time: float | None = None
+) -> str:
     '''
-    Exporta um modelo treinado para um arquivo pickle.
+    Exporta um modelo treinado para um arquivo pickle (ou joblib, ver
+    `helpers.model_artifacts`).
 
     Parâmetros
     ----------
@@ -16,15 +29,35 @@ def export_model(estimator: automlx._interface.classifier.AutoClassifier, filena
     timestamp : bool, opcional
         - Se True, adiciona ao nome do arquivo um sufixo com data e hora
         no formato YYYYMMDD_HHMMSS, garantindo unicidade e versionamento.
+    categories : dict, opcional
+        - Dicionários categóricos usados no treino (ver `helpers.categories`),
+        salvos em ./models/<filename>_categorias.json e aplicados pela API
+        aos dados de inferência.
+    delay_rates : DelayRateTables, opcional
+        - Tabelas de taxa de atraso usadas no treino (ver
+        `helpers.delay_rates`), salvas em ./models/<filename>_taxas_atraso.npz
+        e consultadas pela API para gerar as mesmas features na inferência.
+    artifact_format : str, opcional
+        - "pickle" (padrão, .pkl) ou "joblib" (.joblib, com os arrays numpy
+        do modelo carregáveis como memory map por `load_model`).
+    compress : int, opcional
+        - Nível de compressão (0 a 9) do formato "joblib". Artefatos
+        comprimidos ocupam menos disco, mas são lidos inteiros na carga.
+    training_time : float, opcional
+        - Tempo de treinamento, em segundos, registrado nos metadados.
     
     Retorna
     -------
     str
-        - Nome do arquivo salvo (com extensão .pkl).
+        - Nome do arquivo salvo (com extensão .pkl ou .joblib).
 
     Notas
     -----
     - O diretório ./models/ é criado automaticamente caso não exista.
+    - Os metadados do modelo (tipo, features esperadas, vocabulários
+      categóricos, tempo de treinamento, métrica, hash e tamanho do
+      artefato) são salvos em ./models/<filename>_metadata.json, para
+      consulta sem carregar o modelo (ver `helpers.model_metadata`).
     '''
     if '.' in filename:
         raise ValueError("O nome do arquivo não deve conter extensão.")
@@ -42,11 +75,32 @@ def export_model(estimator: automlx._interface.classifier.AutoClassifier, filena
     # Caminho completo para salvar o arquivo
     filepath = os.path.join(models_dir, filename)
 
-    # Salva o modelo em um arquivo pickle
-    with open(f'{filepath}.pkl', 'wb') as file:
-        pickle.dump(estimator, file)
+    # Salva o modelo no formato escolhido
+    artifact_path = save_model(estimator, filepath, artifact_format=artifact_format, compress=compress)
+    artifact_name = f"{filename}{os.path.splitext(artifact_path)[1]}"
 
     print(f"📁 Arquivo salvo com sucesso:")
-    print(f"   → ./models/{filename}.pkl\n")
+    print(f"   → ./models/{artifact_name}\n")
 
-    return f'{filename}.pkl'
\ No newline at end of file
+    # Salva os dicionários categóricos junto ao modelo
+    if categories is not None:
+        save_categories(categories, categories_path(artifact_path))
+        print(f"   → ./models/{filename}_categorias.json\n")
+
+    # Salva as tabelas de taxa de atraso junto ao modelo
+    if delay_rates is not None:
+        save_delay_rates(delay_rates, delay_rates_path(artifact_path))
+        print(f"   → ./models/{filename}_{DELAY_RATES_FILENAME}\n")
+
+    # Salva os metadados do modelo, consultados sem desserializar o artefato
+    metadata = build_model_metadata(
+        estimator,
+        artifact_path,
+        categories=categories,
+        derived_features=delay_rates.feature_names if delay_rates is not None else None,
+        training_time=training_time
+    )
+    save_model_metadata(metadata, model_metadata_path(artifact_path))
+    print(f"   → ./models/{filename}_{METADATA_FILENAME}\n")
+
+    return artifact_name
\ No newline at end of file
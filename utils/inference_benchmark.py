@@ -0,0 +1,129 @@
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+import multiprocessing as mp
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from helpers.memory import rss_mb
+from helpers.model_artifacts import import_model_dependencies, load_model
+
+# Tamanhos de lote medidos por padrão no benchmark de vazão
+BENCHMARK_BATCH_SIZES = [1, 100, 1_000, 10_000]
+
+# Percentis da latência de uma linha
+LATENCY_PERCENTILES = [50, 90, 95, 99]
+
+def _measure_load(path: str) -> dict:
+    """
+    Carrega um artefato no processo atual (um processo novo, ver
+    `benchmark_inference`) e mede tempo e memória da carga.
+
+    As bibliotecas dos modelos são importadas antes da medição (ver
+    `helpers.model_artifacts.import_model_dependencies`).
+    """
+    import_model_dependencies()
+
+    before = rss_mb()
+    start = time.perf_counter()
+    model = load_model(path)
+    load_s = time.perf_counter() - start
+    after = rss_mb()
+    del model
+
+    return {
+        "load_s": load_s,
+        "rss_after_load_mb": after,
+        "rss_load_delta_mb": None if before is None else after - before,
+    }
+
+def benchmark_inference(
+    model,
+    X: pd.DataFrame,
+    artifact_path: str | None = None,
+    n_single: int = 200,
+    batch_sizes: list[int] = BENCHMARK_BATCH_SIZES,
+    repeats: int = 3,
+    warmup: int = 5
+) -> dict:
+    """
+    Mede o custo de servir um modelo: latência de uma linha, vazão em lotes
+    e, quando o artefato é informado, tamanho, tempo de carga e memória
+    residente após a carga.
+
+    Parâmetros
+    ----------
+    model : automlx._interface.classifier.AutoClassifier
+        - Modelo treinado.
+    X : pandas.DataFrame
+        - Amostra de entrada. Lotes maiores que a amostra repetem suas linhas.
+    artifact_path : str, opcional
+        - Artefato do modelo (ver `helpers.model_artifacts`). A carga é medida
+        em um processo novo, sem o modelo já em memória.
+    n_single : int, opcional
+        - Chamadas de `predict_proba` com uma linha, como na API.
+    batch_sizes : list[int], opcional
+        - Tamanhos de lote da medição de vazão.
+    repeats : int, opcional
+        - Repetições de cada lote (vale a mediana).
+    warmup : int, opcional
+        - Chamadas descartadas antes das medições.
+
+    Retorna
+    -------
+    dict
+        - "single_row_ms" (média e percentis da latência de uma linha, em
+        ms), "batches" (DataFrame com "batch_size", "batch_ms" e
+        "rows_per_s"), "artifact_size_mb", "load_s", "rss_after_load_mb" e
+        "rss_load_delta_mb" (None sem artefato) e "environment".
+    """
+    for i in range(warmup):
+        model.predict_proba(X.iloc[[i % len(X)]])
+
+    # Latência de uma linha (linhas separadas antes da medição)
+    rows = [X.iloc[[i % len(X)]] for i in range(n_single)]
+    latencies = np.empty(n_single)
+    for i, row in enumerate(rows):
+        start = time.perf_counter()
+        model.predict_proba(row)
+        latencies[i] = (time.perf_counter() - start) * 1000
+
+    single_row_ms = {"mean": float(latencies.mean())}
+    single_row_ms.update({f"p{q}": float(np.percentile(latencies, q)) for q in LATENCY_PERCENTILES})
+
+    # Vazão em lotes
+    batches = []
+    for batch_size in batch_sizes:
+        batch = X.iloc[np.arange(batch_size) % len(X)]
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            model.predict_proba(batch)
+            times.append(time.perf_counter() - start)
+        batch_s = float(np.median(times))
+        batches.append({"batch_size": batch_size, "batch_ms": batch_s * 1000, "rows_per_s": batch_size / batch_s})
+
+    result = {
+        "single_row_ms": single_row_ms,
+        "batches": pd.DataFrame(batches),
+        "artifact_size_mb": None,
+        "load_s": None,
+        "rss_after_load_mb": None,
+        "rss_load_delta_mb": None,
+        "environment": {
+            "cpus": os.cpu_count(),
+            "python": sys.version.split()[0],
+            "measured_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        },
+    }
+
+    if artifact_path is not None:
+        result["artifact_size_mb"] = os.path.getsize(artifact_path) / (1024 ** 2)
+        try:
+            with ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context("spawn")) as executor:
+                result.update(executor.submit(_measure_load, artifact_path).result())
+        except Exception as e:
+            print(f"⚠️  Não foi possível medir a carga de {os.path.basename(artifact_path)}: {e}")
+
+    return result
@@ -0,0 +1,283 @@
+import os
+import time
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator
+
+from helpers.partitions import list_partitions
+from helpers.categories import categories_path, load_categories
+from helpers.parsers import parse_categoricals, parse_datetime, parse_int
+from utils.evaluation_engine import metrics_from_counts
+
+@dataclass
+class ScoreHistogram:
+    """
+    Acumulador de métricas de classificação em memória constante: histogramas
+    das probabilidades de positivos e negativos em `n_bins` intervalos iguais
+    de [0, 1] e matrizes de confusão exatas dos limiares pedidos.
+
+    Acumuladores de partições diferentes são combinados com `merge`, de modo
+    que a avaliação pode ser dividida entre processos ou máquinas.
+
+    Atributos
+    ---------
+    n_bins : int
+        - Quantidade de intervalos do histograma. O erro do ROC AUC
+        aproximado cai com intervalos mais finos (ver `roc_auc_error_bound`).
+    thresholds : numpy.ndarray
+        - Limiares com matriz de confusão exata (positivo quando
+        `proba > limiar`, como em `utils.evaluation_engine.threshold_metrics`).
+    positives, negatives : numpy.ndarray
+        - Contagens de positivos e negativos por intervalo.
+    confusion : numpy.ndarray
+        - Contagens [tn, fp, fn, tp] de cada limiar.
+    rows : int
+        - Linhas acumuladas.
+    """
+    n_bins: int = 10_000
+    thresholds: np.ndarray = field(default_factory=lambda: np.array([0.5]))
+    positives: np.ndarray = None
+    negatives: np.ndarray = None
+    confusion: np.ndarray = None
+    rows: int = 0
+
+    def __post_init__(self):
+        self.thresholds = np.atleast_1d(np.asarray(self.thresholds, dtype="float64"))
+        if self.positives is None:
+            self.positives = np.zeros(self.n_bins, dtype="int64")
+            self.negatives = np.zeros(self.n_bins, dtype="int64")
+            self.confusion = np.zeros((len(self.thresholds), 4), dtype="int64")
+
+    def update(self, y_true, proba: np.ndarray) -> None:
+        """
+        Acumula um lote de classes reais e probabilidades da classe positiva.
+        """
+        y_true = np.asarray(y_true).astype(bool)
+        proba = np.asarray(proba, dtype="float64")
+
+        bins = np.clip((proba * self.n_bins).astype("int64"), 0, self.n_bins - 1)
+        self.positives += np.bincount(bins[y_true], minlength=self.n_bins)
+        self.negatives += np.bincount(bins[~y_true], minlength=self.n_bins)
+
+        predicted = proba[:, np.newaxis] > self.thresholds
+        actual = y_true[:, np.newaxis]
+        self.confusion[:, 0] += (~predicted & ~actual).sum(axis=0)
+        self.confusion[:, 1] += (predicted & ~actual).sum(axis=0)
+        self.confusion[:, 2] += (~predicted & actual).sum(axis=0)
+        self.confusion[:, 3] += (predicted & actual).sum(axis=0)
+        self.rows += len(y_true)
+
+    def merge(self, other: "ScoreHistogram") -> "ScoreHistogram":
+        """
+        Soma os acumuladores de outra partição (mesmos `n_bins` e limiares).
+        """
+        if self.n_bins != other.n_bins or not np.array_equal(self.thresholds, other.thresholds):
+            raise ValueError("Só é possível combinar histogramas com os mesmos intervalos e limiares.")
+
+        self.positives += other.positives
+        self.negatives += other.negatives
+        self.confusion += other.confusion
+        self.rows += other.rows
+        return self
+
+    def roc_auc(self) -> float:
+        """
+        ROC AUC aproximado: pares positivo/negativo em intervalos diferentes
+        são ordenados corretamente, e pares no mesmo intervalo contam como
+        empates (meio acerto).
+        """
+        n_pos, n_neg = self.positives.sum(), self.negatives.sum()
+        if n_pos == 0 or n_neg == 0:
+            return float("nan")
+
+        negatives_below = np.cumsum(self.negatives) - self.negatives
+        correct = (self.positives * (negatives_below + 0.5 * self.negatives)).sum()
+        return float(correct / (n_pos * n_neg))
+
+    def roc_auc_error_bound(self) -> float:
+        """
+        Limite superior do erro absoluto de `roc_auc` em relação ao ROC AUC
+        exato (`sklearn.metrics.roc_auc_score`): apenas pares positivo/negativo
+        do mesmo intervalo podem estar ordenados de outra forma, e cada um
+        desloca o AUC em no máximo meio par.
+        """
+        n_pos, n_neg = self.positives.sum(), self.negatives.sum()
+        if n_pos == 0 or n_neg == 0:
+            return float("nan")
+        return float(0.5 * (self.positives * self.negatives).sum() / (n_pos * n_neg))
+
+    def curves(self) -> pd.DataFrame:
+        """
+        Curvas ROC e precisão-recall nos limites dos intervalos, onde as
+        contagens são exatas.
+
+        Retorna
+        -------
+        pandas.DataFrame
+            - Uma linha por limiar (limite inferior de cada intervalo, em
+            ordem decrescente), com "tp", "fp", "fpr", "tpr" (= "recall") e
+            "precision".
+        """
+        tp = np.cumsum(self.positives[::-1])
+        fp = np.cumsum(self.negatives[::-1])
+        n_pos, n_neg = max(tp[-1], 1), max(fp[-1], 1)
+
+        return pd.DataFrame({
+            "threshold": np.arange(self.n_bins)[::-1] / self.n_bins,
+            "tp": tp,
+            "fp": fp,
+            "fpr": fp / n_neg,
+            "tpr": tp / n_pos,
+            "recall": tp / n_pos,
+            "precision": np.divide(tp, tp + fp, out=np.ones(self.n_bins), where=(tp + fp) > 0),
+        })
+
+    def average_precision(self) -> float:
+        """
+        Precisão média aproximada (soma da precisão ponderada pelo ganho de
+        recall em cada limite de intervalo).
+        """
+        curves = self.curves()
+        recall_gain = np.diff(np.concatenate([[0.0], curves["recall"].to_numpy()]))
+        return float((recall_gain * curves["precision"].to_numpy()).sum())
+
+    def metrics(self) -> pd.DataFrame:
+        """
+        Métricas exatas dos limiares acumulados (ver
+        `utils.evaluation_engine.metrics_from_counts`).
+        """
+        return metrics_from_counts(self.thresholds, *self.confusion.T)
+
+def iter_test_batches(
+    path: str,
+    columns: list | None = None,
+    target: str = "Atrasado",
+    batch_size: int = 500_000
+) -> Iterator[tuple[pd.DataFrame, pd.Series]]:
+    """
+    Lê um arquivo Parquet de teste em lotes, com os mesmos tipos de
+    `carregar_dados` (categóricas com os dicionários salvos junto ao dataset,
+    quando existirem).
+
+    Parâmetros
+    ----------
+    path : str
+        - Arquivo Parquet (ou partição de um dataset particionado).
+    columns : list, opcional
+        - Features entregues ao modelo. Se None, todas as colunas exceto
+        `target`.
+    target : str, opcional
+        - Coluna da variável alvo.
+    batch_size : int, opcional
+        - Linhas por lote.
+
+    Retorna
+    -------
+    Iterator[tuple[pandas.DataFrame, pandas.Series]]
+        - Features e variável alvo de cada lote.
+    """
+    parquet = pq.ParquetFile(path)
+    if columns is None:
+        columns = [name for name in parquet.schema_arrow.names if name != target]
+
+    # Dicionários do dataset: do próprio arquivo ou do diretório particionado
+    categories = load_categories(categories_path(path))
+    if categories is None and os.path.basename(os.path.dirname(path)).startswith("mes="):
+        dataset_dir = os.path.dirname(os.path.dirname(os.path.dirname(path)))
+        categories = load_categories(categories_path(dataset_dir))
+
+    for batch in parquet.iter_batches(batch_size=batch_size, columns=list(columns) + [target]):
+        df = batch.to_pandas()
+        df = parse_categoricals(df, categories)
+        df = parse_datetime(df)
+        if "Distância (m)" in df:
+            df = parse_int(df, col="Distância (m)", int_type="int32")
+        yield df[list(columns)], df[target]
+
+def stream_evaluate(
+    estimator,
+    source: str | list,
+    columns: list | None = None,
+    target: str = "Atrasado",
+    thresholds=0.5,
+    n_bins: int = 10_000,
+    batch_size: int = 500_000,
+    n_jobs: int = 1,
+    prepare: Callable[[pd.DataFrame], pd.DataFrame] | None = None
+) -> dict:
+    """
+    Avalia um modelo em um conjunto de teste em Parquet sem carregá-lo
+    inteiro: os dados passam pelo modelo em lotes, e apenas um
+    `ScoreHistogram` é mantido por partição, de modo que o uso de memória
+    depende do tamanho do lote, e não do conjunto de teste.
+
+    Parâmetros
+    ----------
+    estimator : automlx._interface.classifier.AutoClassifier
+        - Modelo treinado.
+    source : str | list
+        - Arquivo Parquet, diretório de um dataset particionado (ver
+        `etl.partitioned_dataset`) ou lista de arquivos.
+    columns : list, opcional
+        - Features entregues ao modelo (as mesmas de `X_test`). Se None,
+        todas as colunas exceto `target`.
+    target : str, opcional
+        - Coluna da variável alvo.
+    thresholds : float | array-like, opcional
+        - Limiares com matriz de confusão exata.
+    n_bins : int, opcional
+        - Intervalos do histograma de probabilidades.
+    batch_size : int, opcional
+        - Linhas por lote.
+    n_jobs : int, opcional
+        - Partições avaliadas simultaneamente (threads; a inferência do
+        LightGBM, XGBoost e scikit-learn libera o GIL).
+    prepare : Callable, opcional
+        - Transformação aplicada às features de cada lote antes da inferência
+        (ex.: `add_calendar_features`).
+
+    Retorna
+    -------
+    dict
+        - "roc_auc" e "roc_auc_error_bound" (erro absoluto máximo em relação
+        ao AUC exato), "average_precision", "metrics" (métricas exatas de cada
+        limiar), "curves" (curvas ROC e precisão-recall), "rows", "wall_s" e
+        "histogram" (o `ScoreHistogram` combinado).
+
+    Observações
+    -----------
+    - Para combinar resultados calculados em outros processos ou máquinas,
+      some os histogramas com `ScoreHistogram.merge`.
+    """
+    if isinstance(source, str):
+        files = list_partitions(source) if os.path.isdir(source) else [source]
+    else:
+        files = list(source)
+
+    def evaluate_file(path: str) -> ScoreHistogram:
+        histogram = ScoreHistogram(n_bins=n_bins, thresholds=thresholds)
+        for X, y in iter_test_batches(path, columns=columns, target=target, batch_size=batch_size):
+            if prepare is not None:
+                X = prepare(X)
+            histogram.update(y.to_numpy(), np.asarray(estimator.predict_proba(X))[:, 1])
+        return histogram
+
+    start = time.perf_counter()
+    histogram = ScoreHistogram(n_bins=n_bins, thresholds=thresholds)
+    with ThreadPoolExecutor(max_workers=max(1, n_jobs)) as executor:
+        for partial in executor.map(evaluate_file, files):
+            histogram.merge(partial)
+
+    return {
+        "roc_auc": histogram.roc_auc(),
+        "roc_auc_error_bound": histogram.roc_auc_error_bound(),
+        "average_precision": histogram.average_precision(),
+        "metrics": histogram.metrics(),
+        "curves": histogram.curves(),
+        "rows": histogram.rows,
+        "wall_s": time.perf_counter() - start,
+        "histogram": histogram,
+    }
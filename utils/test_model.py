@@ -1,6 +1,6 @@
 import os
-import pickle
 import pandas as pd
+from helpers.model_artifacts import load_model
 
 def test_model(model_filename: str, X_test: pd.DataFrame) -> None:
     """
@@ -21,8 +21,7 @@ def test_model(model_filename: str, X_test: pd.DataFrame) -> None:
     models_dir = os.path.join(os.path.dirname(__file__), "..", "models")
     models_dir = os.path.abspath(models_dir)
 
-    model_path = os.path.join(models_dir, model_filename.replace('.pkl', ''))
-    model = pickle.load(open(f'{model_path}.pkl', 'rb'))
+    model = load_model(os.path.join(models_dir, model_filename))
 
     print(f"\n{'='*60}")
     print(f"📊 Testing model: {model_filename}")